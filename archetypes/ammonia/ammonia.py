@@ -1,8 +1,127 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-from archetypes.ammonia.ammonia_metrics import get_ammonia_metrics
+from archetypes.ammonia.ammonia_metrics import (
+    get_ammonia_plant,
+    get_ammonia_plant_batch,
+    get_layout,
+    get_trl,
+    get_trl_batch,
+)
+from src.instrumentation import instrument
 
-def ammonia():
-    pass
\ No newline at end of file
+
+@instrument()
+def ammonia(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    choices: dict[int, dict],
+    job_data: dict,
+    wind_data,
+):
+    """Calculates the relevant design outputs for the ammonia archetype
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY ammonia specific user input
+        choices (dict[int, dict]): Chosen project design
+        job_data (dict): Contains all archetype and vendor data
+        wind_data (ResourceData): wind resource data of the wind farm feeding the electrolyzer
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production (ammonia energy in MWh per
+            year, LHV), ammonia (t per year) and the hydrogen buffer sizing
+    """
+    plant = get_ammonia_plant(
+        wacc_real=wacc_real,
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        choices=choices,
+        wind_data=wind_data,
+    )
+
+    # Output calculation
+    layout = float(get_layout(archetype_user_input, plant["storage_size"]))
+    trl = get_trl(choices)["trl"]
+    capex = plant["capex"]
+    opex = plant["opex"]
+    stack_replacement_cost = 0
+    stack_replacement_time = 0
+    degradation_rate = 0
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": plant["production"],
+        "ammonia": plant["ammonia"],
+        "storage_size": plant["storage_size"],
+        "storage_hours": plant["storage_hours"],
+        "availability": plant["availability"],
+    }
+
+
+@instrument()
+def ammonia_batch(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    design_properties,
+    job_data: dict,
+    wind_data,
+):
+    """Calculates the ammonia design outputs for a batch of designs in one vectorised pass
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY ammonia specific user input
+        design_properties (DesignProperties): Chosen option properties per design
+        job_data (dict): Contains all archetype and vendor data
+        wind_data (ResourceData): wind resource data of the wind farm feeding the electrolyzer
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production (MWh per year), ammonia (t
+            per year) and the hydrogen buffer sizing - one array entry per design
+    """
+    plant = get_ammonia_plant_batch(
+        wacc_real=wacc_real,
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+        wind_data=wind_data,
+    )
+
+    # Output calculation
+    number_of_designs = len(design_properties)
+
+    layout = get_layout(archetype_user_input, plant["storage_size"])
+    trl = get_trl_batch(design_properties)["trl"]
+    capex = plant["capex"]
+    opex = plant["opex"]
+    stack_replacement_cost = np.zeros(number_of_designs)
+    stack_replacement_time = np.zeros(number_of_designs)
+    degradation_rate = np.zeros(number_of_designs)
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": plant["production"],
+        "ammonia": plant["ammonia"],
+        "storage_size": plant["storage_size"],
+        "storage_hours": plant["storage_hours"],
+        "availability": plant["availability"],
+    }
@@ -1,6 +1,231 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-def get_ammonia_metrics():
-    pass
\ No newline at end of file
+from archetypes.ammonia.hydrogen_buffer import (
+    HOURS_PER_YEAR,
+    HYDROGEN_PER_AMMONIA,
+    STORAGE_HOURS,
+    get_hydrogen_buffer,
+)
+from archetypes.green_hydrogen.green_hydrogen_metrics import (
+    DEFAULT_EFFICIENCY,
+    DEFAULT_MIN_LOAD,
+    ELECTROLYZER_BLOCK_UUID,
+)
+from economics_package.discounting import get_annuity_factor
+from src.instrumentation import instrument
+from src.utilities import fill_missing, get_option_data, to_float
+
+# Block uuids of the hydrogen storage and the synthesis loop; the electrolyzer block is shared with green hydrogen
+STORAGE_BLOCK_UUID = "9a4e2c71-5b3d-4f08-a6e1-2d7c8b9f0e34"
+SYNTHESIS_BLOCK_UUID = "e6b13f58-0c92-4d7a-b845-71a3f2c6d9e0"
+
+# Option property values used where an option does not provide them
+DEFAULT_STORAGE_COST = 0.5  # per t of hydrogen storage capacity (pressure vessels)
+DEFAULT_CUSHION_GAS = 10.0  # % of the storage capacity that cannot be withdrawn
+DEFAULT_ENERGY_USE = 400.0  # kWh/t NH3, synthesis loop and air separation
+DEFAULT_COST_FACTOR = 1.0
+
+# Option properties read by the ammonia model
+ELECTROLYZER_PROPERTIES = ("efficiency", "minload")
+STORAGE_PROPERTIES = ("costpertonne", "cushiongas")
+SYNTHESIS_PROPERTIES = ("energyuse", "costfactor")
+BLOCK_PROPERTIES = (
+    (ELECTROLYZER_BLOCK_UUID, ELECTROLYZER_PROPERTIES),
+    (STORAGE_BLOCK_UUID, STORAGE_PROPERTIES),
+    (SYNTHESIS_BLOCK_UUID, SYNTHESIS_PROPERTIES),
+)
+
+# DUMMY cost figures (capex figures are in millions)
+SYNTHESIS_COST = 1.2  # per t/day of ammonia capacity
+FIXED_OPEX_SHARE = 0.03  # of the capex per year
+POWER_COST = 5e-5  # per MWh of electricity
+AMMONIA_PRICE = 5e-4  # per t of ammonia, value of lost production in the storage sizing
+SYNTHESIS_AREA = 30  # m^sq per t/day of ammonia capacity
+STORAGE_AREA = 20  # m^sq per t of hydrogen storage capacity
+
+AMMONIA_LHV = 5.17  # MWh/t, lower heating value of ammonia
+
+
+def get_hydrogen_demand(archetype_user_input: dict) -> float:
+    """Hydrogen demand of the synthesis loop at its capacity in kg/h"""
+    return archetype_user_input["capacity"] * 1000 / 24 * HYDROGEN_PER_AMMONIA
+
+
+@instrument()
+def get_ammonia_plant(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    job_data: dict,
+    choices: dict[int, dict],
+    wind_data,
+):
+    """Sizes the hydrogen buffer of the chosen electrolyzer, storage and synthesis loop: the storage size candidate
+    with the lowest storage capex plus lifetime value of the ammonia lost to hydrogen shortfalls (see
+    hydrogen_buffer.simulate_storage)
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY ammonia specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        wind_data (ResourceData): wind resource data of the wind farm feeding the electrolyzer
+
+    Returns:
+        _dict_: yearly production (MWh of ammonia, LHV) and ammonia (t), hydrogen availability, shortfall and spill (t), storage size (t
+            of hydrogen and hours of demand), capex and opex of the selected configuration
+    """
+    options = get_options_batch(
+        *(
+            {name: np.array([to_float(get_option_data(choices, block_uuid).get(name))]) for name in properties}
+            for block_uuid, properties in BLOCK_PROPERTIES
+        )
+    )
+    plant = _get_ammonia_plant(wacc_real, general_user_inputs, archetype_user_input, job_data, wind_data, options)
+    return {key: value[0] for key, value in plant.items()}
+
+
+def _get_ammonia_plant(wacc_real, general_user_inputs, archetype_user_input, job_data, wind_data, options) -> dict:
+    """Selected storage size, production and cost per option combination (arrays over the combinations)"""
+    demand = get_hydrogen_demand(archetype_user_input)
+    lifetime = general_user_inputs["project_lifetime"]
+    hydrogen_buffer = get_hydrogen_buffer(
+        wind_data,
+        job_data.country,
+        archetype_user_input["power_capacity"],
+        archetype_user_input["electrolyzer_capacity"],
+        demand,
+        lifetime,
+    )
+    # combinations x storage size candidates, in t of hydrogen per year
+    balance = hydrogen_buffer.get_balance(np.stack((options["efficiency"], options["min_load"]), axis=1))
+    balance = {name: value / 1000 for name, value in balance.items()}
+
+    # gross storage capacity in t, including the cushion gas
+    storage_size = hydrogen_buffer.capacity[None, :] / 1000 / (1 - options["cushion_gas"][:, None])
+    storage_capex = storage_size * options["storage_cost"][:, None]
+    lost_value = balance["shortfall"] / HYDROGEN_PER_AMMONIA * AMMONIA_PRICE * get_annuity_factor(wacc_real, lifetime)
+    selected = np.argmin(storage_capex + lost_value, axis=1)
+    rows = np.arange(len(selected))
+
+    ammonia = balance["delivered"][rows, selected] / HYDROGEN_PER_AMMONIA
+    synthesis_capex = SYNTHESIS_COST * archetype_user_input["capacity"] * options["cost_factor"]
+    capex = synthesis_capex + storage_capex[rows, selected]
+    opex = FIXED_OPEX_SHARE * capex + ammonia * options["energy_use"] / 1000 * POWER_COST
+
+    return {
+        "production": ammonia * AMMONIA_LHV,
+        "ammonia": ammonia,
+        "availability": balance["delivered"][rows, selected] / (demand * HOURS_PER_YEAR / 1000),
+        "hydrogen_supply": balance["supply"][rows, selected],
+        "hydrogen_shortfall": balance["shortfall"][rows, selected],
+        "hydrogen_spill": balance["spill"][rows, selected],
+        "storage_size": storage_size[rows, selected],
+        "storage_hours": STORAGE_HOURS[selected],
+        "capex": capex,
+        "opex": opex,
+    }
+
+
+def get_layout(archetype_user_input: dict, storage_size):
+    """Calculates the footprint of the synthesis loop and the hydrogen storage
+
+    Args:
+        archetype_user_input (dict): DUMMY ammonia specific user input
+        storage_size (array_like): gross hydrogen storage capacity in t
+
+    Returns:
+        _float_: area of the plant in m^sq
+    """
+    return archetype_user_input["capacity"] * SYNTHESIS_AREA + np.asarray(storage_size, dtype=float) * STORAGE_AREA
+
+
+@instrument()
+def get_trl(choices: dict[int, dict]):
+    """Gets the TRL of the ammonia plant: the least mature of the chosen electrolyzer, storage and synthesis loop
+    (0 if unknown)
+
+    Args:
+        choices (dict[int, dict]): Chosen project design
+
+    Returns:
+        _dict_: technology readiness level
+    """
+    trl = [
+        to_float(get_option_data(choices, block_uuid).get("trlmaturity")) for block_uuid, _ in BLOCK_PROPERTIES
+    ]
+    trl = [value for value in trl if not np.isnan(value)]
+    return {"trl": min(trl) if trl else 0}
+
+
+# BATCH versions: the same calculations over a batch of designs, one array entry per design
+def get_options_batch(electrolyzer_columns, storage_columns, synthesis_columns) -> dict:
+    """Electrolyzer, storage and synthesis loop properties from property columns, with defaults where missing
+    (fractions for the percentages)"""
+    return {
+        "efficiency": fill_missing(electrolyzer_columns["efficiency"], DEFAULT_EFFICIENCY) / 100,
+        "min_load": fill_missing(electrolyzer_columns["minload"], DEFAULT_MIN_LOAD) / 100,
+        "storage_cost": fill_missing(storage_columns["costpertonne"], DEFAULT_STORAGE_COST),
+        "cushion_gas": fill_missing(storage_columns["cushiongas"], DEFAULT_CUSHION_GAS) / 100,
+        "energy_use": fill_missing(synthesis_columns["energyuse"], DEFAULT_ENERGY_USE),
+        "cost_factor": fill_missing(synthesis_columns["costfactor"], DEFAULT_COST_FACTOR),
+    }
+
+
+@instrument()
+def get_ammonia_plant_batch(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    job_data: dict,
+    design_properties,
+    wind_data,
+) -> dict:
+    """Sizes the ammonia plant for a batch of designs. Every distinct option combination is sized once and the
+    storage of all distinct electrolyzers is simulated together (see get_ammonia_plant)
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY ammonia specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+        wind_data (ResourceData): wind resource data of the wind farm feeding the electrolyzer
+
+    Returns:
+        _dict_: production (MWh), ammonia (t), hydrogen balance, storage size and cost of the selected configuration per design
+    """
+    options = get_options_batch(
+        *(
+            {name: design_properties.get(block_uuid, name) for name in properties}
+            for block_uuid, properties in BLOCK_PROPERTIES
+        )
+    )
+    names = list(options)
+    unique, inverse = np.unique(np.stack([options[name] for name in names], axis=1), axis=0, return_inverse=True)
+    plant = _get_ammonia_plant(
+        wacc_real,
+        general_user_inputs,
+        archetype_user_input,
+        job_data,
+        wind_data,
+        {name: unique[:, column] for column, name in enumerate(names)},
+    )
+    return {key: value[inverse.reshape(-1)] for key, value in plant.items()}
+
+
+def get_trl_batch(design_properties) -> dict:
+    """Gets the TRL for a batch of designs (see get_trl)
+
+    Args:
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _dict_: technology readiness level per design
+    """
+    trl = design_properties.get(ELECTROLYZER_BLOCK_UUID, "trlmaturity")
+    for block_uuid in (STORAGE_BLOCK_UUID, SYNTHESIS_BLOCK_UUID):
+        trl = np.fmin(trl, design_properties.get(block_uuid, "trlmaturity"))
+    return {"trl": np.nan_to_num(trl, nan=0.0)}
@@ -0,0 +1,178 @@
+# Install packages
+import numpy as np
+
+from archetypes.green_hydrogen.electrolyzer import get_power_profile, hydrogen_output
+
+HOURS_PER_YEAR = 8760
+HYDROGEN_PER_AMMONIA = 3 * 2.016 / (2 * 17.031)  # kg H2 per kg NH3 (N2 + 3 H2 -> 2 NH3)
+CHUNK_HOURS = 1024  # hours simulated per step of the storage simulation
+
+# Usable storage size candidates in hours of hydrogen demand of the synthesis loop
+STORAGE_HOURS = np.array([0.0, 6.0, 12.0, 24.0, 48.0, 72.0, 120.0, 168.0, 240.0, 336.0, 504.0, 720.0])
+
+
+def scan_storage(net_flow: np.ndarray, capacity: np.ndarray, level: np.ndarray) -> np.ndarray:
+    """Storage level after every hour of a chunk, for all storage states at once
+
+    Every hour maps the level s to clip(s + net flow, 0, capacity). Such clipped shifts compose into clipped
+    shifts again (g(f(s)) = clip(s + a_f + a_g, clip(lo_f + a_g, lo_g, hi_g), clip(hi_f + a_g, lo_g, hi_g))),
+    so the levels follow from a prefix scan in log2(hours) vectorised steps instead of a loop over the hours.
+
+    Args:
+        net_flow (np.ndarray): supply minus demand per state and hour (states x hours)
+        capacity (np.ndarray): usable capacity per state
+        level (np.ndarray): level per state before the first hour
+
+    Returns:
+        np.ndarray: level per state after each hour (states x hours)
+    """
+    shift = net_flow.copy()
+    low = np.zeros_like(shift)
+    high = np.broadcast_to(capacity[:, None], shift.shape).copy()
+    offset = 1
+    while offset < shift.shape[1]:
+        # compose each map with the one covering the preceding offset hours
+        later_shift, later_low, later_high = shift[:, offset:], low[:, offset:], high[:, offset:]
+        earlier_shift, earlier_low, earlier_high = shift[:, :-offset], low[:, :-offset], high[:, :-offset]
+        low_ = np.clip(earlier_low + later_shift, later_low, later_high)
+        high_ = np.clip(earlier_high + later_shift, later_low, later_high)
+        shift[:, offset:] = earlier_shift + later_shift
+        low[:, offset:], high[:, offset:] = low_, high_
+        offset *= 2
+    return np.clip(level[:, None] + shift, low, high)
+
+
+def simulate_storage(
+    supply: np.ndarray, demand: float, capacity: np.ndarray, hours: int, chunk_hours: int = CHUNK_HOURS
+) -> dict:
+    """Simulates a hydrogen buffer between a variable supply and a constant demand over a horizon, for every
+    supply profile x storage size at once
+
+    The horizon is streamed in chunks of chunk_hours: the state carried between chunks is the level and the
+    running totals of each storage state, so memory does not grow with the horizon. The supply profile is
+    repeated over the horizon. Once the level at the start of a repetition equals the level at the start of the
+    previous one, all further repetitions are identical and are added without simulating them.
+
+    Args:
+        supply (np.ndarray): hourly supply in kg per profile (profiles x hours); the storage starts empty
+        demand (float): constant demand in kg/h
+        capacity (np.ndarray): usable storage capacity candidates in kg
+        hours (int): hours of the horizon
+        chunk_hours (int): hours per simulation step
+
+    Returns:
+        _dict_: hydrogen shortfall (demand not met) and spill (supply not stored) over the horizon in kg, and the
+            level at the end of the horizon, each profiles x capacities
+    """
+    supply = np.atleast_2d(np.asarray(supply, dtype=float))
+    capacity = np.asarray(capacity, dtype=float)
+    profiles, cycle_hours = supply.shape
+    shape = (profiles, len(capacity))
+    states_capacity = np.broadcast_to(capacity, shape).reshape(-1)
+    level = np.zeros(profiles * len(capacity))
+    shortfall, spill = np.zeros_like(level), np.zeros_like(level)
+
+    def run(level, start, end):
+        """Simulates the hours start-end of the profile, returns the level and totals of that stretch"""
+        stretch_shortfall, stretch_spill = np.zeros_like(level), np.zeros_like(level)
+        for chunk_start in range(start, end, chunk_hours):
+            chunk_end = min(chunk_start + chunk_hours, end)
+            net_flow = np.repeat(supply[:, chunk_start:chunk_end] - demand, len(capacity), axis=0)
+            levels = scan_storage(net_flow, states_capacity, level)
+            unclipped = np.concatenate((level[:, None], levels[:, :-1]), axis=1) + net_flow
+            stretch_shortfall += np.maximum(-unclipped, 0.0).sum(axis=1)
+            stretch_spill += np.maximum(unclipped - states_capacity[:, None], 0.0).sum(axis=1)
+            level = levels[:, -1]
+        return level, stretch_shortfall, stretch_spill
+
+    cycles, remainder = divmod(hours, cycle_hours)
+    previous_start = None
+    cycle = 0
+    while cycle < cycles:
+        start_level = level
+        level, cycle_shortfall, cycle_spill = run(level, 0, cycle_hours)
+        shortfall += cycle_shortfall
+        spill += cycle_spill
+        cycle += 1
+        if previous_start is not None and np.array_equal(start_level, previous_start):
+            # periodic: the remaining repetitions start at the same level as this one
+            shortfall += (cycles - cycle) * cycle_shortfall
+            spill += (cycles - cycle) * cycle_spill
+            level = start_level
+            break
+        previous_start = start_level
+    if remainder:
+        level, stretch_shortfall, stretch_spill = run(level, 0, remainder)
+        shortfall += stretch_shortfall
+        spill += stretch_spill
+
+    return {"shortfall": shortfall.reshape(shape), "spill": spill.reshape(shape), "level": level.reshape(shape)}
+
+
+class HydrogenBuffer:
+    """Hydrogen buffer between an electrolyzer on a wind farm and an ammonia synthesis loop with constant demand.
+
+    Storage results are kept per electrolyzer (rated efficiency, minimum load), all storage size candidates of
+    one electrolyzer come from one simulation and missing electrolyzers are simulated together.
+    """
+
+    def __init__(self, power: np.ndarray, electrolyzer_capacity: float, demand: float, lifetime: int):
+        """
+        Args:
+            power (np.ndarray): hourly power available to the electrolyzer in MW, years x hours
+            electrolyzer_capacity (float): electrolyzer capacity in MW
+            demand (float): hydrogen demand of the synthesis loop in kg/h
+            lifetime (int): project lifetime in years, the horizon of the simulation
+        """
+        self.power = np.atleast_2d(np.asarray(power, dtype=float))
+        self.electrolyzer_capacity = electrolyzer_capacity
+        self.demand = demand
+        self.hours = int(lifetime * HOURS_PER_YEAR)
+        self.capacity = STORAGE_HOURS * demand
+        # (rated efficiency, minimum load) -> results over the storage size candidates
+        self._results = {}
+
+    def get_balance(self, electrolyzers: np.ndarray) -> dict:
+        """Yearly hydrogen balance per electrolyzer and storage size candidate, simulating the missing
+        electrolyzers at once
+
+        Args:
+            electrolyzers (np.ndarray): (rated efficiency, minimum load) per electrolyzer, electrolyzers x 2
+
+        Returns:
+            _dict_: supply, delivered, shortfall and spill of hydrogen in kg per year, electrolyzers x candidates
+        """
+        keys = [tuple(electrolyzer) for electrolyzer in np.asarray(electrolyzers, dtype=float).tolist()]
+        missing = [key for key in dict.fromkeys(keys) if key not in self._results]
+        if missing:
+            efficiencies, min_loads = np.asarray(missing).T
+            supply = hydrogen_output(
+                self.power[None, :, :],
+                self.electrolyzer_capacity,
+                efficiencies[:, None, None],
+                min_loads[:, None, None],
+            ).reshape(len(missing), -1)
+            storage = simulate_storage(supply, self.demand, self.capacity, self.hours)
+            years = self.hours / HOURS_PER_YEAR
+            annual_supply = supply.mean(axis=1) * HOURS_PER_YEAR
+            for index, key in enumerate(missing):
+                shortfall = storage["shortfall"][index] / years
+                self._results[key] = {
+                    "supply": np.full(len(self.capacity), annual_supply[index]),
+                    "delivered": self.demand * HOURS_PER_YEAR - shortfall,
+                    "shortfall": shortfall,
+                    "spill": storage["spill"][index] / years,
+                }
+        return {name: np.stack([self._results[key][name] for key in keys]) for name in self._results[keys[0]]}
+
+
+def get_hydrogen_buffer(
+    wind_data, country: str, power_capacity: float, electrolyzer_capacity: float, demand: float, lifetime: int
+) -> HydrogenBuffer:
+    """Gets the HydrogenBuffer of a site and plant configuration, built once per loaded wind resource"""
+    return wind_data.get_derived(
+        ("hydrogen_buffer", country, power_capacity, electrolyzer_capacity, demand, lifetime),
+        lambda data: HydrogenBuffer(
+            get_power_profile(data, country, power_capacity).power, electrolyzer_capacity, demand, lifetime
+        ),
+    )
@@ -0,0 +1,195 @@
+# Install packages
+import numpy as np
+
+HOURS_PER_YEAR = 8760
+FLUE_GAS_DENSITY = 1.2  # kg/m3, flue gas at the absorber inlet
+MAX_ABSORBER_DIAMETER = 15.0  # m, largest absorber column of one train
+
+# Specific regeneration energy rises at part load (stripper heat losses and reflux do not scale with the CO2
+# flow): relative increase per unit of load below the design load
+PART_LOAD_PENALTY = 0.15
+
+# Synthetic operating pattern of an industrial emitter: daily swing, weekend load and a yearly maintenance stop
+DAILY_SWING = 0.1
+WEEKEND_LOAD = 0.8
+OUTAGE_START = 4344  # hour of the year, early July
+OUTAGE_HOURS = 336
+
+
+class FlueGasSeries:
+    """Hourly flue gas flow and CO2 content of one or more years, prepared for capture unit evaluation.
+
+    The capture balance does not depend on the order of the hours, so for a design flow the hours of every year
+    are kept sorted by the load of the capture unit, with prefix sums of the treated CO2 and of the treated CO2
+    times the load. The yearly balance of a capture technology then needs one binary search on its minimum load
+    per year instead of a pass over all hours (see capture_balance for the per-hour definition).
+    """
+
+    def __init__(self, flow: np.ndarray, co2_fraction: np.ndarray | float):
+        """
+        Args:
+            flow (np.ndarray): hourly flue gas flow in kg/s, years x hours (or a single year of hours)
+            co2_fraction (np.ndarray | float): CO2 mass fraction of the flue gas, broadcast against flow
+        """
+        self.flow = np.atleast_2d(np.asarray(flow, dtype=float))
+        self.co2 = self.flow * np.asarray(co2_fraction, dtype=float) * 3.6  # t/h
+        self.annual_co2 = self.co2.sum(axis=1)  # t per year
+        # percentile -> design flow and design flow -> load profiles of the capture unit
+        self._design_flows = {}
+        self._profiles = {}
+
+    def __len__(self) -> int:
+        """Number of years"""
+        return self.flow.shape[0]
+
+    @classmethod
+    def from_plant(
+        cls, mean_flow: float, co2_fraction: float, hours: int = HOURS_PER_YEAR
+    ) -> "FlueGasSeries":
+        """One year of an industrial emitter with a daily swing, lower weekend load and a maintenance stop,
+        scaled to the mean flow over the operating hours (deterministic)
+
+        Args:
+            mean_flow (float): mean flue gas flow while operating in kg/s
+            co2_fraction (float): CO2 mass fraction of the flue gas
+            hours (int): hours of the year
+        """
+        hour = np.arange(hours)
+        load = 1 + DAILY_SWING * np.sin(2 * np.pi * (hour % 24 - 8) / 24)
+        load = np.where(hour // 24 % 7 >= 5, WEEKEND_LOAD * load, load)
+        operating = (hour < OUTAGE_START) | (hour >= OUTAGE_START + OUTAGE_HOURS)
+        load = np.where(operating, load / load[operating].mean(), 0.0)
+        return cls(mean_flow * load, co2_fraction)
+
+    @classmethod
+    def from_resource(cls, carbon_capture_data, country: str) -> "FlueGasSeries":
+        """Flue gas series of a country from the carbon capture resource data
+
+        Uses the "hourly" sheet (rows of country, flow, co2fraction; 8760 per year) when the resource has one,
+        otherwise a synthetic year around the mean flow and CO2 fraction of "sheet1".
+        """
+        if "hourly" in carbon_capture_data:
+            hourly = carbon_capture_data["hourly"]
+            hourly = hourly[hourly["country"] == country]
+            flow = hourly["flow"].to_numpy(dtype=float)
+            co2_fraction = hourly["co2fraction"].to_numpy(dtype=float)
+            years = max(1, len(flow) // HOURS_PER_YEAR)
+            hours = years * HOURS_PER_YEAR if len(flow) >= HOURS_PER_YEAR else len(flow)
+            return cls(flow[:hours].reshape(years, -1), co2_fraction[:hours].reshape(years, -1))
+
+        concept_flue_gas = carbon_capture_data.get_country("sheet1", country)
+        return cls.from_plant(concept_flue_gas["flow"], concept_flue_gas["co2fraction"])
+
+    def get_design_flow(self, percentile: float) -> float:
+        """Flue gas flow the capture unit is sized for: a percentile of the flow over the operating hours, higher
+        flows are partly bypassed"""
+        design_flow = self._design_flows.get(percentile)
+        if design_flow is None:
+            design_flow = self._design_flows[percentile] = float(np.percentile(self.flow[self.flow > 0], percentile))
+        return design_flow
+
+    def get_load_profile(self, design_flow: float) -> dict:
+        """Hours of every year sorted by the load of a capture unit sized for design_flow, with prefix sums of
+        the treated CO2 and the treated CO2 x load and the suffix maximum of the hourly regeneration factor
+        (treated CO2 x part-load increase). Built once per design flow"""
+        profile = self._profiles.get(design_flow)
+        if profile is None:
+            load = np.minimum(self.flow / design_flow, 1.0)
+            # CO2 in the treated share of the flue gas, the rest bypasses the unit
+            treated = np.where(self.flow > 0, self.co2 * load * design_flow / np.maximum(self.flow, 1e-12), 0.0)
+            order = np.argsort(load, axis=1, kind="stable")
+            load = np.take_along_axis(load, order, axis=1)
+            treated = np.take_along_axis(treated, order, axis=1)
+            zeros = np.zeros((len(self), 1))
+            regeneration = treated * (1 + PART_LOAD_PENALTY * (1 - load))
+            profile = self._profiles[design_flow] = {
+                "load": load,
+                "treated_sums": np.concatenate((zeros, np.cumsum(treated, axis=1)), axis=1),
+                "load_sums": np.concatenate((zeros, np.cumsum(treated * load, axis=1)), axis=1),
+                "peak_regeneration": np.concatenate(
+                    (np.maximum.accumulate(regeneration[:, ::-1], axis=1)[:, ::-1], zeros), axis=1
+                ),
+                "peak_treated": float(treated.max()),
+            }
+        return profile
+
+    def capture_balance(
+        self, design_flow: float, capture_rate, regeneration_energy, electricity_use, min_load
+    ) -> dict:
+        """CO2 and energy balance per capture technology option and year
+
+        Per hour the unit treats the flue gas up to its design flow and runs when its load is at least the
+        minimum load. It captures capture_rate of the treated CO2, with a specific regeneration energy that
+        increases by PART_LOAD_PENALTY x (1 - load) at part load.
+
+        Args:
+            design_flow (float): flue gas flow the unit is sized for in kg/s
+            capture_rate (array_like): capture rate of the treated CO2 (0-1) per option
+            regeneration_energy (array_like): reboiler duty at design load in GJ/t CO2 per option
+            electricity_use (array_like): fans, pumps and CO2 compression in kWh/t CO2 per option
+            min_load (array_like): minimum load fraction per option
+
+        Returns:
+            _dict_: captured and emitted CO2 (t), regeneration heat and electricity (MWh) and operating hours,
+                each options x years, the peak reboiler duty (MW) and the captured CO2 at design load (t/h) per
+                option
+        """
+        capture_rate, regeneration_energy, electricity_use, min_load = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(x, dtype=float))
+                for x in (capture_rate, regeneration_energy, electricity_use, min_load)
+            )
+        )
+        profile = self.get_load_profile(design_flow)
+        # the unit never runs without flue gas
+        running_load = np.maximum(min_load, np.finfo(float).tiny)
+        hours = self.flow.shape[1]
+
+        shape = (len(capture_rate), len(self))
+        treated, treated_load, operating_hours, peak = (np.empty(shape) for _ in range(4))
+        for year in range(len(self)):
+            index = np.searchsorted(profile["load"][year], running_load, side="left")
+            treated[:, year] = profile["treated_sums"][year, -1] - profile["treated_sums"][year, index]
+            treated_load[:, year] = profile["load_sums"][year, -1] - profile["load_sums"][year, index]
+            operating_hours[:, year] = hours - index
+            peak[:, year] = profile["peak_regeneration"][year, index]
+
+        captured = capture_rate[:, None] * treated
+        # GJ/t x t = GJ, / 3.6 to MWh
+        regeneration = (
+            regeneration_energy[:, None]
+            * capture_rate[:, None]
+            * ((1 + PART_LOAD_PENALTY) * treated - PART_LOAD_PENALTY * treated_load)
+            / 3.6
+        )
+        return {
+            "captured": captured,
+            "emitted": self.annual_co2[None, :] - captured,
+            "regeneration": regeneration,
+            "electricity": electricity_use[:, None] * captured / 1000,
+            "operating_hours": operating_hours,
+            "reboiler_duty": regeneration_energy * capture_rate * peak.max(axis=1) / 3.6,
+            "design_capture": capture_rate * profile["peak_treated"],
+        }
+
+
+def get_flue_gas_series(carbon_capture_data, country: str) -> FlueGasSeries:
+    """Gets the FlueGasSeries of a country, built once per loaded carbon capture resource"""
+    return carbon_capture_data.get_derived(
+        ("flue_gas_series", country), lambda data: FlueGasSeries.from_resource(data, country)
+    )
+
+
+def size_absorber(design_flow: float, gas_velocity) -> dict:
+    """Absorber trains for the design flue gas flow at the superficial gas velocity of each option
+
+    Args:
+        design_flow (float): flue gas flow in kg/s
+        gas_velocity (array_like): superficial gas velocity in the absorber in m/s per option
+
+    Returns:
+        _dict_: number of trains and absorber diameter (m) per option
+    """
+    area = design_flow / (FLUE_GAS_DENSITY * np.asarray(gas_velocity, dtype=float))
+    trains = np.ceil(area / (np.pi * MAX_ABSORBER_DIAMETER**2 / 4))
+    return {"trains": trains, "diameter": np.sqrt(4 * area / (np.pi * trains))}
@@ -1,8 +1,127 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-from archetypes.carbon_capture.carbon_capture_metrics import get_carbon_capture_metrics
+from archetypes.carbon_capture.carbon_capture_metrics import (
+    get_capture_unit,
+    get_capture_unit_batch,
+    get_layout,
+    get_trl,
+    get_trl_batch,
+)
+from src.instrumentation import instrument
 
-def carbon_capture():
-    pass
\ No newline at end of file
+
+@instrument()
+def carbon_capture(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    choices: dict[int, dict],
+    job_data: dict,
+    carbon_capture_data,
+):
+    """Calculates the relevant design outputs for the carbon capture archetype
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY carbon capture specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        carbon_capture_data (ResourceData): flue gas and energy carbon intensity data
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production (0 MWh, the unit produces no
+            energy), captured_co2 (t per year), carbon_footprint and the capture balance and sizing
+    """
+    unit = get_capture_unit(
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        choices=choices,
+        carbon_capture_data=carbon_capture_data,
+    )
+
+    # Output calculation
+    layout = float(get_layout(unit["trains"]))
+    trl = get_trl(choices)["trl"]
+    capex = unit["capex"]
+    opex = unit["opex"]
+    stack_replacement_cost = 0
+    stack_replacement_time = 0
+    degradation_rate = 0
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": 0,
+        "captured_co2": unit["captured"],
+        "carbon_footprint": unit["carbon_footprint"],
+        "capture_rate": unit["capture_rate"],
+        "regeneration_energy": unit["regeneration"],
+        "absorber_trains": unit["trains"],
+        "reboiler_duty": unit["reboiler_duty"],
+    }
+
+
+@instrument()
+def carbon_capture_batch(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    design_properties,
+    job_data: dict,
+    carbon_capture_data,
+):
+    """Calculates the carbon capture design outputs for a batch of designs in one vectorised pass
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY carbon capture specific user input
+        design_properties (DesignProperties): Chosen option properties per design
+        job_data (dict): Contains all archetype and vendor data
+        carbon_capture_data (ResourceData): flue gas and energy carbon intensity data
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production (0 MWh), captured_co2 (t per
+            year), carbon_footprint and the capture balance and sizing - one array entry per design
+    """
+    unit = get_capture_unit_batch(
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+        carbon_capture_data=carbon_capture_data,
+    )
+
+    # Output calculation
+    number_of_designs = len(design_properties)
+
+    layout = get_layout(unit["trains"])
+    trl = get_trl_batch(design_properties)["trl"]
+    capex = unit["capex"]
+    opex = unit["opex"]
+    stack_replacement_cost = np.zeros(number_of_designs)
+    stack_replacement_time = np.zeros(number_of_designs)
+    degradation_rate = np.zeros(number_of_designs)
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": np.zeros(number_of_designs),
+        "captured_co2": unit["captured"],
+        "carbon_footprint": unit["carbon_footprint"],
+        "capture_rate": unit["capture_rate"],
+        "regeneration_energy": unit["regeneration"],
+        "absorber_trains": unit["trains"],
+        "reboiler_duty": unit["reboiler_duty"],
+    }
@@ -1,6 +1,197 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-def get_carbon_capture_metrics():
-    pass
\ No newline at end of file
+from archetypes.carbon_capture.absorption import get_flue_gas_series, size_absorber
+from src.instrumentation import instrument
+from src.utilities import fill_missing, get_option_data, to_float
+
+# Block uuid of the capture technology
+CAPTURE_BLOCK_UUID = "5d0f7c3e-8a41-4b6e-9f2d-3c71e4a9b816"
+
+# Option property values used where an option does not provide them (30 wt% MEA)
+DEFAULT_CAPTURE_RATE = 90.0  # % of the treated CO2
+DEFAULT_REGENERATION_ENERGY = 3.6  # GJ/t CO2
+DEFAULT_ELECTRICITY_USE = 130.0  # kWh/t CO2, including compression
+DEFAULT_MIN_LOAD = 40.0  # % of the design flow
+DEFAULT_GAS_VELOCITY = 2.5  # m/s, superficial velocity in the absorber
+DEFAULT_CYCLIC_LOADING = 55.0  # kg CO2 per m3 of circulated solvent
+DEFAULT_SOLVENT_LOSS = 1.5  # kg solvent per t CO2
+DEFAULT_COST_FACTOR = 1.0
+
+# Option properties read by the capture model
+CAPTURE_PROPERTIES = (
+    "capturerate",
+    "regenerationenergy",
+    "electricityuse",
+    "minload",
+    "gasvelocity",
+    "cyclicloading",
+    "solventloss",
+    "costfactor",
+)
+
+# DUMMY cost figures (capex figures are in millions)
+CAPTURE_COST = 3.0  # per t/h of CO2 captured at design load
+REBOILER_COST = 0.2  # per MW of reboiler duty
+FIXED_OPEX_SHARE = 0.03  # of the capex per year
+HEAT_COST = 3e-5  # per MWh of regeneration heat
+POWER_COST = 6e-5  # per MWh of electricity
+SOLVENT_COST = 2e-3  # per t of solvent make-up
+TRAIN_AREA = 2500  # m^sq per absorber/stripper train
+
+
+@instrument()
+def get_capture_unit(
+    archetype_user_input: dict,
+    job_data: dict,
+    choices: dict[int, dict],
+    carbon_capture_data,
+):
+    """Calculates the CO2, solvent and energy balance and the sizing of the chosen capture technology on the hourly
+    flue gas of the site (see absorption.FlueGasSeries.capture_balance)
+
+    Args:
+        archetype_user_input (dict): DUMMY carbon capture specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        carbon_capture_data (ResourceData): flue gas and energy carbon intensity data
+
+    Returns:
+        _dict_: yearly captured CO2 (t), overall capture rate, regeneration heat and electricity (MWh), carbon
+            footprint (t CO2), absorber trains and diameter (m), reboiler duty (MW), solvent flow (m3/h), capex
+            and opex
+    """
+    capture_data = get_option_data(choices, CAPTURE_BLOCK_UUID)
+    options = get_options_batch({name: np.array([to_float(capture_data.get(name))]) for name in CAPTURE_PROPERTIES})
+    unit = _get_capture_unit(archetype_user_input, job_data, carbon_capture_data, options)
+    return {key: value[0] for key, value in unit.items()}
+
+
+def _get_capture_unit(archetype_user_input, job_data, carbon_capture_data, options) -> dict:
+    """Balance, sizing and cost per capture technology option (arrays over the options)"""
+    series = get_flue_gas_series(carbon_capture_data, job_data.country)
+    intensity = carbon_capture_data.get_country("sheet1", job_data.country)
+    design_flow = series.get_design_flow(archetype_user_input["design_percentile"])
+    balance = series.capture_balance(
+        design_flow,
+        options["capture_rate"],
+        options["regeneration_energy"],
+        options["electricity_use"],
+        options["min_load"],
+    )
+    absorber = size_absorber(design_flow, options["gas_velocity"])
+
+    # yearly means over the years of the series
+    captured = balance["captured"].mean(axis=1)
+    regeneration = balance["regeneration"].mean(axis=1)
+    electricity = balance["electricity"].mean(axis=1)
+    solvent_make_up = captured * options["solvent_loss"] / 1000
+
+    capex = options["cost_factor"] * (
+        CAPTURE_COST * balance["design_capture"] + REBOILER_COST * balance["reboiler_duty"]
+    )
+    opex = (
+        FIXED_OPEX_SHARE * capex
+        + HEAT_COST * regeneration
+        + POWER_COST * electricity
+        + SOLVENT_COST * solvent_make_up
+    )
+    carbon_footprint = (
+        balance["emitted"].mean(axis=1)
+        + regeneration * intensity["heatintensity"]
+        + electricity * intensity["gridintensity"]
+    )
+
+    return {
+        "captured": captured,
+        "capture_rate": captured / series.annual_co2.mean(),
+        "regeneration": regeneration,
+        "electricity": electricity,
+        "carbon_footprint": carbon_footprint,
+        "trains": absorber["trains"],
+        "absorber_diameter": absorber["diameter"],
+        "reboiler_duty": balance["reboiler_duty"],
+        "solvent_flow": balance["design_capture"] * 1000 / options["cyclic_loading"],
+        "capex": capex,
+        "opex": opex,
+    }
+
+
+def get_layout(trains):
+    """Calculates the footprint of the capture plant
+
+    Args:
+        trains (array_like): number of absorber/stripper trains
+
+    Returns:
+        _float_: area of the plant in m^sq
+    """
+    return np.asarray(trains, dtype=float) * TRAIN_AREA
+
+
+@instrument()
+def get_trl(choices: dict[int, dict]):
+    """Gets the TRL of the chosen capture technology (0 if unknown)
+
+    Args:
+        choices (dict[int, dict]): Chosen project design
+
+    Returns:
+        _dict_: technology readiness level
+    """
+    trl = to_float(get_option_data(choices, CAPTURE_BLOCK_UUID).get("trlmaturity"))
+    return {"trl": 0 if np.isnan(trl) else trl}
+
+
+# BATCH versions: the same calculations over a batch of designs, one array entry per design
+def get_options_batch(columns) -> dict:
+    """Capture technology properties from property columns, with defaults where missing (fractions for the
+    percentages and t/t for the solvent loss)"""
+    return {
+        "capture_rate": fill_missing(columns["capturerate"], DEFAULT_CAPTURE_RATE) / 100,
+        "regeneration_energy": fill_missing(columns["regenerationenergy"], DEFAULT_REGENERATION_ENERGY),
+        "electricity_use": fill_missing(columns["electricityuse"], DEFAULT_ELECTRICITY_USE),
+        "min_load": fill_missing(columns["minload"], DEFAULT_MIN_LOAD) / 100,
+        "gas_velocity": fill_missing(columns["gasvelocity"], DEFAULT_GAS_VELOCITY),
+        "cyclic_loading": fill_missing(columns["cyclicloading"], DEFAULT_CYCLIC_LOADING),
+        "solvent_loss": fill_missing(columns["solventloss"], DEFAULT_SOLVENT_LOSS),
+        "cost_factor": fill_missing(columns["costfactor"], DEFAULT_COST_FACTOR),
+    }
+
+
+@instrument()
+def get_capture_unit_batch(archetype_user_input: dict, job_data: dict, design_properties, carbon_capture_data) -> dict:
+    """Calculates the capture unit for a batch of designs. Every distinct capture technology is evaluated once,
+    all of them at once (see get_capture_unit)
+
+    Args:
+        archetype_user_input (dict): DUMMY carbon capture specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+        carbon_capture_data (ResourceData): flue gas and energy carbon intensity data
+
+    Returns:
+        _dict_: balance, sizing and cost of the capture unit per design
+    """
+    options = get_options_batch({name: design_properties.get(CAPTURE_BLOCK_UUID, name) for name in CAPTURE_PROPERTIES})
+    names = list(options)
+    unique, inverse = np.unique(np.stack([options[name] for name in names], axis=1), axis=0, return_inverse=True)
+    unit = _get_capture_unit(
+        archetype_user_input,
+        job_data,
+        carbon_capture_data,
+        {name: unique[:, column] for column, name in enumerate(names)},
+    )
+    return {key: value[inverse.reshape(-1)] for key, value in unit.items()}
+
+
+def get_trl_batch(design_properties) -> dict:
+    """Gets the TRL for a batch of designs (see get_trl)
+
+    Args:
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _dict_: technology readiness level per design
+    """
+    return {"trl": np.nan_to_num(design_properties.get(CAPTURE_BLOCK_UUID, "trlmaturity"), nan=0.0)}
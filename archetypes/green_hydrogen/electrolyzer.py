@@ -0,0 +1,135 @@
+# Install packages
+import numpy as np
+
+from archetypes.offshore_wind.power_curve import (
+    DEFAULT_CUT_IN_SPEED,
+    DEFAULT_CUT_OUT_SPEED,
+    DEFAULT_RATED_SPEED,
+    get_wind_series,
+    power_curve,
+)
+
+HYDROGEN_LHV = 33.33  # kWh/kg, lower heating value of hydrogen
+
+# Part-load curve: efficiency relative to the rated efficiency, linear between the load points. Efficiency rises
+# towards part load (lower current density) and drops at low load where the balance of plant dominates
+PART_LOAD_POINTS = np.array([0.0, 0.1, 0.2, 0.4, 0.6, 0.8, 1.0])
+PART_LOAD_EFFICIENCY = np.array([0.70, 0.95, 1.08, 1.10, 1.07, 1.04, 1.00])
+
+
+def get_part_load_efficiency(load) -> np.ndarray:
+    """Efficiency relative to the rated efficiency at a load fraction (0-1)"""
+    return np.interp(load, PART_LOAD_POINTS, PART_LOAD_EFFICIENCY)
+
+
+def hydrogen_output(power, capacity, rated_efficiency, min_load) -> np.ndarray:
+    """Hourly hydrogen output in kg. All arguments broadcast, e.g. electrolyzer options x 1 against hours
+
+    Args:
+        power (array_like): available power in MW
+        capacity (array_like): electrolyzer capacity in MW
+        rated_efficiency (array_like): efficiency at rated load (LHV, 0-1)
+        min_load (array_like): minimum load fraction below which the electrolyzer is off
+
+    Returns:
+        np.ndarray: hydrogen in kg per hour
+    """
+    load = np.minimum(np.asarray(power, dtype=float) / capacity, 1.0)
+    efficiency = rated_efficiency * get_part_load_efficiency(load)
+    return np.where(load >= min_load, capacity * load * 1000 * efficiency / HYDROGEN_LHV, 0.0)
+
+
+class PowerProfile:
+    """Hourly available power of one or more years, prepared for electrolyzer evaluation.
+
+    Output does not depend on the order of the hours, so every year is kept sorted with prefix sums of the power
+    and the squared power. On each segment of the part-load curve the hydrogen output is quadratic in the power,
+    so the yearly output of an electrolyzer needs one binary search per curve point instead of a pass over all
+    hours (see hydrogen_output for the per-hour definition).
+    """
+
+    def __init__(self, power: np.ndarray):
+        """
+        Args:
+            power (np.ndarray): hourly available power in MW, years x hours (or a single year of hours)
+        """
+        self.power = np.atleast_2d(np.asarray(power, dtype=float))
+        self.sorted_power = np.sort(self.power, axis=1)
+        zeros = np.zeros((len(self), 1))
+        self.power_sums = np.concatenate((zeros, np.cumsum(self.sorted_power, axis=1)), axis=1)
+        self.squared_sums = np.concatenate((zeros, np.cumsum(self.sorted_power**2, axis=1)), axis=1)
+
+    def __len__(self) -> int:
+        """Number of years"""
+        return self.power.shape[0]
+
+    @classmethod
+    def from_wind(cls, wind_series, power_capacity: float) -> "PowerProfile":
+        """Power of a wind farm of power_capacity MW with a reference power curve against a wind series"""
+        return cls(
+            power_curve(
+                wind_series.speeds, power_capacity, DEFAULT_CUT_IN_SPEED, DEFAULT_RATED_SPEED, DEFAULT_CUT_OUT_SPEED
+            )
+        )
+
+    def annual_output(self, capacity, rated_efficiency, min_load) -> dict:
+        """Hydrogen output, operating hours and consumed energy per electrolyzer option and year
+
+        Args:
+            capacity (array_like): electrolyzer capacity in MW per option
+            rated_efficiency (array_like): efficiency at rated load (LHV, 0-1) per option
+            min_load (array_like): minimum load fraction per option
+
+        Returns:
+            _dict_: hydrogen (kg), operating_hours and energy (MWh), each options x years
+        """
+        capacity, rated_efficiency, min_load = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(x, dtype=float)) for x in (capacity, rated_efficiency, min_load))
+        )
+        # segment k of the curve: relative efficiency = intercept + slope * load for load in [point k, point k+1]
+        slopes = np.diff(PART_LOAD_EFFICIENCY) / np.diff(PART_LOAD_POINTS)
+        intercepts = PART_LOAD_EFFICIENCY[:-1] - slopes * PART_LOAD_POINTS[:-1]
+        # segment bounds in MW; parts of segments below the minimum load have no width
+        loads = np.clip(PART_LOAD_POINTS[None, :], min_load[:, None], 1.0)
+        bounds = capacity[:, None] * loads
+        scale = 1000 * rated_efficiency / HYDROGEN_LHV
+
+        shape = (len(capacity), len(self))
+        hydrogen, operating_hours, energy = np.empty(shape), np.empty(shape), np.empty(shape)
+        hours = self.power.shape[1]
+        for year in range(len(self)):
+            index = np.searchsorted(self.sorted_power[year], bounds, side="left")
+            power_sums = np.diff(self.power_sums[year][index], axis=1)
+            squared_sums = np.diff(self.squared_sums[year][index], axis=1)
+            rated_hours = hours - index[:, -1]
+            # hydrogen = scale * power * (intercept + slope * power / capacity) per hour below rated power
+            partial = (intercepts * power_sums + slopes * squared_sums / capacity[:, None]).sum(axis=1)
+            hydrogen[:, year] = scale * (partial + rated_hours * capacity * PART_LOAD_EFFICIENCY[-1])
+            operating_hours[:, year] = hours - index[:, 0]
+            energy[:, year] = power_sums.sum(axis=1) + rated_hours * capacity
+        return {"hydrogen": hydrogen, "operating_hours": operating_hours, "energy": energy}
+
+
+def get_replacement_time(operating_hours: np.ndarray, stack_lifetime, lifetime: int) -> np.ndarray:
+    """Years after which the stacks are first worn out, from the cumulative operating hours over the lifetime
+
+    Args:
+        operating_hours (np.ndarray): operating hours per option and year of the profile (options x years),
+            repeated cyclically over the lifetime
+        stack_lifetime (array_like): stack lifetime in operating hours per option
+        lifetime (int): project lifetime in years
+
+    Returns:
+        np.ndarray: replacement interval in whole years per option (0 if the stacks outlast the project)
+    """
+    cumulative = np.cumsum(operating_hours[:, np.arange(lifetime) % operating_hours.shape[1]], axis=1)
+    worn_out = cumulative >= np.asarray(stack_lifetime, dtype=float)[..., None]
+    return np.where(worn_out.any(axis=1), np.argmax(worn_out, axis=1) + 1, 0)
+
+
+def get_power_profile(wind_data, country: str, power_capacity: float) -> PowerProfile:
+    """Gets the PowerProfile of a wind farm feeding the electrolyzer, built once per loaded wind resource"""
+    return wind_data.get_derived(
+        ("power_profile", country, power_capacity),
+        lambda data: PowerProfile.from_wind(get_wind_series(data, country), power_capacity),
+    )
@@ -1,8 +1,130 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-from archetypes.green_hydrogen.green_hydrogen_metrics import get_green_hydrogen_metrics
+from archetypes.green_hydrogen.green_hydrogen_metrics import (
+    get_electrolyzer_properties,
+    get_electrolyzer_properties_from_designs,
+    get_hydrogen_production,
+    get_hydrogen_production_batch,
+    get_layout,
+    get_trl,
+    get_trl_batch,
+    ELECTROLYZER_BLOCK_UUID,
+)
+from src.instrumentation import instrument
+from src.utilities import get_option_data
 
-def green_hydrogen():
-    pass
\ No newline at end of file
+
+@instrument()
+def green_hydrogen(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    choices: dict[int, dict],
+    job_data: dict,
+    wind_data,
+):
+    """Calculates the relevant design outputs for the green hydrogen archetype
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY green hydrogen specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        wind_data (ResourceData): wind resource data of the wind farm feeding the electrolyzer
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production (hydrogen energy in MWh per
+            year, LHV) and hydrogen (kg per year)
+    """
+    electrolyzer = get_electrolyzer_properties(get_option_data(choices, ELECTROLYZER_BLOCK_UUID))
+    hydrogen = get_hydrogen_production(
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        choices=choices,
+        wind_data=wind_data,
+    )
+
+    # Output calculation
+    dummy_capex = 15
+    dummy_opex = 0.3
+
+    layout = get_layout(archetype_user_input)
+    trl = get_trl(choices)["trl"]
+    capex = dummy_capex * archetype_user_input["capacity"]
+    opex = dummy_opex * archetype_user_input["capacity"]
+    stack_replacement_cost = capex * float(electrolyzer["stack_cost_share"][0])
+    stack_replacement_time = int(hydrogen["stack_replacement_time"])
+    degradation_rate = 0
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": hydrogen["production"],
+        "hydrogen": hydrogen["hydrogen"],
+    }
+
+
+@instrument()
+def green_hydrogen_batch(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    design_properties,
+    job_data: dict,
+    wind_data,
+):
+    """Calculates the green hydrogen design outputs for a batch of designs in one vectorised pass
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY green hydrogen specific user input
+        design_properties (DesignProperties): Chosen option properties per design
+        job_data (dict): Contains all archetype and vendor data
+        wind_data (ResourceData): wind resource data of the wind farm feeding the electrolyzer
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production (MWh per year) and hydrogen
+            (kg per year) - one array entry per design
+    """
+    electrolyzer = get_electrolyzer_properties_from_designs(design_properties)
+    hydrogen = get_hydrogen_production_batch(
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+        wind_data=wind_data,
+    )
+
+    # Output calculation
+    dummy_capex = 15
+    dummy_opex = 0.3
+    number_of_designs = len(design_properties)
+
+    layout = np.full(number_of_designs, get_layout(archetype_user_input), dtype=float)
+    trl = get_trl_batch(design_properties)["trl"]
+    capex = np.full(number_of_designs, dummy_capex * archetype_user_input["capacity"], dtype=float)
+    opex = np.full(number_of_designs, dummy_opex * archetype_user_input["capacity"], dtype=float)
+    stack_replacement_cost = capex * electrolyzer["stack_cost_share"]
+    stack_replacement_time = hydrogen["stack_replacement_time"].astype(float)
+    degradation_rate = np.zeros(number_of_designs)
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": hydrogen["production"],
+        "hydrogen": hydrogen["hydrogen"],
+    }
@@ -1,6 +1,160 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-def get_green_hydrogen_metrics():
-    pass
\ No newline at end of file
+from archetypes.green_hydrogen.electrolyzer import HYDROGEN_LHV, get_power_profile, get_replacement_time
+from src.instrumentation import instrument
+from src.utilities import fill_missing, get_option_data, to_float
+
+# Block uuid of the electrolyzer
+ELECTROLYZER_BLOCK_UUID = "739dbf52-e4f0-4c5b-9dfc-b8aaaf09edb0"
+
+# Option property values used where an option does not provide them
+DEFAULT_EFFICIENCY = 60.0  # %, LHV at rated load
+DEFAULT_MIN_LOAD = 10.0  # % of rated power
+DEFAULT_STACK_LIFETIME = 80000.0  # operating hours
+DEFAULT_STACK_COST_SHARE = 35.0  # % of the electrolyzer capex
+
+# Option properties read by the electrolyzer model
+ELECTROLYZER_PROPERTIES = ("efficiency", "minload", "stacklifetime", "stackcostshare")
+
+
+def get_electrolyzer_properties(electrolyzer_data: dict) -> dict:
+    """Gets the properties of an electrolyzer option, with defaults where missing
+
+    Args:
+        electrolyzer_data (dict): chosen electrolyzer option properties
+
+    Returns:
+        _dict_: rated efficiency, minimum load and stack cost share (fractions) and stack lifetime (hours)
+    """
+    return get_electrolyzer_properties_batch(
+        {name: np.array([to_float(electrolyzer_data.get(name))]) for name in ELECTROLYZER_PROPERTIES}
+    )
+
+
+@instrument()
+def get_hydrogen_production(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, choices: dict[int, dict], wind_data
+):
+    """Calculates the hydrogen production of the chosen electrolyzer from the hourly power of the feeding wind
+    farm, and the stack replacement interval from its operating hours (see electrolyzer.PowerProfile)
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY green hydrogen specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        wind_data (ResourceData): wind resource data
+
+    Returns:
+        _dict_: mean annual production (MWh of hydrogen, LHV), mean annual hydrogen (kg), hydrogen (kg) and
+            operating hours per profile year and the stack replacement time (years)
+    """
+    electrolyzer = get_electrolyzer_properties(get_option_data(choices, ELECTROLYZER_BLOCK_UUID))
+    output = _get_hydrogen_production(general_user_inputs, archetype_user_input, job_data, wind_data, electrolyzer)
+    return {key: value[0] for key, value in output.items()}
+
+
+def _get_hydrogen_production(general_user_inputs, archetype_user_input, job_data, wind_data, electrolyzer) -> dict:
+    """Hydrogen production and stack replacement time per electrolyzer option"""
+    power_profile = get_power_profile(wind_data, job_data.country, archetype_user_input["power_capacity"])
+    output = power_profile.annual_output(
+        archetype_user_input["capacity"], electrolyzer["efficiency"], electrolyzer["min_load"]
+    )
+    hydrogen = output["hydrogen"].mean(axis=1)
+    return {
+        "production": hydrogen * HYDROGEN_LHV / 1000,
+        "hydrogen": hydrogen,
+        "annual_hydrogen": output["hydrogen"],
+        "operating_hours": output["operating_hours"],
+        "stack_replacement_time": get_replacement_time(
+            output["operating_hours"], electrolyzer["stack_lifetime"], general_user_inputs["project_lifetime"]
+        ),
+    }
+
+
+def get_layout(archetype_user_input: dict) -> float:
+    """Calculates the footprint of the electrolyzer plant
+
+    Args:
+        archetype_user_input (dict): DUMMY green hydrogen specific user input
+
+    Returns:
+        float: area of the plant
+    """
+    dummy_area = 50  # m^sq per MW
+    return archetype_user_input["capacity"] * dummy_area
+
+
+@instrument()
+def get_trl(choices: dict[int, dict]):
+    """Gets the TRL of the chosen electrolyzer (0 if unknown)
+
+    Args:
+        choices (dict[int, dict]): Chosen project design
+
+    Returns:
+        _dict_: technology readiness level
+    """
+    trl = to_float(get_option_data(choices, ELECTROLYZER_BLOCK_UUID).get("trlmaturity"))
+    return {"trl": 0 if np.isnan(trl) else trl}
+
+
+# BATCH versions: the same calculations over a batch of designs, one array entry per design
+def get_electrolyzer_properties_batch(columns) -> dict:
+    """Electrolyzer properties (see get_electrolyzer_properties) from property columns"""
+    return {
+        "efficiency": fill_missing(columns["efficiency"], DEFAULT_EFFICIENCY) / 100,
+        "min_load": fill_missing(columns["minload"], DEFAULT_MIN_LOAD) / 100,
+        "stack_lifetime": fill_missing(columns["stacklifetime"], DEFAULT_STACK_LIFETIME),
+        "stack_cost_share": fill_missing(columns["stackcostshare"], DEFAULT_STACK_COST_SHARE) / 100,
+    }
+
+
+def get_electrolyzer_properties_from_designs(design_properties) -> dict:
+    """Electrolyzer properties for a batch of designs"""
+    return get_electrolyzer_properties_batch(
+        {name: design_properties.get(ELECTROLYZER_BLOCK_UUID, name) for name in ELECTROLYZER_PROPERTIES}
+    )
+
+
+@instrument()
+def get_hydrogen_production_batch(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, design_properties, wind_data
+) -> dict:
+    """Calculates the hydrogen production for a batch of designs. The electrolyzer model is evaluated once per
+    distinct electrolyzer, all of them at once (see get_hydrogen_production)
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY green hydrogen specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+        wind_data (ResourceData): wind resource data
+
+    Returns:
+        _dict_: production (MWh), hydrogen (kg), per year values and stack replacement time per design
+    """
+    electrolyzer = get_electrolyzer_properties_from_designs(design_properties)
+    options = np.stack([electrolyzer[name] for name in ("efficiency", "min_load", "stack_lifetime")], axis=1)
+    unique, inverse = np.unique(options, axis=0, return_inverse=True)
+    output = _get_hydrogen_production(
+        general_user_inputs,
+        archetype_user_input,
+        job_data,
+        wind_data,
+        {"efficiency": unique[:, 0], "min_load": unique[:, 1], "stack_lifetime": unique[:, 2]},
+    )
+    return {key: value[inverse.reshape(-1)] for key, value in output.items()}
+
+
+def get_trl_batch(design_properties) -> dict:
+    """Gets the TRL for a batch of designs (see get_trl)
+
+    Args:
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _dict_: technology readiness level per design
+    """
+    return {"trl": np.nan_to_num(design_properties.get(ELECTROLYZER_BLOCK_UUID, "trlmaturity"), nan=0.0)}
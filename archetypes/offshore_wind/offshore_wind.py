@@ -1,5 +1,4 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
 from archetypes.offshore_wind.offshore_wind_metrics import (
@@ -11,9 +10,27 @@ from archetypes.offshore_wind.offshore_wind_metrics import (
     get_iac_layout,
     get_export_cable,
     get_trl,
+    get_hourly_production,
+    get_number_of_turbines_batch,
+    get_annual_production_batch,
+    get_substructure_layout_batch,
+    get_substation_layout_batch,
+    get_iac_layout_batch,
+    get_export_cable_batch,
+    get_trl_batch,
+    get_hourly_production_batch,
+    WTG_BLOCK_UUID,
+    MOORING_BLOCK_UUID,
+    SUBSTRUCTURE_BLOCK_UUID,
+    SUBSTATION_BLOCK_UUID,
+    IAC_BLOCK_UUID,
+    EC_BLOCK_UUID,
 )
+from archetypes.offshore_wind.offshore_wind_cache import get_sub_result
+from src.instrumentation import instrument
 
 
+@instrument()
 def offshore_wind(
     wacc_real: float,
     general_user_inputs: dict,
@@ -33,35 +50,50 @@ def offshore_wind(
         wind_data (dict): DUMMY wind profile (speed and density)
 
     Returns:
-        _dict_: layout, opex, capex, trl, stack_values, production
+        _dict_: layout, opex, capex, trl, stack_values, production (MWh per year)
     """
     # Wind Turbine Generator
-    number_of_turbines = get_number_of_turbines(
+    number_of_turbines = get_sub_result(
+        get_number_of_turbines,
+        (WTG_BLOCK_UUID,),
         general_user_inputs=general_user_inputs,
         archetype_user_input=archetype_user_input,
         job_data=job_data,
         choices=choices,
     )
 
-    annual_energy_production = get_annual_production(
-        general_user_inputs=general_user_inputs,
-        archetype_user_input=archetype_user_input,
-        job_data=job_data,
-        choices=choices,
-        wind_data=wind_data,
-    )
+    if archetype_user_input.get("production_model") == "hourly":
+        annual_energy_production = get_hourly_production(
+            general_user_inputs=general_user_inputs,
+            archetype_user_input=archetype_user_input,
+            job_data=job_data,
+            choices=choices,
+            wind_data=wind_data,
+        )["production"]
+    else:
+        annual_energy_production = get_annual_production(
+            general_user_inputs=general_user_inputs,
+            archetype_user_input=archetype_user_input,
+            job_data=job_data,
+            choices=choices,
+            wind_data=wind_data,
+        )
 
     wtg_layout = get_wtg_layout(number_of_turbines=number_of_turbines)  # WTG layout
 
     # Sub-system substructure and mooring
-    substructure = get_substructure_layout(
+    substructure = get_sub_result(
+        get_substructure_layout,
+        (MOORING_BLOCK_UUID, SUBSTRUCTURE_BLOCK_UUID),
         general_user_inputs=general_user_inputs,
         archetype_user_input=archetype_user_input,
         job_data=job_data,
         choices=choices,
     )
     # Substation
-    substation = get_substation_layout(
+    substation = get_sub_result(
+        get_substation_layout,
+        (SUBSTATION_BLOCK_UUID,),
         general_user_inputs=general_user_inputs,
         archetype_user_input=archetype_user_input,
         job_data=job_data,
@@ -70,7 +102,9 @@ def offshore_wind(
     )
 
     # IAC
-    iac = get_iac_layout(
+    iac = get_sub_result(
+        get_iac_layout,
+        (IAC_BLOCK_UUID,),
         general_user_inputs=general_user_inputs,
         archetype_user_input=archetype_user_input,
         job_data=job_data,
@@ -78,7 +112,9 @@ def offshore_wind(
     )
 
     # Export Cable
-    ec = get_export_cable(
+    ec = get_sub_result(
+        get_export_cable,
+        (EC_BLOCK_UUID,),
         general_user_inputs=general_user_inputs,
         archetype_user_input=archetype_user_input,
         job_data=job_data,
@@ -96,6 +132,112 @@ def offshore_wind(
     opex = dummy_opex * (archetype_user_input["capacity"] + substation["substation_capacity"])
     stack_replacement_cost = 0
     stack_replacement_time = 0
+    degradation_rate = 0
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": annual_energy_production,
+    }
+
+
+@instrument()
+def offshore_wind_batch(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    design_properties,
+    job_data: dict,
+    wind_data,
+):
+    """Calculates the OWF design outputs for a batch of designs in one vectorised pass
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        design_properties (DesignProperties): Chosen option properties per design
+        job_data (dict): Contains all archetype and vendor data
+        wind_data (dict): DUMMY wind profile (speed and density)
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, production (MWh per year) - one array entry per design
+    """
+    # Wind Turbine Generator
+    number_of_turbines = get_number_of_turbines_batch(
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+    )
+
+    if archetype_user_input.get("production_model") == "hourly":
+        annual_energy_production = get_hourly_production_batch(
+            general_user_inputs=general_user_inputs,
+            archetype_user_input=archetype_user_input,
+            job_data=job_data,
+            design_properties=design_properties,
+            wind_data=wind_data,
+        )["production"]
+    else:
+        annual_energy_production = get_annual_production_batch(
+            general_user_inputs=general_user_inputs,
+            archetype_user_input=archetype_user_input,
+            job_data=job_data,
+            design_properties=design_properties,
+            wind_data=wind_data,
+        )
+
+    wtg_layout = get_wtg_layout(number_of_turbines=number_of_turbines)  # WTG layout
+
+    # Sub-system substructure and mooring
+    substructure = get_substructure_layout_batch(
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+    )
+    # Substation
+    substation = get_substation_layout_batch(
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+        number_of_turbines=number_of_turbines,
+    )
+
+    # IAC
+    iac = get_iac_layout_batch(
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+    )
+
+    # Export Cable
+    ec = get_export_cable_batch(
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+    )
+
+    # Output calculation
+    dummy_capex = 10
+    dummy_opex = 1
+
+    layout = wtg_layout + substructure["substructure_size"]
+    trl = get_trl_batch(design_properties)["trl"]
+    capex = dummy_capex * layout
+    opex = dummy_opex * (archetype_user_input["capacity"] + substation["substation_capacity"])
+    stack_replacement_cost = np.zeros(len(design_properties))
+    stack_replacement_time = np.zeros(len(design_properties))
+    degradation_rate = np.zeros(len(design_properties))
 
     return {
         "layout": layout,
@@ -104,5 +246,6 @@ def offshore_wind(
         "trl": trl,
         "stack_replacement_cost": stack_replacement_cost,
         "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
         "production": annual_energy_production,
     }
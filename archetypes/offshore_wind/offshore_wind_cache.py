@@ -0,0 +1,101 @@
+# Install packages
+import itertools
+import weakref
+
+from src.utilities import LRUCache
+
+# Memoised OWF sub-results, shared by all evaluations in the process
+sub_result_cache = LRUCache(maxsize=4096)
+
+_missing = object()
+
+# id(job_data) -> token of the job object, dropped when the job is garbage collected
+_job_tokens = {}
+_next_token = itertools.count()
+
+
+def get_job_token(job_data) -> int:
+    """Token identifying a job object for as long as it lives. Jobs that share an engine_job_id (e.g. a reloaded
+    or edited job) get different tokens, so they never share sub-results"""
+    key = id(job_data)
+    token = _job_tokens.get(key)
+    if token is None:
+        token = _job_tokens[key] = next(_next_token)
+        weakref.finalize(job_data, _job_tokens.pop, key, None)
+    return token
+
+
+def _freeze(value):
+    """Hashable form of a property value"""
+    return tuple(_freeze(x) for x in value) if isinstance(value, (list, tuple)) else value
+
+
+def get_chosen_option(choices: dict[int, dict], block_uuid: str):
+    """Gets the chosen option of a block as a hashable key: its name and property values (None if the block has
+    no choice), so an option whose values were edited in the choices is a different option"""
+    block_data = choices.get(block_uuid)
+    if not block_data:
+        return None
+    name, properties = next(reversed(block_data.items()))
+    return name, tuple((key, _freeze(value)) for key, value in sorted(properties.items()))
+
+
+def get_sub_result(
+    function,
+    block_uuids: tuple,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    job_data: dict,
+    choices: dict[int, dict],
+    **kwargs,
+):
+    """Calls an OWF metric getter through the sub-result cache.
+
+    The result only depends on the options chosen in block_uuids, the archetype inputs and the extra kwargs, so
+    sibling designs of the same job object that share those choices reuse it. The key holds the chosen options'
+    property values, so edited options and other jobs with the same engine_job_id never hit each other's entries.
+
+    Args:
+        function (callable): metric getter, e.g. get_substation_layout
+        block_uuids (tuple): blocks whose choice the getter reads
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        **kwargs: extra (hashable) getter arguments, part of the key
+
+    Returns:
+        _Any_: the getter result (shared between hits, treat as read-only)
+    """
+    key = (
+        function.__name__,
+        get_job_token(job_data),
+        tuple(get_chosen_option(choices, block_uuid) for block_uuid in block_uuids),
+        tuple(sorted(archetype_user_input.items())),
+        tuple(sorted(kwargs.items())),
+    )
+    result = sub_result_cache.get(key, _missing)
+    if result is _missing:
+        result = function(
+            general_user_inputs=general_user_inputs,
+            archetype_user_input=archetype_user_input,
+            job_data=job_data,
+            choices=choices,
+            **kwargs,
+        )
+        sub_result_cache.put(key, result)
+    return result
+
+
+def set_cache_size(maxsize: int | None):
+    """Bounds the number of memoised sub-results (0 disables memoisation, None is unbounded)"""
+    sub_result_cache.resize(maxsize)
+
+
+def clear_cache():
+    sub_result_cache.clear()
+
+
+def cache_info() -> dict:
+    """Hit/miss counters and size of the sub-result cache"""
+    return sub_result_cache.cache_info()
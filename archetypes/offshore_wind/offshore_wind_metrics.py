@@ -1,7 +1,30 @@
 # Install packages
-import pandas as pd
-
-
+import numpy as np
+
+from archetypes.offshore_wind.power_curve import DEFAULT_RATED_SPEED, get_turbine_speeds, get_wind_series
+from src.instrumentation import instrument
+from src.utilities import to_float
+
+# Block uuids of the OWF sub-systems
+WTG_BLOCK_UUID = "44d5d149-ae06-4749-b308-a90c801a11ec"
+MOORING_BLOCK_UUID = "4e89c80a-8dd8-4810-b285-755f345dafb3"
+SUBSTRUCTURE_BLOCK_UUID = "64c5eec0-9f91-43a4-a5d3-d8d9d4abb549"
+SUBSTATION_BLOCK_UUID = "8f5dd5e6-9a73-4eac-843f-f0f856f1e79e"
+IAC_BLOCK_UUID = "d94945e9-3d9f-4e04-b08c-bc9f73b2e543"
+EC_BLOCK_UUID = "bf837696-47ee-45dd-ac14-cbf001dd76cf"
+
+# Option properties the scalar engineering reads without a default (the mooring block only for floating projects)
+REQUIRED_PROPERTIES = {
+    WTG_BLOCK_UUID: ("ratedpower",),
+    MOORING_BLOCK_UUID: ("weightpercsasize", "weightpermeter"),
+    SUBSTRUCTURE_BLOCK_UUID: ("weightpermw",),
+    SUBSTATION_BLOCK_UUID: ("capacity", "weighttopsidepermw", "weighthullpermw"),
+    IAC_BLOCK_UUID: ("ratedpower", "weightperkm"),
+    EC_BLOCK_UUID: ("ratedpower", "weightperkm"),
+}
+
+
+@instrument()
 def get_number_of_turbines(
     general_user_inputs: dict, archetype_user_input: dict, job_data: dict, choices: dict[int, dict]
 ):
@@ -16,7 +39,7 @@ def get_number_of_turbines(
     Returns:
         _float_: number of turbines
     """
-    block_data = choices["44d5d149-ae06-4749-b308-a90c801a11ec"]
+    block_data = choices[WTG_BLOCK_UUID]
     for key, value in block_data.items():
         wtg_choice = key
         wtg_data = value
@@ -26,6 +49,7 @@ def get_number_of_turbines(
     return number_of_turbines
 
 
+@instrument()
 def get_annual_production(
     general_user_inputs: dict, archetype_user_input: dict, job_data: dict, choices: dict[int, dict], wind_data: dict
 ):
@@ -36,24 +60,23 @@ def get_annual_production(
         archetype_user_input (dict): DUMMY OWF specific user input
         job_data (dict): Contains all archetype and vendor data
         choices (dict[int, dict]): Chosen project design
-        wind_data (dict): DUMMY wind profile (speed and density)
+        wind_data (ResourceData): DUMMY wind profile (speed and density)
 
     Returns:
         _float_: energy produced per year
     """
-    block_data = choices["44d5d149-ae06-4749-b308-a90c801a11ec"]
+    block_data = choices[WTG_BLOCK_UUID]
     for key, value in block_data.items():
         wtg_choice = key
         wtg_data = value
 
-    wind_data = wind_data["sheet1"]
-    concept_wind = wind_data[wind_data["country"] == job_data.country]
+    concept_wind = wind_data.get_country("sheet1", job_data.country)
     hours_per_year = 365 * 22
     normalise = 100000
     annual_energy_production = (
         wtg_data["ratedpower"]
-        * concept_wind["wind"][0]
-        * concept_wind["airDensity"][0]
+        * concept_wind["wind"]
+        * concept_wind["airDensity"]
         * hours_per_year
         / normalise
         # * wtg_data["sweptArea"]
@@ -76,6 +99,7 @@ def get_wtg_layout(number_of_turbines: float) -> float:
     return wtg_layout
 
 
+@instrument()
 def get_substructure_layout(
     general_user_inputs: dict, archetype_user_input: dict, job_data: dict, choices: dict[int, dict]
 ):
@@ -94,7 +118,7 @@ def get_substructure_layout(
     if archetype_user_input["water_depth"] > 60:
         substructure_type = "Floating"
         substructure_config = "Mooring"
-        block_data = choices["4e89c80a-8dd8-4810-b285-755f345dafb3"]
+        block_data = choices[MOORING_BLOCK_UUID]
 
         for key, value in block_data.items():
             mooring_key = key
@@ -106,7 +130,7 @@ def get_substructure_layout(
     else:
         substructure_type = "Bottom-fixed"
         substructure_config = "Substructure"
-        block_data = choices["64c5eec0-9f91-43a4-a5d3-d8d9d4abb549"]
+        block_data = choices[SUBSTRUCTURE_BLOCK_UUID]
 
         for key, value in block_data.items():
             substructure_key = key
@@ -124,6 +148,7 @@ def get_substructure_layout(
     }
 
 
+@instrument()
 def get_substation_layout(
     general_user_inputs: dict,
     archetype_user_input: dict,
@@ -144,7 +169,7 @@ def get_substation_layout(
         _dict_: returns substation capacity, number of substations and the weight
     """
 
-    block_data = choices["8f5dd5e6-9a73-4eac-843f-f0f856f1e79e"]
+    block_data = choices[SUBSTATION_BLOCK_UUID]
     for key, value in block_data.items():
         substation_key = key
         substation_data = value
@@ -164,6 +189,7 @@ def get_substation_layout(
     }
 
 
+@instrument()
 def get_iac_layout(general_user_inputs: dict, archetype_user_input: dict, job_data: dict, choices: dict[int, dict]):
     """Get IAC layout - gets the number of IAC and weight
 
@@ -177,7 +203,7 @@ def get_iac_layout(general_user_inputs: dict, archetype_user_input: dict, job_da
         _dict_: number of the units and weight
     """
 
-    block_data = choices["d94945e9-3d9f-4e04-b08c-bc9f73b2e543"]
+    block_data = choices[IAC_BLOCK_UUID]
     for key, value in block_data.items():
         iac_key = key
         iac_data = value
@@ -188,6 +214,7 @@ def get_iac_layout(general_user_inputs: dict, archetype_user_input: dict, job_da
     return {"number_of_iac": number_of_iac, "iac_weight": iac_weight}
 
 
+@instrument()
 def get_export_cable(general_user_inputs: dict, archetype_user_input: dict, job_data: dict, choices: dict[int, dict]):
     """Get export cable layout - gets the number of export cable and weight
 
@@ -200,7 +227,7 @@ def get_export_cable(general_user_inputs: dict, archetype_user_input: dict, job_
     Returns:
         _dict_: number of the units and weight
     """
-    block_data = choices["bf837696-47ee-45dd-ac14-cbf001dd76cf"]
+    block_data = choices[EC_BLOCK_UUID]
     for key, value in block_data.items():
         ec_key = key
         ec_data = value
@@ -211,6 +238,7 @@ def get_export_cable(general_user_inputs: dict, archetype_user_input: dict, job_
     return {"number_of_ec": number_of_ec, "ec_weight": ec_weight}
 
 
+@instrument()
 def get_trl(choices: dict[int, dict]):
     """Gets the TRL for the system. The trl has been assumed to be a sum of the individual TRL.
     This is probably wrong
@@ -231,3 +259,253 @@ def get_trl(choices: dict[int, dict]):
             trl = trl + block_data["trlmaturity"]
 
     return {"trl": trl}
+
+
+@instrument()
+def get_hourly_production(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, choices: dict[int, dict], wind_data: dict
+):
+    """Calculates the energy production from the power curve of the chosen turbine against an hourly wind series
+    (see power_curve.WindSeries). Opt-in alternative to get_annual_production ("production_model": "hourly")
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        wind_data (ResourceData): wind resource data
+
+    Returns:
+        _dict_: mean annual production, production per year of the wind series and per year of the lifetime
+    """
+    wtg_data = next(reversed(choices[WTG_BLOCK_UUID].values()))
+    rated_power = to_float(wtg_data["ratedpower"])
+    cut_in, rated_speed, cut_out = get_turbine_speeds(
+        to_float(wtg_data.get("cutinspeed")),
+        to_float(wtg_data.get("cutoutspeed")),
+        archetype_user_input.get("rated_wind_speed", DEFAULT_RATED_SPEED),
+    )
+
+    turbine_production = get_wind_series(wind_data, job_data.country).lifetime_energy(
+        rated_power, cut_in, rated_speed, cut_out, general_user_inputs["project_lifetime"]
+    )[0]
+    number_of_turbines = archetype_user_input["capacity"] / rated_power
+    lifetime_production = number_of_turbines * turbine_production
+    return {
+        "production": lifetime_production.mean(),
+        "lifetime_production": lifetime_production,
+    }
+
+
+# BATCH versions: the same calculations over a batch of designs, one array entry per design
+@instrument()
+def get_number_of_turbines_batch(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, design_properties
+) -> np.ndarray:
+    """Calculates the number of turbines for a batch of designs
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _np.ndarray_: number of turbines per design
+    """
+    return archetype_user_input["capacity"] / design_properties.get(WTG_BLOCK_UUID, "ratedpower")
+
+
+@instrument()
+def get_annual_production_batch(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, design_properties, wind_data: dict
+) -> np.ndarray:
+    """Calculates the annual production of energy for a batch of designs
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+        wind_data (ResourceData): DUMMY wind profile (speed and density)
+
+    Returns:
+        _np.ndarray_: energy produced per year per design
+    """
+    concept_wind = wind_data.get_country("sheet1", job_data.country)
+    hours_per_year = 365 * 22
+    normalise = 100000
+    return (
+        design_properties.get(WTG_BLOCK_UUID, "ratedpower")
+        * concept_wind["wind"]
+        * concept_wind["airDensity"]
+        * hours_per_year
+        / normalise
+    )
+
+
+@instrument()
+def get_substructure_layout_batch(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, design_properties
+) -> dict:
+    """Calculates the substructure size and weight for a batch of designs
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _dict_: type, configuration, size and weight (per design) of the substructure
+    """
+    if archetype_user_input["water_depth"] > 60:
+        substructure_type = "Floating"
+        substructure_config = "Mooring"
+        substructure_size = design_properties.get(MOORING_BLOCK_UUID, "weightpercsasize")
+        substructure_weight = design_properties.get(MOORING_BLOCK_UUID, "weightpermeter") * substructure_size
+
+    else:
+        substructure_type = "Bottom-fixed"
+        substructure_config = "Substructure"
+        substructure_size = np.full(len(design_properties), 10.0)  # DUMMY
+        substructure_weight = (
+            design_properties.get(SUBSTRUCTURE_BLOCK_UUID, "weightpermw") * archetype_user_input["capacity"]
+        )
+
+    return {
+        "substructure_type": substructure_type,
+        "substructure_config": substructure_config,
+        "substructure_size": substructure_size,
+        "substructure_weight": substructure_weight,
+    }
+
+
+@instrument()
+def get_substation_layout_batch(
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    job_data: dict,
+    design_properties,
+    number_of_turbines: np.ndarray,
+) -> dict:
+    """Calculates the substation capacity, number and weight for a batch of designs
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+        number_of_turbines (np.ndarray): number of turbines per design
+
+    Returns:
+        _dict_: substation capacity, number of substations and the weight per design
+    """
+    substation_capacity = design_properties.get(SUBSTATION_BLOCK_UUID, "capacity")
+    number_of_substations = substation_capacity / number_of_turbines
+    substation_weight = (
+        number_of_substations
+        * (
+            design_properties.get(SUBSTATION_BLOCK_UUID, "weighttopsidepermw")
+            + design_properties.get(SUBSTATION_BLOCK_UUID, "weighthullpermw")
+        )
+        * substation_capacity
+    )
+
+    return {
+        "substation_capacity": substation_capacity,
+        "number_of_substations": number_of_substations,
+        "substation_weight": substation_weight,
+    }
+
+
+@instrument()
+def get_iac_layout_batch(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, design_properties
+) -> dict:
+    """Get IAC layout for a batch of designs - number of IAC and weight
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _dict_: number of the units and weight per design
+    """
+    number_of_iac = archetype_user_input["capacity"] / design_properties.get(IAC_BLOCK_UUID, "ratedpower")
+    iac_weight = number_of_iac * design_properties.get(IAC_BLOCK_UUID, "weightperkm")
+
+    return {"number_of_iac": number_of_iac, "iac_weight": iac_weight}
+
+
+@instrument()
+def get_export_cable_batch(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, design_properties
+) -> dict:
+    """Get export cable layout for a batch of designs - number of export cable and weight
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _dict_: number of the units and weight per design
+    """
+    number_of_ec = archetype_user_input["capacity"] / design_properties.get(EC_BLOCK_UUID, "ratedpower")
+    ec_weight = number_of_ec * design_properties.get(EC_BLOCK_UUID, "weightperkm")
+
+    return {"number_of_ec": number_of_ec, "ec_weight": ec_weight}
+
+
+@instrument()
+def get_trl_batch(design_properties) -> dict:
+    """Gets the TRL for a batch of designs. Mirrors get_trl, which only picks up a block level
+    "trlmaturity" entry; the chosen options carry it one level down, so this is zero for now
+
+    Args:
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _dict_: technology readiness level per design
+    """
+    return {"trl": np.zeros(len(design_properties))}
+
+
+@instrument()
+def get_hourly_production_batch(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, design_properties, wind_data: dict
+) -> dict:
+    """Calculates the power curve energy production for a batch of designs. The power curve is evaluated once
+    per distinct turbine and all turbines at once (see get_hourly_production)
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY OWF specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+        wind_data (ResourceData): wind resource data
+
+    Returns:
+        _dict_: mean annual production per design and production per design and year of the lifetime
+    """
+    turbines = np.stack(
+        [design_properties.get(WTG_BLOCK_UUID, x) for x in ("ratedpower", "cutinspeed", "cutoutspeed")], axis=1
+    )
+    unique, inverse = np.unique(turbines, axis=0, return_inverse=True)
+    cut_in, rated_speed, cut_out = get_turbine_speeds(
+        unique[:, 1], unique[:, 2], archetype_user_input.get("rated_wind_speed", DEFAULT_RATED_SPEED)
+    )
+
+    turbine_production = get_wind_series(wind_data, job_data.country).lifetime_energy(
+        unique[:, 0], cut_in, rated_speed, cut_out, general_user_inputs["project_lifetime"]
+    )
+    number_of_turbines = archetype_user_input["capacity"] / unique[:, :1]
+    lifetime_production = (number_of_turbines * turbine_production)[inverse.reshape(-1)]
+    return {
+        "production": lifetime_production.mean(axis=1),
+        "lifetime_production": lifetime_production,
+    }
@@ -0,0 +1,165 @@
+# Install packages
+from math import gamma
+
+import numpy as np
+
+HOURS_PER_YEAR = 8760
+REFERENCE_AIR_DENSITY = 1.225  # kg/m3, density of the reference power curve
+DEFAULT_CUT_IN_SPEED = 3.0
+DEFAULT_RATED_SPEED = 12.0
+DEFAULT_CUT_OUT_SPEED = 25.0
+
+# Chronology of the synthetic Weibull year: a seeded weather sequence with spells of a few days and windier winters
+WEATHER_SEED = 2024
+SPELL_HOURS = 60.0  # decay time of the weather sequence
+SEASONAL_AMPLITUDE = 0.5  # winter to summer swing, relative to the spread of the sequence
+
+
+def get_turbine_speeds(cut_in, cut_out, rated_speed=DEFAULT_RATED_SPEED):
+    """Cleans the power curve speeds of turbine options
+
+    Missing cut-in speeds use DEFAULT_CUT_IN_SPEED; a cut-out speed that is missing or not above the cut-in speed
+    (as in the dummy vendor data) uses DEFAULT_CUT_OUT_SPEED. The rated speed is clipped into [cut-in, cut-out].
+
+    Args:
+        cut_in (array_like): cut-in wind speed per option
+        cut_out (array_like): cut-out wind speed per option
+        rated_speed (array_like): wind speed at which the rated power is reached
+
+    Returns:
+        _tuple_: cut-in, rated and cut-out speed arrays
+    """
+    cut_in = np.asarray(cut_in, dtype=float)
+    cut_in = np.where(np.isnan(cut_in), DEFAULT_CUT_IN_SPEED, cut_in)
+    cut_out = np.asarray(cut_out, dtype=float)
+    cut_out = np.where(np.isnan(cut_out) | (cut_out <= cut_in), np.maximum(DEFAULT_CUT_OUT_SPEED, cut_in), cut_out)
+    rated_speed = np.clip(np.asarray(rated_speed, dtype=float), cut_in, cut_out)
+    return np.broadcast_arrays(cut_in, rated_speed, cut_out)
+
+
+def power_curve(wind_speed, rated_power, cut_in, rated_speed, cut_out) -> np.ndarray:
+    """Turbine power at the given wind speeds: cubic from cut-in to rated speed, rated power up to cut-out.
+    All arguments broadcast, e.g. options x 1 turbine data against an hourly wind speed series
+
+    Returns:
+        np.ndarray: power in the unit of rated_power
+    """
+    wind_speed = np.asarray(wind_speed, dtype=float)
+    partial = (wind_speed**3 - cut_in**3) / np.maximum(rated_speed**3 - cut_in**3, 1e-12)
+    return rated_power * np.where(
+        (wind_speed < cut_in) | (wind_speed >= cut_out), 0.0, np.where(wind_speed < rated_speed, partial, 1.0)
+    )
+
+
+def get_weather_sequence(hours: int) -> np.ndarray:
+    """Seeded weather sequence: white noise smoothed with an exponential kernel of SPELL_HOURS plus a yearly cycle
+    peaking at the start of the year (deterministic)"""
+    noise = np.random.default_rng(WEATHER_SEED).standard_normal(hours)
+    kernel = np.exp(-np.arange(int(5 * SPELL_HOURS)) / SPELL_HOURS)
+    sequence = np.convolve(noise, kernel)[:hours]
+    sequence /= sequence.std()
+    return sequence + SEASONAL_AMPLITUDE * np.cos(2 * np.pi * np.arange(hours) / hours)
+
+
+class WindSeries:
+    """Hourly wind speed series of one or more years, prepared for power curve evaluation.
+
+    Speeds are density corrected to the reference air density (v * (rho / rho_ref) ** (1/3)). Energy does not
+    depend on the order of the hours, so every year is kept sorted with prefix sums of the cubed speeds: the
+    energy of a turbine then needs a few binary searches per year instead of a pass over all hours.
+    """
+
+    def __init__(self, wind_speed: np.ndarray, air_density: np.ndarray | float = REFERENCE_AIR_DENSITY):
+        """
+        Args:
+            wind_speed (np.ndarray): hourly wind speeds, years x hours (or a single year of hours)
+            air_density (np.ndarray | float): hourly air density, broadcast against wind_speed
+        """
+        wind_speed = np.atleast_2d(np.asarray(wind_speed, dtype=float))
+        self.speeds = wind_speed * (np.asarray(air_density, dtype=float) / REFERENCE_AIR_DENSITY) ** (1 / 3)
+        self.sorted_speeds = np.sort(self.speeds, axis=1)
+        self.cubed_sums = np.concatenate(
+            (np.zeros((len(self), 1)), np.cumsum(self.sorted_speeds**3, axis=1)), axis=1
+        )
+
+    def __len__(self) -> int:
+        """Number of years"""
+        return self.speeds.shape[0]
+
+    @classmethod
+    def from_weibull(
+        cls, mean_speed: float, air_density: float, shape: float = 2.0, hours: int = HOURS_PER_YEAR
+    ) -> "WindSeries":
+        """One year of hourly speeds following a Weibull distribution with the given mean (deterministic quantiles).
+        The quantiles are put in the order of a seeded, autocorrelated weather sequence, so the year has calm and
+        windy spells for chronological models (e.g. storage); order independent results only see the quantiles"""
+        scale = mean_speed / gamma(1 + 1 / shape)
+        quantiles = (np.arange(hours) + 0.5) / hours
+        speeds = scale * (-np.log1p(-quantiles)) ** (1 / shape)
+        return cls(speeds[np.argsort(np.argsort(get_weather_sequence(hours), kind="stable"))], air_density)
+
+    @classmethod
+    def from_resource(cls, wind_data, country: str, shape: float = 2.0) -> "WindSeries":
+        """Wind series of a country from the wind resource data
+
+        Uses the "hourly" sheet (rows of country, wind, airDensity; 8760 per year) when the resource has one,
+        otherwise a Weibull year around the mean wind speed and air density of "sheet1".
+        """
+        if "hourly" in wind_data:
+            hourly = wind_data["hourly"]
+            hourly = hourly[hourly["country"] == country]
+            speeds = hourly["wind"].to_numpy(dtype=float)
+            densities = hourly["airDensity"].to_numpy(dtype=float)
+            years = max(1, len(speeds) // HOURS_PER_YEAR)
+            hours = years * HOURS_PER_YEAR if len(speeds) >= HOURS_PER_YEAR else len(speeds)
+            return cls(speeds[:hours].reshape(years, -1), densities[:hours].reshape(years, -1))
+
+        concept_wind = wind_data.get_country("sheet1", country)
+        return cls.from_weibull(concept_wind["wind"], concept_wind["airDensity"], shape=shape)
+
+    def hourly_power(self, rated_power, cut_in, rated_speed, cut_out, year: int = 0) -> np.ndarray:
+        """Power per option and hour of a year (options x hours)"""
+        return power_curve(
+            self.speeds[year][None, :],
+            np.asarray(rated_power, dtype=float)[:, None],
+            np.asarray(cut_in, dtype=float)[:, None],
+            np.asarray(rated_speed, dtype=float)[:, None],
+            np.asarray(cut_out, dtype=float)[:, None],
+        )
+
+    def annual_energy(self, rated_power, cut_in, rated_speed, cut_out) -> np.ndarray:
+        """Energy per turbine option and year (options x years), the sum of the hourly power over each year
+
+        Args:
+            rated_power (array_like): rated power per option
+            cut_in, rated_speed, cut_out (array_like): power curve speeds per option (see get_turbine_speeds)
+
+        Returns:
+            np.ndarray: energy in rated power unit x hours
+        """
+        rated_power, cut_in, rated_speed, cut_out = (
+            np.atleast_1d(np.asarray(x, dtype=float)) for x in (rated_power, cut_in, rated_speed, cut_out)
+        )
+        energy = np.empty((len(rated_power), len(self)))
+        for year in range(len(self)):
+            speeds, cubed_sums = self.sorted_speeds[year], self.cubed_sums[year]
+            start, rated, stop = (np.searchsorted(speeds, x, side="left") for x in (cut_in, rated_speed, cut_out))
+            # hours between cut-in and rated speed follow the cubic part of the curve, then rated power
+            partial_hours = rated - start
+            partial = (cubed_sums[rated] - cubed_sums[start] - partial_hours * cut_in**3) / np.maximum(
+                rated_speed**3 - cut_in**3, 1e-12
+            )
+            energy[:, year] = rated_power * (partial + (stop - rated))
+        return energy
+
+    def lifetime_energy(self, rated_power, cut_in, rated_speed, cut_out, lifetime: int) -> np.ndarray:
+        """Energy per option and operating year (options x lifetime), repeating the available years cyclically"""
+        annual = self.annual_energy(rated_power, cut_in, rated_speed, cut_out)
+        return annual[:, np.arange(lifetime) % len(self)]
+
+
+def get_wind_series(wind_data, country: str, shape: float = 2.0) -> WindSeries:
+    """Gets the WindSeries of a country, built once per loaded wind resource"""
+    return wind_data.get_derived(
+        ("wind_series", country, shape), lambda data: WindSeries.from_resource(data, country, shape=shape)
+    )
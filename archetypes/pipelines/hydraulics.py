@@ -0,0 +1,154 @@
+# Install packages
+import numpy as np
+
+GRAVITY = 9.81  # m/s2
+GAS_CONSTANT = 8.314  # J/(mol K)
+TEMPERATURE = 288.15  # K, temperature of the fluid in the buried or subsea pipe
+
+# Inner diameters of the candidate pipes in m
+CANDIDATE_DIAMETERS = np.array([0.15, 0.2, 0.25, 0.3, 0.4, 0.5, 0.6, 0.75, 0.9, 1.05, 1.2])
+
+# Transported fluids: gases follow the isothermal gas flow equation, dense phase fluids are incompressible
+FLUIDS = {
+    "hydrogen": {
+        "compressible": True,
+        "molar_mass": 2.016e-3,  # kg/mol
+        "viscosity": 8.9e-6,  # Pa s
+        "compressibility": 1.05,
+        "heat_capacity_ratio": 1.41,
+    },
+    "co2": {
+        "compressible": False,
+        "density": 800.0,  # kg/m3, dense phase
+        "viscosity": 7.0e-5,  # Pa s
+    },
+}
+
+
+class Route:
+    """Pipeline route as arrays over its segments: length (km), elevation change (m) and offshore flag"""
+
+    def __init__(self, length: np.ndarray, elevation: np.ndarray, offshore: np.ndarray):
+        self.length = np.asarray(length, dtype=float)
+        self.elevation = np.asarray(elevation, dtype=float)
+        self.offshore = np.asarray(offshore, dtype=bool)
+
+    def __len__(self) -> int:
+        """Number of segments"""
+        return len(self.length)
+
+    @property
+    def total_length(self) -> float:
+        return float(self.length.sum())
+
+    @classmethod
+    def from_resource(cls, pipelines_data, country: str) -> "Route":
+        """Route of a country from the "route" sheet of the pipelines resource data (rows of country, segment,
+        length, elevation, offshore)"""
+        route = pipelines_data["route"]
+        route = route[route["country"] == country].sort_values("segment")
+        return cls(
+            route["length"].to_numpy(dtype=float),
+            route["elevation"].to_numpy(dtype=float),
+            route["offshore"].to_numpy(dtype=bool),
+        )
+
+    def get_weighted_length(self, offshore_factor: float) -> float:
+        """Route length with the offshore segments weighted by a factor, e.g. for construction cost"""
+        return float((self.length * np.where(self.offshore, offshore_factor, 1.0)).sum())
+
+
+def get_route(pipelines_data, country: str) -> Route:
+    """Gets the Route of a country, built once per loaded pipelines resource"""
+    return pipelines_data.get_derived(("route", country), lambda data: Route.from_resource(data, country))
+
+
+def friction_factor(diameter, roughness, reynolds) -> np.ndarray:
+    """Darcy friction factor of turbulent pipe flow (Swamee-Jain). Arguments broadcast
+
+    Args:
+        diameter (array_like): inner diameter in m
+        roughness (array_like): absolute wall roughness in m
+        reynolds (array_like): Reynolds number
+    """
+    return 0.25 / np.log10(roughness / (3.7 * diameter) + 5.74 / reynolds**0.9) ** 2
+
+
+def size_pipeline(
+    route: Route,
+    fluid: str,
+    flow_rate: float,
+    outlet_pressure: float,
+    roughness,
+    diameters: np.ndarray = CANDIDATE_DIAMETERS,
+) -> dict:
+    """Hydraulics of every pipe option x candidate diameter x route segment in one pass
+
+    The pressure drop of each segment is evaluated for all combinations, accumulated along the route and the
+    inlet pressure is the lowest one keeping the pressure at every segment end above the outlet pressure.
+    Gases use the isothermal gas flow equation (p_in^2 - p_out^2 per segment; the elevation term of a light gas
+    is neglected), dense phase fluids the Darcy-Weisbach equation with the hydrostatic head.
+
+    Args:
+        route (Route): pipeline route
+        fluid (str): transported fluid, a key of FLUIDS
+        flow_rate (float): mass flow in kg/s
+        outlet_pressure (float): minimum pressure along the route and at the outlet in bar
+        roughness (array_like): wall roughness per pipe option in mm
+        diameters (np.ndarray): candidate inner diameters in m
+
+    Returns:
+        _dict_: inlet_pressure (bar) and velocity (m/s), each pipe options x diameters
+    """
+    properties = FLUIDS[fluid]
+    roughness = np.atleast_1d(np.asarray(roughness, dtype=float))[:, None, None] / 1000
+    diameter = np.asarray(diameters, dtype=float)[None, :, None]
+    length = route.length[None, None, :] * 1000
+    area = np.pi * diameter**2 / 4
+    reynolds = 4 * flow_rate / (np.pi * diameter * properties["viscosity"])
+    friction = friction_factor(diameter, roughness, reynolds)
+    outlet = outlet_pressure * 1e5
+
+    if properties["compressible"]:
+        gas_constant = properties["compressibility"] * GAS_CONSTANT * TEMPERATURE / properties["molar_mass"]
+        # drop of the squared pressure per segment, Pa^2
+        drop = 16 * friction * length * flow_rate**2 * gas_constant / (np.pi**2 * diameter**5)
+        highest = np.maximum(np.cumsum(drop, axis=-1).max(axis=-1), 0.0)
+        inlet = np.sqrt(outlet**2 + highest)
+        # the gas is fastest at the lowest pressure
+        velocity = flow_rate * gas_constant / (outlet * area)
+    else:
+        density = properties["density"]
+        velocity = flow_rate / (density * area)
+        drop = friction * length / diameter * density * velocity**2 / 2 + density * GRAVITY * route.elevation
+        highest = np.maximum(np.cumsum(drop, axis=-1).max(axis=-1), 0.0)
+        inlet = outlet + highest
+
+    return {
+        "inlet_pressure": inlet / 1e5,
+        "velocity": np.broadcast_to(velocity[..., 0], inlet.shape),
+    }
+
+
+def compression_duty(fluid: str, flow_rate: float, supply_pressure: float, inlet_pressure, efficiency) -> np.ndarray:
+    """Power needed to raise the fluid from the supply pressure to the pipeline inlet pressure
+
+    Args:
+        fluid (str): transported fluid, a key of FLUIDS
+        flow_rate (float): mass flow in kg/s
+        supply_pressure (float): pressure at which the fluid is delivered in bar
+        inlet_pressure (array_like): required inlet pressure in bar
+        efficiency (array_like): isentropic (compressor) or hydraulic (pump) efficiency, 0-1
+
+    Returns:
+        np.ndarray: duty in MW (0 where no compression is needed)
+    """
+    properties = FLUIDS[fluid]
+    inlet_pressure = np.maximum(np.asarray(inlet_pressure, dtype=float), supply_pressure)
+    if properties["compressible"]:
+        gas_constant = properties["compressibility"] * GAS_CONSTANT * TEMPERATURE / properties["molar_mass"]
+        exponent = (properties["heat_capacity_ratio"] - 1) / properties["heat_capacity_ratio"]
+        work = gas_constant / exponent * ((inlet_pressure / supply_pressure) ** exponent - 1)
+    else:
+        work = (inlet_pressure - supply_pressure) * 1e5 / properties["density"]
+    return flow_rate * work / efficiency / 1e6
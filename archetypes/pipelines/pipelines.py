@@ -1,8 +1,129 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-from archetypes.pipelines.pipelines_metrics import get_pipelines_metrics
+from archetypes.pipelines.pipelines_metrics import (
+    get_layout,
+    get_pipeline_sizing,
+    get_pipeline_sizing_batch,
+    get_throughput,
+    get_trl,
+    get_trl_batch,
+)
+from src.instrumentation import instrument
 
-def pipelines():
-    pass
\ No newline at end of file
+
+@instrument()
+def pipelines(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    choices: dict[int, dict],
+    job_data: dict,
+    pipelines_data,
+):
+    """Calculates the relevant design outputs for the pipelines archetype
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY pipelines specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        pipelines_data (ResourceData): pipeline route data (segments of the route per country)
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production, throughput and the selected
+            sizing. The pipeline produces no energy (production 0 MWh), the transported mass per year (t) is
+            reported as throughput and stays out of the LCOX
+    """
+    sizing = get_pipeline_sizing(
+        wacc_real=wacc_real,
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        choices=choices,
+        pipelines_data=pipelines_data,
+    )
+
+    # Output calculation
+    layout = float(get_layout(sizing["route_length"]))
+    trl = get_trl(choices)["trl"]
+    capex = sizing["capex"]
+    opex = sizing["opex"]
+    stack_replacement_cost = 0
+    stack_replacement_time = 0
+    degradation_rate = 0
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": 0,
+        "throughput": get_throughput(archetype_user_input),
+        "diameter": sizing["diameter"],
+        "inlet_pressure": sizing["inlet_pressure"],
+        "compressor_duty": sizing["compressor_duty"],
+    }
+
+
+@instrument()
+def pipelines_batch(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    design_properties,
+    job_data: dict,
+    pipelines_data,
+):
+    """Calculates the pipelines design outputs for a batch of designs in one vectorised pass
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY pipelines specific user input
+        design_properties (DesignProperties): Chosen option properties per design
+        job_data (dict): Contains all archetype and vendor data
+        pipelines_data (ResourceData): pipeline route data (segments of the route per country)
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production (0 MWh), throughput (t per
+            year) and the selected sizing - one array entry per design
+    """
+    sizing = get_pipeline_sizing_batch(
+        wacc_real=wacc_real,
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+        pipelines_data=pipelines_data,
+    )
+
+    # Output calculation
+    number_of_designs = len(design_properties)
+
+    layout = get_layout(sizing["route_length"])
+    trl = get_trl_batch(design_properties)["trl"]
+    capex = sizing["capex"]
+    opex = sizing["opex"]
+    stack_replacement_cost = np.zeros(number_of_designs)
+    stack_replacement_time = np.zeros(number_of_designs)
+    degradation_rate = np.zeros(number_of_designs)
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": np.zeros(number_of_designs),
+        "throughput": np.full(number_of_designs, get_throughput(archetype_user_input), dtype=float),
+        "diameter": sizing["diameter"],
+        "inlet_pressure": sizing["inlet_pressure"],
+        "compressor_duty": sizing["compressor_duty"],
+    }
@@ -1,6 +1,221 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-def get_pipelines_metrics():
-    pass
\ No newline at end of file
+from archetypes.pipelines.hydraulics import CANDIDATE_DIAMETERS, compression_duty, get_route, size_pipeline
+from economics_package.discounting import get_annuity_factor
+from src.instrumentation import instrument
+from src.utilities import fill_missing, get_option_data, to_float
+
+# Block uuids of the pipeline sub-systems
+PIPE_BLOCK_UUID = "b273f4fa-3975-4ced-a08c-b8263ddc5e0a"
+COMPRESSOR_BLOCK_UUID = "c1ab1864-3487-4fad-bd01-a84fb279967c"
+
+# Option property values used where an option does not provide them
+DEFAULT_ROUGHNESS = 0.045  # mm
+DEFAULT_MAX_PRESSURE = 100.0  # bar
+DEFAULT_COST_FACTOR = 1.0
+DEFAULT_COMPRESSOR_EFFICIENCY = 75.0  # %
+DEFAULT_COMPRESSOR_COST = 3.0  # per MW
+
+# Option properties read by the sizing
+PIPE_PROPERTIES = ("roughness", "maxpressure", "costfactor")
+COMPRESSOR_PROPERTIES = ("efficiency", "costpermw")
+
+# DUMMY cost figures
+PIPE_COST = 2.0  # per km and m of diameter
+OFFSHORE_COST_FACTOR = 2.0
+PIPE_OPEX_SHARE = 0.02  # of the pipe capex per year
+POWER_COST = 5e-5  # per MWh of compression (capex figures are in millions)
+FULL_LOAD_HOURS = 8000
+
+
+@instrument()
+def get_pipeline_sizing(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    job_data: dict,
+    choices: dict[int, dict],
+    pipelines_data,
+):
+    """Sizes the pipeline of the chosen pipe and compressor: the diameter with the lowest lifetime cost among the
+    candidates meeting the material pressure rating and the velocity limit (see hydraulics.size_pipeline)
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY pipelines specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        pipelines_data (ResourceData): pipeline route data
+
+    Returns:
+        _dict_: diameter (m), inlet pressure (bar), compressor duty (MW), pipe and compressor capex and opex of
+            the selected configuration (NaN if no candidate is feasible)
+    """
+    pipe_data = get_option_data(choices, PIPE_BLOCK_UUID)
+    compressor_data = get_option_data(choices, COMPRESSOR_BLOCK_UUID)
+    options = get_options_batch(
+        {name: np.array([to_float(pipe_data.get(name))]) for name in PIPE_PROPERTIES},
+        {name: np.array([to_float(compressor_data.get(name))]) for name in COMPRESSOR_PROPERTIES},
+    )
+    sizing = _get_pipeline_sizing(
+        wacc_real, general_user_inputs, archetype_user_input, job_data, pipelines_data, options
+    )
+    return {key: value[0] for key, value in sizing.items()}
+
+
+def _get_pipeline_sizing(wacc_real, general_user_inputs, archetype_user_input, job_data, pipelines_data, options):
+    """Cheapest feasible configuration per option (arrays over the options)"""
+    route = get_route(pipelines_data, job_data.country)
+    fluid = archetype_user_input["fluid"]
+    flow_rate = archetype_user_input["flow_rate"]
+    hydraulics = size_pipeline(
+        route, fluid, flow_rate, archetype_user_input["outlet_pressure"], options["roughness"], CANDIDATE_DIAMETERS
+    )
+    duty = compression_duty(
+        fluid,
+        flow_rate,
+        archetype_user_input["supply_pressure"],
+        hydraulics["inlet_pressure"],
+        options["compressor_efficiency"][:, None],
+    )
+
+    # options x diameters costs
+    pipe_capex = (
+        PIPE_COST
+        * CANDIDATE_DIAMETERS[None, :]
+        * options["cost_factor"][:, None]
+        * route.get_weighted_length(OFFSHORE_COST_FACTOR)
+    )
+    compressor_capex = duty * options["compressor_cost"][:, None]
+    opex = PIPE_OPEX_SHARE * pipe_capex + duty * FULL_LOAD_HOURS * POWER_COST
+    lifetime_cost = (
+        pipe_capex
+        + compressor_capex
+        + opex * get_annuity_factor(wacc_real, general_user_inputs["project_lifetime"])
+    )
+    feasible = (hydraulics["inlet_pressure"] <= options["max_pressure"][:, None]) & (
+        hydraulics["velocity"] <= archetype_user_input["max_velocity"]
+    )
+
+    selected = np.argmin(np.where(feasible, lifetime_cost, np.inf), axis=1)
+    rows = np.arange(len(selected))
+    any_feasible = feasible.any(axis=1)
+
+    def pick(values):
+        return np.where(any_feasible, values[rows, selected], np.nan)
+
+    return {
+        "diameter": np.where(any_feasible, CANDIDATE_DIAMETERS[selected], np.nan),
+        "inlet_pressure": pick(hydraulics["inlet_pressure"]),
+        "velocity": pick(hydraulics["velocity"]),
+        "compressor_duty": pick(duty),
+        "capex": pick(pipe_capex + compressor_capex),
+        "opex": pick(opex),
+        "route_length": np.full(len(selected), route.total_length),
+    }
+
+
+def get_throughput(archetype_user_input: dict) -> float:
+    """Transported mass per year in tonnes"""
+    return archetype_user_input["flow_rate"] * 3600 * FULL_LOAD_HOURS / 1000
+
+
+def get_layout(route_length, corridor_width: float = 20.0):
+    """Calculates the footprint of the pipeline corridor
+
+    Args:
+        route_length (array_like): route length in km
+        corridor_width (float): width of the right of way in m
+
+    Returns:
+        _float_: corridor area in m^sq
+    """
+    return np.asarray(route_length, dtype=float) * 1000 * corridor_width
+
+
+@instrument()
+def get_trl(choices: dict[int, dict]):
+    """Gets the TRL of the pipeline: the least mature of the chosen pipe and compressor (0 if unknown)
+
+    Args:
+        choices (dict[int, dict]): Chosen project design
+
+    Returns:
+        _dict_: technology readiness level
+    """
+    trl = [
+        to_float(get_option_data(choices, block_uuid).get("trlmaturity"))
+        for block_uuid in (PIPE_BLOCK_UUID, COMPRESSOR_BLOCK_UUID)
+    ]
+    trl = [value for value in trl if not np.isnan(value)]
+    return {"trl": min(trl) if trl else 0}
+
+
+# BATCH versions: the same calculations over a batch of designs, one array entry per design
+def get_options_batch(pipe_columns, compressor_columns) -> dict:
+    """Pipe and compressor properties from property columns, with defaults where missing"""
+    return {
+        "roughness": fill_missing(pipe_columns["roughness"], DEFAULT_ROUGHNESS),
+        "max_pressure": fill_missing(pipe_columns["maxpressure"], DEFAULT_MAX_PRESSURE),
+        "cost_factor": fill_missing(pipe_columns["costfactor"], DEFAULT_COST_FACTOR),
+        "compressor_efficiency": fill_missing(compressor_columns["efficiency"], DEFAULT_COMPRESSOR_EFFICIENCY) / 100,
+        "compressor_cost": fill_missing(compressor_columns["costpermw"], DEFAULT_COMPRESSOR_COST),
+    }
+
+
+@instrument()
+def get_pipeline_sizing_batch(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    job_data: dict,
+    design_properties,
+    pipelines_data,
+) -> dict:
+    """Sizes the pipeline for a batch of designs. Every distinct pipe and compressor combination is sized once,
+    all combinations x diameters x segments in one pass (see get_pipeline_sizing)
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY pipelines specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+        pipelines_data (ResourceData): pipeline route data
+
+    Returns:
+        _dict_: sizing of the selected configuration per design
+    """
+    options = get_options_batch(
+        {name: design_properties.get(PIPE_BLOCK_UUID, name) for name in PIPE_PROPERTIES},
+        {name: design_properties.get(COMPRESSOR_BLOCK_UUID, name) for name in COMPRESSOR_PROPERTIES},
+    )
+    names = list(options)
+    unique, inverse = np.unique(np.stack([options[name] for name in names], axis=1), axis=0, return_inverse=True)
+    sizing = _get_pipeline_sizing(
+        wacc_real,
+        general_user_inputs,
+        archetype_user_input,
+        job_data,
+        pipelines_data,
+        {name: unique[:, column] for column, name in enumerate(names)},
+    )
+    return {key: value[inverse.reshape(-1)] for key, value in sizing.items()}
+
+
+def get_trl_batch(design_properties) -> dict:
+    """Gets the TRL for a batch of designs (see get_trl)
+
+    Args:
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _dict_: technology readiness level per design
+    """
+    trl = np.fmin(
+        design_properties.get(PIPE_BLOCK_UUID, "trlmaturity"),
+        design_properties.get(COMPRESSOR_BLOCK_UUID, "trlmaturity"),
+    )
+    return {"trl": np.nan_to_num(trl, nan=0.0)}
@@ -0,0 +1,143 @@
+# Install packages
+import importlib
+from typing import Callable, Iterable
+
+from src.utilities import Archetypes
+
+
+class ArchetypeSpec:
+    """Declares how an archetype is evaluated: its engineering module and functions and the resource data the
+    engineering needs.
+
+    Engineering functions are called with the keyword arguments wacc_real, general_user_inputs,
+    archetype_user_input, job_data, choices (design_properties for the batch function) and one
+    <resource>_data argument per declared resource. An archetype without engineering functions has no model yet
+    and is skipped by the engineering block.
+    """
+
+    def __init__(
+        self,
+        archetype: Archetypes,
+        module: str | None = None,
+        engineering: str | None = None,
+        engineering_batch: str | None = None,
+        resources: tuple[str, ...] = (),
+    ):
+        """
+        Args:
+            archetype (Archetypes): archetype
+            module (str, optional): module holding the engineering functions, imported on first use
+            engineering (str, optional): name of the engineering function of one design
+            engineering_batch (str, optional): name of the vectorised engineering function of many designs
+            resources (tuple[str, ...]): resource data names read with metrics.get_data, e.g. ("wind",)
+        """
+        self.archetype = archetype
+        self.module = module
+        self.engineering = engineering
+        self.engineering_batch = engineering_batch
+        self.resources = tuple(resources)
+        self._functions = {}
+
+    def __repr__(self) -> str:
+        return f"ArchetypeSpec({self.archetype.value!r}, {self.module!r})"
+
+    def get_function(self, name: str | None) -> Callable | None:
+        """Imports the archetype module and gets one of its functions (None if not declared)"""
+        if name is None:
+            return None
+        function = self._functions.get(name)
+        if function is None:
+            function = self._functions[name] = getattr(importlib.import_module(self.module), name)
+        return function
+
+
+REGISTRY: dict[Archetypes, ArchetypeSpec] = {}
+
+
+def register(spec: ArchetypeSpec) -> ArchetypeSpec:
+    """Adds (or replaces) the spec of an archetype in the registry"""
+    REGISTRY[spec.archetype] = spec
+    return spec
+
+
+def get_spec(arc: str) -> ArchetypeSpec:
+    """Gets the spec of an archetype
+
+    Args:
+        arc (str): archetype name as in job_data.archetypes
+
+    Returns:
+        ArchetypeSpec: registered spec
+    """
+    # Archetypes members are str, so the registry is looked up by the plain archetype name as well
+    spec = REGISTRY.get(arc)
+    if spec is None:
+        raise KeyError(f"Archetype is not registered: {arc}")
+    return spec
+
+
+def get_resources(archetypes: Iterable[str]) -> tuple[str, ...]:
+    """Resource data names needed by the engineering of the given archetypes, in order and without duplicates"""
+    resources = {}
+    for arc in archetypes:
+        resources.update(dict.fromkeys(get_spec(arc).resources))
+    return tuple(resources)
+
+
+register(
+    ArchetypeSpec(
+        Archetypes.OFFSHORE_WIND,
+        "archetypes.offshore_wind.offshore_wind",
+        engineering="offshore_wind",
+        engineering_batch="offshore_wind_batch",
+        resources=("wind",),
+    )
+)
+register(
+    ArchetypeSpec(
+        Archetypes.SOLAR,
+        "archetypes.solar.solar",
+        engineering="solar",
+        engineering_batch="solar_batch",
+        resources=("solar",),
+    )
+)
+register(
+    ArchetypeSpec(
+        Archetypes.GREEN_HYDROGEN,
+        "archetypes.green_hydrogen.green_hydrogen",
+        engineering="green_hydrogen",
+        engineering_batch="green_hydrogen_batch",
+        resources=("wind",),
+    )
+)
+register(
+    ArchetypeSpec(
+        Archetypes.PIPELINES,
+        "archetypes.pipelines.pipelines",
+        engineering="pipelines",
+        engineering_batch="pipelines_batch",
+        resources=("pipelines",),
+    )
+)
+register(
+    ArchetypeSpec(
+        Archetypes.CARBON_CAPTURE,
+        "archetypes.carbon_capture.carbon_capture",
+        engineering="carbon_capture",
+        engineering_batch="carbon_capture_batch",
+        resources=("carbon_capture",),
+    )
+)
+register(
+    ArchetypeSpec(
+        Archetypes.AMMONIA,
+        "archetypes.ammonia.ammonia",
+        engineering="ammonia",
+        engineering_batch="ammonia_batch",
+        resources=("wind",),
+    )
+)
+# no engineering model yet: jobs with these archetypes evaluate the others
+register(ArchetypeSpec(Archetypes.BLUE_HYDROGEN))
+register(ArchetypeSpec(Archetypes.CARBON_LIQUEFACTION))
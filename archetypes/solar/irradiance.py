@@ -0,0 +1,187 @@
+# Install packages
+import numpy as np
+
+HOURS_PER_YEAR = 8760
+STC_IRRADIANCE = 1000.0  # W/m2, irradiance of the module rating
+STC_TEMPERATURE = 25.0  # degC, cell temperature of the module rating
+NOCT_IRRADIANCE = 800.0  # W/m2, irradiance of the nominal operating cell temperature
+NOCT_AMBIENT = 20.0  # degC, ambient temperature of the nominal operating cell temperature
+
+
+def get_cell_temperature(irradiance, ambient_temperature, noct) -> np.ndarray:
+    """Cell temperature from the nominal operating cell temperature (NOCT) model"""
+    return ambient_temperature + irradiance * (noct - NOCT_AMBIENT) / NOCT_IRRADIANCE
+
+
+def dc_power(irradiance, ambient_temperature, temperature_coefficient, noct) -> np.ndarray:
+    """DC power per unit of rated (STC) module power. All arguments broadcast, e.g. panel options x 1 against
+    years x hours of irradiance and temperature
+
+    Args:
+        irradiance (array_like): plane of array irradiance in W/m2
+        ambient_temperature (array_like): ambient temperature in degC
+        temperature_coefficient (array_like): power temperature coefficient in %/degC (negative)
+        noct (array_like): nominal operating cell temperature in degC
+
+    Returns:
+        np.ndarray: DC power relative to the rated power
+    """
+    cell_temperature = get_cell_temperature(irradiance, ambient_temperature, noct)
+    power = irradiance / STC_IRRADIANCE * (1 + temperature_coefficient / 100 * (cell_temperature - STC_TEMPERATURE))
+    return np.maximum(power, 0.0)
+
+
+class SolarSeries:
+    """Hourly irradiance and ambient temperature of one or more years, prepared for PV yield evaluation.
+
+    Energy does not depend on the order of the hours, so the DC power profile of every panel type is kept
+    sorted with prefix sums: the inverter clipping of any panel and inverter combination then needs one
+    binary search per year instead of a pass over all hours. Profiles are built once per panel type and
+    all missing panel types are built together as one (panels x years x hours) array.
+    """
+
+    def __init__(self, irradiance: np.ndarray, ambient_temperature: np.ndarray):
+        """
+        Args:
+            irradiance (np.ndarray): hourly plane of array irradiance in W/m2, years x hours (or a single year)
+            ambient_temperature (np.ndarray): hourly ambient temperature in degC, broadcast against irradiance
+        """
+        self.irradiance = np.atleast_2d(np.asarray(irradiance, dtype=float))
+        self.ambient_temperature = np.broadcast_to(
+            np.asarray(ambient_temperature, dtype=float), self.irradiance.shape
+        )
+        # (temperature coefficient, noct) -> sorted DC profiles and their prefix sums, years x hours
+        self._profiles = {}
+
+    def __len__(self) -> int:
+        """Number of years"""
+        return self.irradiance.shape[0]
+
+    @classmethod
+    def from_climate(
+        cls, irradiation: float, mean_temperature: float, latitude: float, hours: int = HOURS_PER_YEAR
+    ) -> "SolarSeries":
+        """One clear-sky shaped year of hourly irradiance scaled to the annual irradiation, with seasonal and
+        daily temperature cycles around the mean temperature (deterministic)
+
+        Args:
+            irradiation (float): annual irradiation in kWh/m2
+            mean_temperature (float): mean ambient temperature in degC
+            latitude (float): latitude in degrees
+            hours (int): hours of the year
+        """
+        hour = np.arange(hours) + 0.5
+        day = hour // 24
+        hour_of_day = hour % 24
+        declination = np.radians(23.44) * np.sin(2 * np.pi * (284 + day) / 365)
+        hour_angle = np.radians(15 * (hour_of_day - 12))
+        latitude = np.radians(latitude)
+        elevation = np.sin(latitude) * np.sin(declination) + np.cos(latitude) * np.cos(declination) * np.cos(
+            hour_angle
+        )
+        profile = np.maximum(elevation, 0.0)
+        irradiance = profile * irradiation * 1000 / max(profile.sum(), 1e-12)
+
+        seasonal = -8.0 * np.cos(2 * np.pi * (day - 15) / 365)
+        daily = -4.0 * np.cos(2 * np.pi * (hour_of_day - 3) / 24)
+        return cls(irradiance, mean_temperature + seasonal + daily)
+
+    @classmethod
+    def from_resource(cls, solar_data, country: str) -> "SolarSeries":
+        """Solar series of a country from the solar resource data
+
+        Uses the "hourly" sheet (rows of country, irradiance, temperature; 8760 per year) when the resource has
+        one, otherwise a clear-sky year from the irradiation, temperature and latitude of "sheet1".
+        """
+        if "hourly" in solar_data:
+            hourly = solar_data["hourly"]
+            hourly = hourly[hourly["country"] == country]
+            irradiance = hourly["irradiance"].to_numpy(dtype=float)
+            temperature = hourly["temperature"].to_numpy(dtype=float)
+            years = max(1, len(irradiance) // HOURS_PER_YEAR)
+            hours = years * HOURS_PER_YEAR if len(irradiance) >= HOURS_PER_YEAR else len(irradiance)
+            return cls(irradiance[:hours].reshape(years, -1), temperature[:hours].reshape(years, -1))
+
+        concept_solar = solar_data.get_country("sheet1", country)
+        return cls.from_climate(concept_solar["irradiation"], concept_solar["temperature"], concept_solar["latitude"])
+
+    def hourly_power(self, temperature_coefficient, noct, year: int = 0) -> np.ndarray:
+        """DC power per unit of rated power, per panel option and hour of a year (options x hours)"""
+        return dc_power(
+            self.irradiance[year][None, :],
+            self.ambient_temperature[year][None, :],
+            np.asarray(temperature_coefficient, dtype=float)[:, None],
+            np.asarray(noct, dtype=float)[:, None],
+        )
+
+    def get_profiles(self, panels: np.ndarray) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Sorted DC profiles and prefix sums (years x hours) of panel types, building the missing ones at once
+
+        Args:
+            panels (np.ndarray): (temperature coefficient, noct) per panel type, panels x 2
+
+        Returns:
+            _list_: (sorted DC power, prefix sums) per panel type
+        """
+        keys = [tuple(panel) for panel in np.asarray(panels, dtype=float).tolist()]
+        missing = [key for key in dict.fromkeys(keys) if key not in self._profiles]
+        if missing:
+            coefficients, nocts = np.asarray(missing).T
+            power = np.sort(
+                dc_power(
+                    self.irradiance,
+                    self.ambient_temperature,
+                    coefficients[:, None, None],
+                    nocts[:, None, None],
+                ),
+                axis=-1,
+            )
+            sums = np.concatenate((np.zeros(power.shape[:-1] + (1,)), np.cumsum(power, axis=-1)), axis=-1)
+            for index, key in enumerate(missing):
+                self._profiles[key] = (power[index], sums[index])
+        return [self._profiles[key] for key in keys]
+
+    def annual_yield(self, temperature_coefficient, noct, inverter_efficiency, dc_ac_ratio) -> np.ndarray:
+        """AC energy per unit of rated DC power, per panel and inverter combination and year (options x years)
+
+        The inverter converts at a constant efficiency and clips at its AC rating, the rated DC power over the
+        DC/AC ratio: the yearly energy is sum(min(efficiency * dc, 1 / ratio)) over the hours.
+
+        Args:
+            temperature_coefficient, noct (array_like): panel temperature model per option (see dc_power)
+            inverter_efficiency (array_like): inverter efficiency per option (0-1)
+            dc_ac_ratio (array_like): rated DC power over inverter AC power per option
+
+        Returns:
+            np.ndarray: equivalent full load hours (energy over rated DC power)
+        """
+        temperature_coefficient, noct, inverter_efficiency, dc_ac_ratio = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(x, dtype=float))
+                for x in (temperature_coefficient, noct, inverter_efficiency, dc_ac_ratio)
+            )
+        )
+        panels = np.stack((temperature_coefficient, noct), axis=1)
+        if len(panels) > 1:
+            panels, inverse = np.unique(panels, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+        else:
+            inverse = np.zeros(1, dtype=int)
+        ac_limit = 1 / dc_ac_ratio
+        clip_level = ac_limit / inverter_efficiency  # DC power above which the inverter clips
+
+        energy = np.empty((len(temperature_coefficient), len(self)))
+        hours = self.irradiance.shape[1]
+        for panel, (power, sums) in enumerate(self.get_profiles(panels)):
+            options = np.flatnonzero(inverse == panel)
+            for year in range(len(self)):
+                clipped = np.searchsorted(power[year], clip_level[options], side="left")
+                energy[options, year] = (
+                    inverter_efficiency[options] * sums[year][clipped] + ac_limit[options] * (hours - clipped)
+                )
+        return energy
+
+
+def get_solar_series(solar_data, country: str) -> SolarSeries:
+    """Gets the SolarSeries of a country, built once per loaded solar resource"""
+    return solar_data.get_derived(("solar_series", country), lambda data: SolarSeries.from_resource(data, country))
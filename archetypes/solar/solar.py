@@ -1,8 +1,136 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-from archetypes.solar.solar_metrics import get_solar_metrics
+from archetypes.solar.solar_metrics import (
+    get_annual_production,
+    get_annual_production_batch,
+    get_cost,
+    get_design_columns,
+    get_inverter_properties,
+    get_inverter_properties_batch,
+    get_layout,
+    get_panel_properties,
+    get_panel_properties_batch,
+    get_trl,
+    get_trl_batch,
+    INVERTER_BLOCK_UUID,
+    INVERTER_PROPERTIES,
+    PANEL_BLOCK_UUID,
+    PANEL_PROPERTIES,
+)
+from src.instrumentation import instrument
+from src.utilities import get_option_data
 
-def solar():
-    pass
\ No newline at end of file
+
+@instrument()
+def solar(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    choices: dict[int, dict],
+    job_data: dict,
+    solar_data,
+):
+    """Calculates the relevant design outputs for the solar archetype
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY solar specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        solar_data (ResourceData): solar resource data (irradiation, temperature, latitude)
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production (MWh per year)
+    """
+    panel = get_panel_properties(get_option_data(choices, PANEL_BLOCK_UUID))
+    inverter = get_inverter_properties(get_option_data(choices, INVERTER_BLOCK_UUID))
+    annual_energy_production = get_annual_production(
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        choices=choices,
+        solar_data=solar_data,
+    )["production"]
+
+    # Output calculation
+    cost = get_cost(archetype_user_input, panel, inverter)
+
+    layout = float(get_layout(archetype_user_input, panel["module_efficiency"])[0])
+    trl = get_trl(choices)["trl"]
+    capex = float(cost["capex"][0])
+    opex = float(cost["opex"][0])
+    stack_replacement_cost = 0
+    stack_replacement_time = 0
+    degradation_rate = float(panel["degradation_rate"][0])
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": annual_energy_production,
+    }
+
+
+@instrument()
+def solar_batch(
+    wacc_real: float,
+    general_user_inputs: dict,
+    archetype_user_input: dict,
+    design_properties,
+    job_data: dict,
+    solar_data,
+):
+    """Calculates the solar design outputs for a batch of designs in one vectorised pass
+
+    Args:
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY solar specific user input
+        design_properties (DesignProperties): Chosen option properties per design
+        job_data (dict): Contains all archetype and vendor data
+        solar_data (ResourceData): solar resource data (irradiation, temperature, latitude)
+
+    Returns:
+        _dict_: layout, opex, capex, trl, stack_values, degradation_rate, production (MWh per year) - one array
+            entry per design
+    """
+    panel = get_panel_properties_batch(get_design_columns(design_properties, PANEL_BLOCK_UUID, PANEL_PROPERTIES))
+    inverter = get_inverter_properties_batch(
+        get_design_columns(design_properties, INVERTER_BLOCK_UUID, INVERTER_PROPERTIES)
+    )
+    annual_energy_production = get_annual_production_batch(
+        general_user_inputs=general_user_inputs,
+        archetype_user_input=archetype_user_input,
+        job_data=job_data,
+        design_properties=design_properties,
+        solar_data=solar_data,
+    )["production"]
+
+    # Output calculation
+    cost = get_cost(archetype_user_input, panel, inverter)
+    number_of_designs = len(design_properties)
+
+    layout = get_layout(archetype_user_input, panel["module_efficiency"])
+    trl = get_trl_batch(design_properties)["trl"]
+    capex = np.broadcast_to(cost["capex"], (number_of_designs,)).astype(float)
+    opex = np.broadcast_to(cost["opex"], (number_of_designs,)).astype(float)
+    stack_replacement_cost = np.zeros(number_of_designs)
+    stack_replacement_time = np.zeros(number_of_designs)
+    degradation_rate = panel["degradation_rate"]
+
+    return {
+        "layout": layout,
+        "capex": capex,
+        "opex": opex,
+        "trl": trl,
+        "stack_replacement_cost": stack_replacement_cost,
+        "stack_replacement_time": stack_replacement_time,
+        "degradation_rate": degradation_rate,
+        "production": annual_energy_production,
+    }
@@ -1,6 +1,217 @@
 # Install packages
-import pandas as pd
 import numpy as np
 
-def get_solar_metrics():
-    pass
\ No newline at end of file
+from archetypes.solar.irradiance import STC_IRRADIANCE, get_solar_series
+from src.instrumentation import instrument
+from src.utilities import fill_missing, get_option_data, to_float
+
+# Block uuids of the solar sub-systems
+PANEL_BLOCK_UUID = "f1bc401d-3c2d-4ccb-b15b-98fa73bf5f3e"
+INVERTER_BLOCK_UUID = "eafe5dac-3de1-41d2-b997-aee72311caf8"
+
+# Option property values used where an option does not provide them
+DEFAULT_TEMPERATURE_COEFFICIENT = -0.35  # %/degC
+DEFAULT_NOCT = 45.0  # degC
+DEFAULT_MODULE_EFFICIENCY = 20.0  # %
+DEFAULT_DEGRADATION_RATE = 0.5  # %/year
+DEFAULT_INVERTER_EFFICIENCY = 98.0  # %
+DEFAULT_DC_AC_RATIO = 1.2
+DEFAULT_COST_FACTOR = 1.0
+
+# Option properties read by the yield and cost model
+PANEL_PROPERTIES = ("temperaturecoefficient", "noct", "efficiency", "degradationrate", "costfactor")
+INVERTER_PROPERTIES = ("efficiency", "dcacratio", "costfactor")
+
+# DUMMY cost figures (capex figures are in millions)
+PANEL_COST = 4.0  # per MW of DC capacity, modules, mounting and balance of system
+INVERTER_COST = 1.2  # per MW of AC capacity
+FIXED_OPEX_SHARE = 0.02  # of the capex per year
+
+
+def get_panel_properties(panel_data: dict) -> dict:
+    """Gets the yield relevant properties of a panel option, with defaults where missing
+
+    Args:
+        panel_data (dict): chosen panel option properties
+
+    Returns:
+        _dict_: temperature coefficient (%/degC), noct (degC), module efficiency and degradation rate (fractions)
+            and cost factor
+    """
+    return get_panel_properties_batch({name: np.array([to_float(panel_data.get(name))]) for name in PANEL_PROPERTIES})
+
+
+def get_inverter_properties(inverter_data: dict) -> dict:
+    """Gets the properties of an inverter option, with defaults where missing
+
+    Args:
+        inverter_data (dict): chosen inverter option properties
+
+    Returns:
+        _dict_: inverter efficiency (fraction), DC/AC ratio and cost factor
+    """
+    return get_inverter_properties_batch(
+        {name: np.array([to_float(inverter_data.get(name))]) for name in INVERTER_PROPERTIES}
+    )
+
+
+@instrument()
+def get_annual_production(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, choices: dict[int, dict], solar_data
+):
+    """Calculates the annual AC energy production of the chosen panels and inverter against the hourly
+    irradiance and temperature series of the country (see irradiance.SolarSeries)
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY solar specific user input
+        job_data (dict): Contains all archetype and vendor data
+        choices (dict[int, dict]): Chosen project design
+        solar_data (ResourceData): solar resource data
+
+    Returns:
+        _dict_: mean annual production (MWh) and the production per year of the solar series
+    """
+    panel = get_panel_properties(get_option_data(choices, PANEL_BLOCK_UUID))
+    inverter = get_inverter_properties(get_option_data(choices, INVERTER_BLOCK_UUID))
+    annual_production = _get_annual_production(archetype_user_input, job_data, solar_data, panel, inverter)[0]
+    return {"production": annual_production.mean(), "annual_production": annual_production}
+
+
+def _get_annual_production(archetype_user_input, job_data, solar_data, panel, inverter) -> np.ndarray:
+    """Production per option and year of the solar series (options x years)"""
+    equivalent_hours = get_solar_series(solar_data, job_data.country).annual_yield(
+        panel["temperature_coefficient"], panel["noct"], inverter["efficiency"], inverter["dc_ac_ratio"]
+    )
+    return archetype_user_input["capacity"] * (1 - archetype_user_input["system_losses"]) * equivalent_hours
+
+
+def get_layout(archetype_user_input: dict, module_efficiency, ground_coverage_ratio: float = 0.4):
+    """Calculates the footprint of the panels: module area over the ground coverage ratio
+
+    Args:
+        archetype_user_input (dict): DUMMY solar specific user input
+        module_efficiency (array_like): module efficiency (fraction)
+        ground_coverage_ratio (float): module area over land area
+
+    Returns:
+        _float_: land area in m^sq
+    """
+    module_area = archetype_user_input["capacity"] * 1e6 / (STC_IRRADIANCE * module_efficiency)
+    return module_area / ground_coverage_ratio
+
+
+def get_cost(archetype_user_input: dict, panel: dict, inverter: dict) -> dict:
+    """Calculates the capex of the panels and the inverters (sized at the DC capacity over the DC/AC ratio) and
+    the fixed opex, scaled by the cost factors of the chosen options. Scalar or per design, following the panel
+    and inverter properties
+
+    Args:
+        archetype_user_input (dict): DUMMY solar specific user input
+        panel (dict): panel properties (see get_panel_properties)
+        inverter (dict): inverter properties (see get_inverter_properties)
+
+    Returns:
+        _dict_: capex and opex
+    """
+    capacity = archetype_user_input["capacity"]
+    capex = (
+        PANEL_COST * capacity * panel["cost_factor"]
+        + INVERTER_COST * capacity / inverter["dc_ac_ratio"] * inverter["cost_factor"]
+    )
+    return {"capex": capex, "opex": FIXED_OPEX_SHARE * capex}
+
+
+@instrument()
+def get_trl(choices: dict[int, dict]):
+    """Gets the TRL of the solar system: the least mature of the chosen panel and inverter (0 if unknown)
+
+    Args:
+        choices (dict[int, dict]): Chosen project design
+
+    Returns:
+        _dict_: technology readiness level
+    """
+    trl = [
+        to_float(get_option_data(choices, block_uuid).get("trlmaturity"))
+        for block_uuid in (PANEL_BLOCK_UUID, INVERTER_BLOCK_UUID)
+    ]
+    trl = [value for value in trl if not np.isnan(value)]
+    return {"trl": min(trl) if trl else 0}
+
+
+# BATCH versions: the same calculations over a batch of designs, one array entry per design
+def get_panel_properties_batch(columns) -> dict:
+    """Panel properties (see get_panel_properties) from property columns, e.g. a DesignProperties view"""
+    return {
+        "temperature_coefficient": fill_missing(columns["temperaturecoefficient"], DEFAULT_TEMPERATURE_COEFFICIENT),
+        "noct": fill_missing(columns["noct"], DEFAULT_NOCT),
+        "module_efficiency": fill_missing(columns["efficiency"], DEFAULT_MODULE_EFFICIENCY) / 100,
+        "degradation_rate": fill_missing(columns["degradationrate"], DEFAULT_DEGRADATION_RATE) / 100,
+        "cost_factor": fill_missing(columns["costfactor"], DEFAULT_COST_FACTOR),
+    }
+
+
+def get_inverter_properties_batch(columns) -> dict:
+    """Inverter properties (see get_inverter_properties) from property columns"""
+    return {
+        "efficiency": fill_missing(columns["efficiency"], DEFAULT_INVERTER_EFFICIENCY) / 100,
+        "dc_ac_ratio": fill_missing(columns["dcacratio"], DEFAULT_DC_AC_RATIO),
+        "cost_factor": fill_missing(columns["costfactor"], DEFAULT_COST_FACTOR),
+    }
+
+
+def get_design_columns(design_properties, block_uuid: str, names: tuple) -> dict:
+    """Property columns of a block for a batch of designs"""
+    return {name: design_properties.get(block_uuid, name) for name in names}
+
+
+@instrument()
+def get_annual_production_batch(
+    general_user_inputs: dict, archetype_user_input: dict, job_data: dict, design_properties, solar_data
+) -> dict:
+    """Calculates the annual production for a batch of designs. The yield is evaluated once per distinct panel
+    and inverter combination, all combinations at once (see get_annual_production)
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        archetype_user_input (dict): DUMMY solar specific user input
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+        solar_data (ResourceData): solar resource data
+
+    Returns:
+        _dict_: mean annual production per design and production per design and year of the solar series
+    """
+    panel = get_panel_properties_batch(get_design_columns(design_properties, PANEL_BLOCK_UUID, PANEL_PROPERTIES))
+    inverter = get_inverter_properties_batch(
+        get_design_columns(design_properties, INVERTER_BLOCK_UUID, INVERTER_PROPERTIES)
+    )
+    systems = np.stack(
+        (panel["temperature_coefficient"], panel["noct"], inverter["efficiency"], inverter["dc_ac_ratio"]), axis=1
+    )
+    unique, inverse = np.unique(systems, axis=0, return_inverse=True)
+    annual_production = _get_annual_production(
+        archetype_user_input,
+        job_data,
+        solar_data,
+        {"temperature_coefficient": unique[:, 0], "noct": unique[:, 1]},
+        {"efficiency": unique[:, 2], "dc_ac_ratio": unique[:, 3]},
+    )[inverse.reshape(-1)]
+    return {"production": annual_production.mean(axis=1), "annual_production": annual_production}
+
+
+def get_trl_batch(design_properties) -> dict:
+    """Gets the TRL for a batch of designs (see get_trl)
+
+    Args:
+        design_properties (DesignProperties): Chosen option properties per design
+
+    Returns:
+        _dict_: technology readiness level per design
+    """
+    trl = np.fmin(
+        design_properties.get(PANEL_BLOCK_UUID, "trlmaturity"),
+        design_properties.get(INVERTER_BLOCK_UUID, "trlmaturity"),
+    )
+    return {"trl": np.nan_to_num(trl, nan=0.0)}
@@ -0,0 +1,103 @@
+"""Benchmark of the compiled option constraints against naive list membership checks.
+
+Run from the repository root:
+    python benchmarks/constraints.py --blocks 20 --options 20 --constraints 2000 --designs 20000
+
+Prints a JSON report with the time per design of each method.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from search_package.constraints import OptionConstraints  # noqa: E402
+
+
+def make_synthetic_constraints(
+    blocks: int, options: int, constraints: int, max_size: int, always_fraction: float, seed: int
+):
+    """Random never/always constraints over a space of blocks x options"""
+    rng = np.random.default_rng(seed)
+    number_of_options = blocks * options
+    return [
+        (
+            "always" if rng.random() < always_fraction else "never",
+            rng.choice(number_of_options, size=int(rng.integers(2, max_size + 1)), replace=False).tolist(),
+        )
+        for _ in range(constraints)
+    ]
+
+
+def naive_is_feasible(chosen: list[int], constraints, options_per_block: int) -> bool:
+    """Reference check with list membership, as done upstream"""
+    for constraint_type, options in constraints:
+        count = sum(option in chosen for option in options)
+        if constraint_type == "never" and count == len(options):
+            return False
+        blocks = len({option // options_per_block for option in options})
+        if constraint_type == "always" and 0 < count < blocks:
+            return False
+    return True
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocks", type=int, default=20)
+    parser.add_argument("--options", type=int, default=20, help="options per block")
+    parser.add_argument("--constraints", type=int, default=2000)
+    parser.add_argument("--max-size", type=int, default=3, help="maximum options per constraint")
+    parser.add_argument("--always-fraction", type=float, default=0.002, help="share of always constraints")
+    parser.add_argument("--designs", type=int, default=20000)
+    parser.add_argument("--naive-designs", type=int, default=500, help="designs timed with the naive check")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    constraints = make_synthetic_constraints(
+        args.blocks, args.options, args.constraints, args.max_size, args.always_fraction, args.seed
+    )
+    rng = np.random.default_rng(args.seed + 1)
+    designs = rng.integers(0, args.options, size=(args.designs, args.blocks))
+
+    tic = time.perf_counter()
+    compiled = OptionConstraints([args.options] * args.blocks, constraints)
+    compile_s = time.perf_counter() - tic
+
+    offsets = compiled.block_offsets
+    naive_designs = designs[: args.naive_designs]
+    tic = time.perf_counter()
+    naive = [naive_is_feasible((design + offsets).tolist(), constraints, args.options) for design in naive_designs]
+    naive_s = time.perf_counter() - tic
+
+    tic = time.perf_counter()
+    single = [compiled.is_feasible(design) for design in naive_designs]
+    single_s = time.perf_counter() - tic
+
+    tic = time.perf_counter()
+    batch = compiled.check(designs)
+    batch_s = time.perf_counter() - tic
+
+    if naive != single or naive != batch[: len(naive)].tolist():
+        print("compiled and naive checks disagree", file=sys.stderr)
+        return 1
+
+    report = {
+        "benchmark": "option_constraints",
+        "parameters": vars(args),
+        "compile_s": compile_s,
+        "naive_us_per_design": naive_s / len(naive_designs) * 1e6,
+        "bitmask_us_per_design": single_s / len(naive_designs) * 1e6,
+        "batch_us_per_design": batch_s / len(designs) * 1e6,
+        "feasible_fraction": float(batch.mean()),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Benchmark of the engineering block of a hybrid job: archetypes evaluated on the thread pool against one after
+another.
+
+Run from the repository root:
+    python benchmarks/engineering_block.py --designs 1 1620
+
+Prints a JSON report with the median time of get_metrics_batch per mode and design count, and of every archetype
+on its own.
+"""
+
+import argparse
+import itertools
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import engineering_block  # noqa: E402
+from archetypes.offshore_wind.offshore_wind_cache import clear_cache  # noqa: E402
+from archetypes.registry import REGISTRY  # noqa: E402
+from engine_interface import get_metrics_batch, load_demo_data  # noqa: E402
+
+
+def all_choices(job_data) -> list[dict]:
+    """Every design of the job as a choices dict"""
+    options = [
+        [option for choice in block.choices.values() for option in choice.options.values()]
+        for block in job_data.blocks.values()
+    ]
+    return [
+        {
+            option.block_uuid: {option.name: {name: value.value for name, value in option.properties.items()}}
+            for option in design
+        }
+        for design in itertools.product(*options)
+    ]
+
+
+def median_time(function, repeat: int) -> float:
+    """Median seconds per call, with the OWF sub-result cache cleared before each call"""
+    function()
+    timings = []
+    for _ in range(repeat):
+        clear_cache()
+        tic = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - tic)
+    return statistics.median(timings)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--designs", type=int, nargs="*", default=[1, 1620], help="designs per batch")
+    parser.add_argument("--archetypes", nargs="*", help="archetypes of the hybrid job, defaults to all with a model")
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    _, job_data = load_demo_data()
+    archetypes = args.archetypes or [
+        spec.archetype.value for spec in REGISTRY.values() if spec.engineering_batch is not None
+    ]
+    hybrid_job = job_data.model_copy(update={"archetypes": archetypes})
+    choices = all_choices(job_data)
+
+    results = {}
+    for designs in args.designs:
+        batch = choices[:designs]
+        timings = {}
+        for mode, max_workers in (("threads", None), ("serial", 1)):
+            engineering_block.set_max_workers(max_workers)
+            timings[f"{mode}_s"] = median_time(lambda: get_metrics_batch(batch, hybrid_job), args.repeat)
+        engineering_block.set_max_workers(1)
+        timings["archetype_s"] = {
+            arc: median_time(
+                lambda arc=arc: get_metrics_batch(batch, job_data.model_copy(update={"archetypes": [arc]})),
+                args.repeat,
+            )
+            for arc in archetypes
+        }
+        results[str(len(batch))] = timings
+
+    print(json.dumps({"benchmark": "engineering_block", "archetypes": archetypes, "designs": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
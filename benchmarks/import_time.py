@@ -0,0 +1,102 @@
+"""Cold start budget for the engine: import time of engine_interface and the first get_metrics call.
+
+Run from the repository root:
+    python benchmarks/import_time.py --import-budget-ms 400 --cold-start-budget-ms 1500
+
+Prints a JSON report and exits with status 1 when a budget is exceeded or a forbidden module is imported.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+COLD_START = """
+import json, time
+tic = time.perf_counter()
+import engine_interface
+imported = time.perf_counter()
+choices, job_data = engine_interface.load_demo_data()
+loaded = time.perf_counter()
+engine_interface.get_metrics(choices=choices, job_data=job_data)
+done = time.perf_counter()
+print(json.dumps({
+    "load_demo_data_ms": (loaded - imported) * 1e3,
+    "first_get_metrics_ms": (done - loaded) * 1e3,
+    "cold_start_ms": (done - tic) * 1e3,
+}))
+"""
+
+
+def measure_import(module: str) -> dict:
+    """Imports a module in a fresh interpreter with -X importtime
+
+    Args:
+        module (str): module to import
+
+    Returns:
+        dict: cumulative import time of the module (ms) and the imported module names
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total_us, name = line.split("|")
+        cumulative_us[name.strip()] = int(total_us)
+    return {"import_ms": cumulative_us[module] / 1e3, "modules": sorted(cumulative_us)}
+
+
+def measure_cold_start() -> dict:
+    """Times import, demo data load and the first get_metrics call in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="engine_interface")
+    parser.add_argument("--import-budget-ms", type=float, default=400.0)
+    parser.add_argument("--cold-start-budget-ms", type=float, default=1500.0)
+    parser.add_argument(
+        "--forbid", nargs="*", default=["pandas", "pydantic", "munch"], help="packages that must not load on import"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="best of n fresh interpreters")
+    args = parser.parse_args(argv)
+
+    imports = [measure_import(args.module) for _ in range(args.repeat)]
+    cold_starts = [measure_cold_start() for _ in range(args.repeat)]
+    forbidden = sorted(
+        {module.split(".")[0] for module in imports[0]["modules"]} & set(args.forbid)
+    )
+
+    report = {
+        "module": args.module,
+        "import_ms": min(x["import_ms"] for x in imports),
+        "import_budget_ms": args.import_budget_ms,
+        **{key: min(x[key] for x in cold_starts) for key in cold_starts[0]},
+        "cold_start_budget_ms": args.cold_start_budget_ms,
+        "forbidden_imports": forbidden,
+    }
+    report["passed"] = (
+        report["import_ms"] <= args.import_budget_ms
+        and report["cold_start_ms"] <= args.cold_start_budget_ms
+        and not forbidden
+    )
+    print(json.dumps(report, indent=2))
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
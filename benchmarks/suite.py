@@ -0,0 +1,158 @@
+"""Benchmark suite of the engine's main paths on synthetic jobs of increasing size.
+
+Cases per job size:
+    job_data_parse      - JobData from the raw job file (parse, transform, validation), cache bypassed
+    job_data_transform  - JobData.transform_data on already parsed data
+    job_data_cached     - JobData.from_file served from the on-disk cache
+    get_choices         - loading the concept pickle
+    get_data_cold       - reading the wind resource file (cache cleared)
+    get_data_warm       - resource data served from the resource cache
+    get_metrics         - end-to-end metrics of one design (OWF sub-result cache cleared)
+    get_metrics_warm    - end-to-end metrics of one design served from the OWF sub-result cache
+    get_metrics_batch   - vectorised metrics of a batch of designs (time per design)
+
+Run from the repository root:
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --baseline results.json --tolerance 0.25
+
+Prints a JSON report; with --baseline, exits with status 1 when a case is slower than the baseline by more than
+the tolerance or missing from the report. A case that fails raises instead of being skipped.
+"""
+
+import argparse
+import copy
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.synthetic_job_data import write_synthetic_job  # noqa: E402
+
+# name -> make_synthetic_job size options
+SIZES = {
+    "small": {"blocks": 6, "options": 4},
+    "medium": {"blocks": 20, "options": 10, "properties": 20, "connections": 20, "constraints": 50},
+    "large": {"blocks": 50, "options": 40, "properties": 50, "connections": 100, "constraints": 1000},
+}
+
+
+def measure(function, repeat: int, number: int = 1, setup=None) -> dict:
+    """Times a function, returning the min and median seconds per call over the repeats"""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        tic = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - tic) / number)
+    return {"min_s": min(timings), "median_s": statistics.median(timings), "repeat": repeat, "number": number}
+
+
+def run_size(name: str, size: dict, directory: Path, repeat: int, batch: int, seed: int) -> dict:
+    """Runs all cases on one synthetic job"""
+    from archetypes.offshore_wind.offshore_wind_cache import clear_cache
+    from engine_interface import get_metrics, get_metrics_batch
+    from metrics import get_data
+    from src.data_io.design_space import get_design_space
+    from src.data_io.job_data import JobData
+    from src.data_io.resource_cache import resource_cache
+    from src.utilities import get_choices
+
+    job_file, concept_file = write_synthetic_job(directory / name, seed=seed, **size)
+    raw = json.loads(job_file.read_text())
+    cache_dir = directory / name / "cache"
+    job_data = JobData.from_file(job_file, cache_dir=cache_dir)
+    choices = get_choices(concept_file)
+    design_space = get_design_space(job_data)
+    rng = np.random.default_rng(seed)
+    designs = rng.integers(0, design_space.block_sizes, size=(batch, len(design_space)))
+
+    cases = {
+        "job_data_parse": measure(lambda: JobData.from_file(job_file, use_cache=False), repeat),
+        "job_data_transform": measure(lambda: JobData.transform_data(copy.deepcopy(raw)), repeat),
+        "job_data_cached": measure(lambda: JobData.from_file(job_file, cache_dir=cache_dir), repeat),
+        "get_choices": measure(lambda: get_choices(concept_file), repeat, number=10),
+        "get_data_cold": measure(lambda: get_data("wind"), repeat, setup=resource_cache.clear),
+        "get_data_warm": measure(lambda: get_data("wind"), repeat, number=100),
+    }
+    cases["get_metrics"] = measure(lambda: get_metrics(choices=choices, job_data=job_data), repeat, setup=clear_cache)
+    cases["get_metrics_warm"] = measure(lambda: get_metrics(choices=choices, job_data=job_data), repeat, number=10)
+    batch_timing = measure(lambda: get_metrics_batch(designs, job_data), repeat, setup=clear_cache)
+    cases["get_metrics_batch"] = {
+        **{key: value / batch for key, value in batch_timing.items() if key.endswith("_s")},
+        "repeat": repeat,
+        "number": batch,
+    }
+
+    return {
+        "size": size,
+        "blocks": len(design_space),
+        "options": design_space.number_of_options,
+        "job_file_bytes": job_file.stat().st_size,
+        "cases": cases,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """Cases whose median is slower than the baseline median by more than the tolerance, and cases of the
+    baseline missing from the report (for the sizes that were run)"""
+    regressions = []
+    for name, result in report["sizes"].items():
+        reference_cases = baseline.get("sizes", {}).get(name, {}).get("cases", {})
+        for case in reference_cases.keys() - result["cases"].keys():
+            regressions.append({"size": name, "case": case, "missing": True})
+        for case, timing in result["cases"].items():
+            reference = reference_cases.get(case)
+            if reference and timing["median_s"] > reference["median_s"] * (1 + tolerance):
+                regressions.append(
+                    {
+                        "size": name,
+                        "case": case,
+                        "median_s": timing["median_s"],
+                        "baseline_median_s": reference["median_s"],
+                        "ratio": timing["median_s"] / reference["median_s"],
+                    }
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="*", default=list(SIZES), choices=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=1000, help="designs per get_metrics_batch call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the report to this file")
+    parser.add_argument("--baseline", help="report of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        report = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "sizes": {
+                name: run_size(name, SIZES[name], Path(directory), args.repeat, args.batch, args.seed)
+                for name in args.sizes
+            },
+        }
+
+    if args.baseline:
+        report["regressions"] = compare(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    print(json.dumps(report, indent=2))
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
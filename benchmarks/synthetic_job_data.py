@@ -0,0 +1,295 @@
+"""Generator of synthetic job data in the shape of src/local_project_9_default_2_input.json.
+
+The project level data (parameters, drivers, conversions) is taken from a template job file. The offshore wind
+blocks of the template keep their uuids and property names, so the engineering metrics run on the synthetic
+job; their options are resampled from the template options with jittered values. Extra blocks, options,
+properties, tags, priors, connections and constraints are added to scale the job up.
+
+Run from the repository root:
+    python benchmarks/synthetic_job_data.py --blocks 20 --options 10 --output /tmp/synthetic
+
+Writes job_data.json and concept.pickle (one option per block, as src/example_concept.pickle) to the output
+directory.
+"""
+
+import argparse
+import copy
+import json
+import pickle
+import sys
+import uuid
+import zlib
+from itertools import count
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+TEMPLATE_FILE = ROOT / "src" / "local_project_9_default_2_input.json"
+AGGREGATIONS = ["sum", "product", "mean", "min", "max"]
+
+
+def make_synthetic_job(
+    blocks: int = 6,
+    options: int = 4,
+    properties: int = 0,
+    tags: int = 2,
+    priors: int = 5,
+    connections: int = 1,
+    constraints: int = 2,
+    seed: int = 0,
+    template_file: str | Path = TEMPLATE_FILE,
+    engine_job_id: int | None = None,
+) -> dict:
+    """Builds a raw job file (with a "project" entry) of the requested size
+
+    Args:
+        blocks (int): number of blocks; the template blocks come first, the remaining ones are synthetic
+        options (int): options per block
+        properties (int): extra numeric properties per option
+        tags (int): tags per option
+        priors (int): priors per block (at most one per driver)
+        connections (int): connections between random blocks
+        constraints (int): never/always option constraints over options of two different blocks
+        seed (int): random seed
+        template_file (str | Path): job file providing the project level data and the template blocks
+        engine_job_id (int, optional): id of the job, defaults to an id derived from the size options and seed so
+            that different synthetic jobs never share one
+
+    Returns:
+        _dict_: job data in the raw job file structure
+    """
+    rng = np.random.default_rng(seed)
+    data = json.loads(Path(template_file).read_text())
+    if engine_job_id is None:
+        sizes = [blocks, options, properties, tags, priors, connections, constraints, seed]
+        engine_job_id = zlib.crc32(json.dumps(sizes).encode()) & 0x7FFFFFFF
+    data["engine_job_id"] = engine_job_id
+    project = data["project"]
+    template_blocks = project["blocks"][:blocks]
+    drivers = project["drivers"]
+    ids = count(10_000)
+
+    project["blocks"] = []
+    for position in range(blocks):
+        if position < len(template_blocks):
+            template = template_blocks[position]
+            template_options = [option for choice in template["choices"] for option in choice["options"]]
+            block_uuid, name = template["uuid"], template["name"]
+        else:
+            template_options = None
+            block_uuid, name = str(uuid.UUID(int=int(rng.integers(2**63)))), f"SYN_Block{position}"
+
+        block_id, choice_id = next(ids), next(ids)
+        block_options = []
+        for i in range(options):
+            option_id = next(ids)
+            if template_options is not None:
+                source = template_options[i % len(template_options)]
+                values = {x["name"]: (x["display_name"], _jitter(x["value"], rng)) for x in source["properties"]}
+                tag_pairs = [(x["group"], x["name"]) for x in source["tags"]][:tags]
+            else:
+                values = {}
+                tag_pairs = []
+            for k in range(properties):
+                values[f"syntheticproperty{k}"] = (f"syntheticProperty{k}", float(rng.uniform(1, 100)))
+            while len(tag_pairs) < tags:
+                tag_pairs.append((f"group{len(tag_pairs)}", f"value{int(rng.integers(3))}"))
+
+            block_options.append(
+                {
+                    "id": option_id,
+                    "properties": [
+                        {
+                            "id": next(ids),
+                            "name": property_name,
+                            "display_name": display_name,
+                            "default_value": value,
+                            "value": value,
+                            "si_unit": None,
+                            "imperial_unit": None,
+                            "option": option_id,
+                        }
+                        for property_name, (display_name, value) in values.items()
+                    ],
+                    "tags": [
+                        {"id": next(ids), "group": group, "name": tag, "display_name": tag, "option": option_id}
+                        for group, tag in tag_pairs
+                    ],
+                    "name": f"{name}_OPT{i}",
+                    "display_name": f"{name} option {i}",
+                    "selected": i == 0,
+                    "choice": choice_id,
+                }
+            )
+
+        display_names = list(dict.fromkeys(x["display_name"] for x in block_options[0]["properties"]))
+        block_priors = []
+        for driver in drivers[: min(priors, len(drivers))]:
+            prior_id = next(ids)
+            chosen = rng.choice(len(display_names), size=min(2, len(display_names)), replace=False)
+            block_priors.append(
+                {
+                    "id": prior_id,
+                    "properties": [
+                        {
+                            "id": next(ids),
+                            "sequence": sequence,
+                            "property": display_names[k],
+                            "weight": float(rng.uniform(0.5, 1.5)),
+                            "prior": prior_id,
+                        }
+                        for sequence, k in enumerate(chosen.tolist())
+                    ],
+                    "aggregation": str(rng.choice(AGGREGATIONS)),
+                    "block": block_id,
+                    "driver": driver["id"],
+                }
+            )
+
+        project["blocks"].append(
+            {
+                "id": block_id,
+                "choices": [{"id": choice_id, "options": block_options, "name": name, "display_name": name,
+                             "block": block_id}],
+                "parameters": [],
+                "priors": block_priors,
+                "uuid": block_uuid,
+                "name": name,
+                "display_name": name,
+                "instances_min": 1,
+                "instances_max": 1,
+                "aks_api_view": name,
+                "fe_config": None,
+                "project": project["pk"],
+                "block": position + 1,
+                "archetype": template_blocks[0]["archetype"] if template_blocks else None,
+            }
+        )
+
+    block_uuids = [block["uuid"] for block in project["blocks"]]
+    project["connections"] = []
+    for _ in range(connections if blocks > 1 else 0):
+        from_block, to_block = rng.choice(len(block_uuids), size=2, replace=False).tolist()
+        project["connections"].append(
+            {
+                "connection_type": "power",
+                "from_block_uuid": block_uuids[from_block],
+                "to_block_uuid": block_uuids[to_block],
+            }
+        )
+
+    option_ids = [[option["id"] for option in block["choices"][0]["options"]] for block in project["blocks"]]
+    project["option_constraints"] = []
+    for _ in range(constraints if blocks > 1 else 0):
+        constraint_id = next(ids)
+        constraint_type = str(rng.choice(["never", "always"], p=[0.8, 0.2]))
+        first, second = rng.choice(blocks, size=2, replace=False).tolist()
+        project["option_constraints"].append(
+            {
+                "id": constraint_id,
+                "options": [
+                    {"id": next(ids), "constraint": constraint_id, "option": int(rng.choice(option_ids[block]))}
+                    for block in (first, second)
+                ],
+                "name": constraint_type,
+                "type": constraint_type,
+                "project": project["pk"],
+            }
+        )
+    return data
+
+
+def _jitter(value, rng: np.random.Generator):
+    """Scales numeric template values by a random factor; missing and non-numeric values are kept"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return round(float(value) * float(rng.uniform(0.8, 1.2)), 6)
+    return copy.deepcopy(value)
+
+
+def has_required_properties(option, required: tuple[str, ...]) -> bool:
+    """Whether an option has a value for every required property"""
+    return all(name in option.properties and option.properties[name].value is not None for name in required)
+
+
+def make_synthetic_concept(job_data, seed: int = 0) -> dict:
+    """Picks one random option per block, in the structure of src/example_concept.pickle. Options of the offshore
+    wind blocks are picked among those with all properties the scalar engineering needs (REQUIRED_PROPERTIES)
+
+    Args:
+        job_data (JobData): Contains all archetype and vendor data
+        seed (int): random seed
+
+    Returns:
+        _dict_: choice id -> OptionData
+    """
+    from archetypes.offshore_wind.offshore_wind_metrics import REQUIRED_PROPERTIES
+
+    rng = np.random.default_rng(seed)
+    concept = {}
+    for block in job_data.blocks.values():
+        required = REQUIRED_PROPERTIES.get(block.uuid, ())
+        for choice_id, choice in block.choices.items():
+            options = [option for option in choice.options.values() if has_required_properties(option, required)]
+            if not options:
+                raise ValueError(f"Block {block.name} has no option with all of the properties {required}")
+            concept[choice_id] = options[int(rng.integers(len(options)))]
+    return concept
+
+
+def write_synthetic_job(output: str | Path, seed: int = 0, **kwargs) -> tuple[Path, Path]:
+    """Writes a synthetic job file and a matching concept pickle
+
+    Args:
+        output (str | Path): output directory
+        seed (int): random seed
+        **kwargs: make_synthetic_job size options
+
+    Returns:
+        _tuple_: (job file, concept file)
+    """
+    from src.data_io.job_data import JobData
+
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    job_file, concept_file = output / "job_data.json", output / "concept.pickle"
+
+    data = make_synthetic_job(seed=seed, **kwargs)
+    job_file.write_text(json.dumps(data))
+    with concept_file.open("wb") as f:
+        pickle.dump(make_synthetic_concept(JobData(**copy.deepcopy(data)), seed=seed), f)
+    return job_file, concept_file
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", required=True, help="output directory")
+    parser.add_argument("--blocks", type=int, default=6)
+    parser.add_argument("--options", type=int, default=4, help="options per block")
+    parser.add_argument("--properties", type=int, default=0, help="extra properties per option")
+    parser.add_argument("--tags", type=int, default=2, help="tags per option")
+    parser.add_argument("--priors", type=int, default=5, help="priors per block")
+    parser.add_argument("--connections", type=int, default=1)
+    parser.add_argument("--constraints", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    job_file, concept_file = write_synthetic_job(
+        args.output,
+        seed=args.seed,
+        blocks=args.blocks,
+        options=args.options,
+        properties=args.properties,
+        tags=args.tags,
+        priors=args.priors,
+        connections=args.connections,
+        constraints=args.constraints,
+    )
+    print(json.dumps({"job_file": str(job_file), "concept_file": str(concept_file)}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
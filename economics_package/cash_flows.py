@@ -0,0 +1,241 @@
+# Install packages
+from functools import lru_cache
+
+import numpy as np
+
+from economics_package.discounting import get_discount_factors, get_production_factors
+from src.instrumentation import instrument
+
+# Year the lead times are counted from: cash flows of this year are not discounted
+REFERENCE_YEAR = 2024
+
+
+def get_timeline_start(general_user_inputs: dict, start_date: float) -> int:
+    """First year of the timeline: REFERENCE_YEAR, or the FID or start date when earlier (those years are
+    discounted with a negative lead time, i.e. compounded up to REFERENCE_YEAR)"""
+    return int(min(REFERENCE_YEAR, general_user_inputs["fid"], start_date))
+
+
+def get_horizon(general_user_inputs: dict, start_date: float) -> int:
+    """Number of years of the timeline, from get_timeline_start to the end of the later of phasing and operation"""
+    timeline_start = get_timeline_start(general_user_inputs, start_date)
+    phasing_years = general_user_inputs["in_phasing"][0]
+    return int(
+        max(
+            general_user_inputs["fid"] - timeline_start + phasing_years,
+            start_date - timeline_start + general_user_inputs["project_lifetime"],
+        )
+    )
+
+
+def get_archetype_values(engineering_outputs: dict, job_data: dict, key: str, default: float = 0.0) -> np.ndarray:
+    """Stacks an engineering output of every archetype, scalar or per design, into (..., archetypes). Archetypes
+    without engineering outputs (no engineering model) get the default"""
+    values = [engineering_outputs.get(arc, {}).get(key, default) for arc in job_data.archetypes]
+    if not any(isinstance(value, np.ndarray) for value in values):
+        # scalar outputs of a single design
+        return np.array(values, dtype=float)
+    values = [np.asarray(value, dtype=float) for value in values]
+    return np.stack(np.broadcast_arrays(*values), axis=-1)
+
+
+@lru_cache(maxsize=256)
+def get_window(
+    horizon: int, first_year: float, number_of_years: int, timeline_start: int = REFERENCE_YEAR
+) -> np.ndarray:
+    """Position of every timeline year within a window of years (-1 outside the window), cached and read-only"""
+    position = np.arange(horizon) - int(first_year - timeline_start)
+    window = np.where((position >= 0) & (position < number_of_years), position, -1)
+    window.flags.writeable = False
+    return window
+
+
+@lru_cache(maxsize=256)
+def get_phasing_profile(
+    horizon: int, fid: float, phasing_years: int, phasing: tuple, timeline_start: int = REFERENCE_YEAR
+) -> np.ndarray:
+    """Share of the capex spent in every timeline year, cached and read-only"""
+    window = get_window(horizon, fid, phasing_years, timeline_start)
+    profile = np.where(window >= 0, np.asarray(phasing, dtype=float)[np.maximum(window, 0)], 0.0)
+    profile.flags.writeable = False
+    return profile
+
+
+def get_capex_flows(
+    general_user_inputs: dict,
+    engineering_outputs: dict,
+    job_data: dict,
+    horizon: int,
+    timeline_start: int = REFERENCE_YEAR,
+) -> np.ndarray:
+    """Capex per archetype and year of the timeline starting at timeline_start, phased over the in-phasing years
+    from the FID
+
+    Returns:
+        _np.ndarray_: (..., archetypes, years)
+    """
+    phasing_years, phasing = general_user_inputs["in_phasing"]
+    profile = get_phasing_profile(horizon, general_user_inputs["fid"], phasing_years, tuple(phasing), timeline_start)
+    return get_archetype_values(engineering_outputs, job_data, "capex")[..., None] * profile
+
+
+def get_opex_flows(
+    general_user_inputs: dict,
+    engineering_outputs: dict,
+    job_data: dict,
+    start_date: float,
+    horizon: int,
+    timeline_start: int = REFERENCE_YEAR,
+) -> np.ndarray:
+    """Opex per archetype and year over the project lifetime, with the stack replacement cost added every
+    stack_replacement_time operating years (no replacement where the time is not positive)
+
+    Returns:
+        _np.ndarray_: (..., archetypes, years)
+    """
+    window = get_window(horizon, start_date, general_user_inputs["project_lifetime"], timeline_start)
+    operating = window >= 0
+    opex = get_archetype_values(engineering_outputs, job_data, "opex")[..., None] * operating
+
+    replacement_time = get_archetype_values(engineering_outputs, job_data, "stack_replacement_time")[..., None]
+    if not np.any(replacement_time > 0):
+        return opex
+    replacement_cost = get_archetype_values(engineering_outputs, job_data, "stack_replacement_cost")[..., None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        replaced = operating & (replacement_time > 0) & (np.fmod(window + 1, replacement_time) == 0)
+    return opex + np.where(replaced, replacement_cost, 0.0)
+
+
+def get_production_flows(
+    general_user_inputs: dict,
+    engineering_outputs: dict,
+    job_data: dict,
+    start_date: float,
+    horizon: int,
+    timeline_start: int = REFERENCE_YEAR,
+) -> np.ndarray:
+    """Production per archetype and year over the project lifetime, reduced by the archetype's yearly
+    degradation_rate (production * (1 - degradation_rate) ** operating year)
+
+    Returns:
+        _np.ndarray_: (..., archetypes, years)
+    """
+    window = get_window(horizon, start_date, general_user_inputs["project_lifetime"], timeline_start)
+    production = get_archetype_values(engineering_outputs, job_data, "production")[..., None]
+    degradation = get_archetype_values(engineering_outputs, job_data, "degradation_rate")[..., None]
+    if not np.any(degradation):
+        return production * (window >= 0)
+    return np.where(window >= 0, production * (1 - degradation) ** np.maximum(window, 0), 0.0)
+
+
+class CashFlows:
+    """Yearly capex, opex and production of one design (archetypes x years) or of a batch of designs
+    (designs x archetypes x years) on a common timeline starting at timeline_start (see get_timeline_start).
+
+    Each stream has its own discount factors over the timeline (capex at the real WACC, opex at the discount rate,
+    production with the production weighting of get_production_factors), so present values, LCOX and payback are
+    reductions over the last axes.
+    """
+
+    def __init__(
+        self,
+        archetypes: list[str],
+        streams: dict[str, np.ndarray],
+        factors: dict[str, np.ndarray],
+        start_date: float,
+        timeline_start: int = REFERENCE_YEAR,
+    ):
+        """
+        Args:
+            archetypes (list[str]): archetype of each row of the archetype axis
+            streams (dict[str, np.ndarray]): stream name (capex, opex, production) -> (..., archetypes, years)
+            factors (dict[str, np.ndarray]): stream name -> discount factors shaped (years,)
+            start_date (float): production start date
+            timeline_start (int): first year of the timeline
+        """
+        self.archetypes = list(archetypes)
+        self.streams = streams
+        self.factors = factors
+        self.start_date = start_date
+        self.timeline_start = timeline_start
+
+    @property
+    def years(self) -> np.ndarray:
+        return self.timeline_start + np.arange(len(self.factors["capex"]))
+
+    def present_values(self, stream: str) -> np.ndarray:
+        """Discounted stream per archetype and year, (..., archetypes, years)"""
+        return self.streams[stream] * self.factors[stream]
+
+    def npv_by_archetype(self, stream: str) -> np.ndarray:
+        """Net present value of a stream per archetype, (..., archetypes)"""
+        return self.streams[stream] @ self.factors[stream]
+
+    def npv(self, stream: str) -> np.ndarray:
+        """Net present value of a stream summed over the archetypes, (...)"""
+        return self.npv_by_archetype(stream).sum(axis=-1)
+
+    def lcox(self) -> np.ndarray:
+        """Levelised cost: present value of capex and opex over the present value of production"""
+        return (self.npv("capex") + self.npv("opex")) / self.npv("production")
+
+    def payback(self, price) -> np.ndarray:
+        """Discounted payback: operating years until the cumulative discounted net cash flow
+        (price x production - opex - capex) turns non-negative, NaN if it never does
+
+        Args:
+            price (float | np.ndarray): value per unit of production, scalar or per design
+
+        Returns:
+            _np.ndarray_: payback in years from the production start date, (...)
+        """
+        capex = np.cumsum(self.present_values("capex").sum(axis=-2), axis=-1)
+        costs = capex + np.cumsum(self.present_values("opex").sum(axis=-2), axis=-1)
+        revenue = np.asarray(price, dtype=float)[..., None] * np.cumsum(
+            self.present_values("production").sum(axis=-2), axis=-1
+        )
+        # only count years once the investment has started; break-even at the LCOX within rounding
+        paid_back = (revenue - costs >= -1e-9 * costs) & (capex > 0)
+        payback_year = np.argmax(paid_back, axis=-1) - (self.start_date - self.timeline_start)
+        return np.where(paid_back.any(axis=-1), payback_year + 1.0, np.nan)[()]
+
+
+@instrument()
+def get_cash_flows(
+    general_user_inputs: dict, engineering_outputs: dict, job_data: dict, start_date: float, wacc_real: float
+) -> CashFlows:
+    """Builds the yearly cash flows of all archetypes from the engineering outputs
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        engineering_outputs (dict): Contains all archetype engineering output, scalars or one entry per design
+        job_data (dict): Contains all archetype and vendor data
+        start_date (float): production start date
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+
+    Returns:
+        CashFlows: capex, opex and production shaped (..., archetypes, years)
+    """
+    timeline_start = get_timeline_start(general_user_inputs, start_date)
+    horizon = get_horizon(general_user_inputs, start_date)
+    lead_time = timeline_start - REFERENCE_YEAR
+    rate = general_user_inputs["discount_rate"]
+    return CashFlows(
+        archetypes=job_data.archetypes,
+        streams={
+            "capex": get_capex_flows(general_user_inputs, engineering_outputs, job_data, horizon, timeline_start),
+            "opex": get_opex_flows(
+                general_user_inputs, engineering_outputs, job_data, start_date, horizon, timeline_start
+            ),
+            "production": get_production_flows(
+                general_user_inputs, engineering_outputs, job_data, start_date, horizon, timeline_start
+            ),
+        },
+        factors={
+            "capex": get_discount_factors(wacc_real, lead_time, horizon),
+            "opex": get_discount_factors(rate, lead_time, horizon),
+            "production": get_production_factors(rate, lead_time, horizon),
+        },
+        start_date=start_date,
+        timeline_start=timeline_start,
+    )
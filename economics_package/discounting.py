@@ -0,0 +1,68 @@
+# Install packages
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=256)
+def get_discount_factors(rate: float, lead_time: float, horizon: int) -> np.ndarray:
+    """Discount factor per year, 1 / (1 + rate) ** (lead_time + i) for i in range(horizon).
+    Cached per (rate, lead time, horizon), so a job computes each vector once
+
+    Args:
+        rate (float): discount rate
+        lead_time (float): years between the reference year and the first year of the stream
+        horizon (int): number of years
+
+    Returns:
+        _np.ndarray_: read-only discount factor vector of length horizon
+    """
+    factors = 1 / (1 + rate) ** (lead_time + np.arange(horizon))
+    factors.flags.writeable = False
+    return factors
+
+
+@lru_cache(maxsize=256)
+def get_production_factors(rate: float, lead_time: float, horizon: int) -> np.ndarray:
+    """Production weighting per year of the LCOX (see cash_flows.get_cash_flows), 1 / (1 + rate ** (lead_time + i))
+
+    Args:
+        rate (float): discount rate
+        lead_time (float): years between the reference year and the first production year
+        horizon (int): number of years
+
+    Returns:
+        _np.ndarray_: read-only factor vector of length horizon
+    """
+    factors = 1 / (1 + rate ** (lead_time + np.arange(horizon)))
+    factors.flags.writeable = False
+    return factors
+
+
+def get_annuity_factor(rate: float, lifetime: int) -> float:
+    """Present value of one per year over the lifetime, the first payment one year out
+
+    Args:
+        rate (float): discount rate
+        lifetime (int): number of years
+
+    Returns:
+        _float_: annuity factor
+    """
+    if rate == 0:
+        return float(lifetime)
+    return (1 - (1 + rate) ** -lifetime) / rate
+
+
+def get_npv(values, factors: np.ndarray):
+    """Net present value of per-year streams as a dot product over the last axis
+
+    Args:
+        values (array_like): streams shaped (..., years), e.g. archetypes x designs x years
+        factors (np.ndarray): discount factors shaped (years,)
+
+    Returns:
+        _np.ndarray_: present values shaped (...)
+    """
+    return np.asarray(values) @ factors
+
@@ -1,24 +1,38 @@
 # Import packages
 from typing import Any
-import pandas as pd
 import numpy as np
-from enum import Enum
-from src.data_io.job_data import JobData
+from src.data_io.conversions import get_unit_converter
+from src.data_io.design_space import get_design_space
 
 # Import functions and utilities
-from engineering_block import engineering_block
+from engineering_block import engineering_block, engineering_block_batch
 from economics_package.economics_calculator import economics_calculator
 from metrics import get_general_user_inputs, get_start_date, get_wacc_real
-from src.utilities import get_choices, load_job_data_from_file, Archetypes
+from src.utilities import get_choices, load_job_data_from_file, DesignProperties
+from src.instrumentation import instrument
 
-# OBTAIN DATA - TEST
+# DEMO DATA - TEST
 option_file = "src/example_concept.pickle"
-dummy_choices = get_choices(option_file)
-
 job_data_file = "src/local_project_9_default_2_input.json"
-dummy_job_data = load_job_data_from_file(job_data_file)
+
+# SI unit of the aggregated metrics that have a single one (the other metrics mix the units of the archetypes)
+METRIC_UNITS = {"carbon_footprint": "tonne", "layout": "m^sq"}
+
+
+def load_demo_data(option_file: str = option_file, job_data_file: str = job_data_file) -> tuple[dict, Any]:
+    """Loads the demo design and job data. Kept out of module import so workers start without any file I/O
+
+    Args:
+        option_file (str): pickled example concept
+        job_data_file (str): job data json
+
+    Returns:
+        _tuple_: (choices, job_data)
+    """
+    return get_choices(option_file), load_job_data_from_file(job_data_file)
 
 
+@instrument()
 def get_metrics(choices: dict[int, dict], job_data: dict):
     """Engine interface to call for relevant economic metrics
 
@@ -51,5 +65,78 @@ def get_metrics(choices: dict[int, dict], job_data: dict):
     return economics_outputs
 
 
+@instrument()
+def get_metrics_batch(choices_list: list[dict[int, dict]] | np.ndarray, job_data: dict) -> dict[str, np.ndarray]:
+    """Engine interface to evaluate many designs in one call. The job level inputs are evaluated once and the
+    engineering and economics run vectorised over the designs
+
+    Args:
+        choices_list (list[dict[int, dict]] | np.ndarray): Chosen project designs, either as choices dicts or as
+            a designs x blocks matrix of option rows of the job's DesignSpaceIndex
+        job_data (dict): Contains all archetype and vendor data
+
+    Returns:
+        _dict_: columnar metrics - one array per metric with an entry per design, in the order of choices_list
+    """
+    general_user_inputs = get_general_user_inputs()
+    design_properties = get_design_properties(choices_list, job_data)
+
+    # PRE-EVALUATION metrics
+    start_date = get_start_date(general_user_inputs["fid"], general_user_inputs["in_phasing"][0])
+    wacc_real = get_wacc_real(general_user_inputs["wacc_nominal"], general_user_inputs["inflation_rate"])
+
+    engineering_outputs = engineering_block_batch(
+        general_user_inputs=general_user_inputs,
+        job_data=job_data,
+        design_properties=design_properties,
+        wacc_real=wacc_real,
+    )
+
+    # The economics getters operate elementwise, so array engineering outputs discount all designs at once
+    economics_outputs = economics_calculator(
+        general_user_inputs=general_user_inputs,
+        engineering_outputs=engineering_outputs,
+        job_data=job_data,
+        start_date=start_date,
+        wacc_real=wacc_real,
+        choices=choices_list,
+    )
+
+    return {
+        metric: _to_column(value, len(design_properties)) for metric, value in economics_outputs.items()
+    }
+
+
+def convert_metrics(metrics: dict[str, Any], job_data, category: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Converts the metrics of get_metrics or get_metrics_batch with the job's unit conversions, one multiply per
+    metric column (see METRIC_UNITS)
+
+    Args:
+        metrics (dict[str, Any]): metric -> value or array of values per design
+        job_data (JobData): Contains all archetype and vendor data
+        category (str): conversion category of JobData.conversions, e.g. "SI to Imperial"
+
+    Returns:
+        _tuple_: converted metrics and the unit per metric (None for metrics without a unit)
+    """
+    return get_unit_converter(job_data).convert_results(metrics, METRIC_UNITS, category)
+
+
+def get_design_properties(choices_list: list[dict[int, dict]] | np.ndarray, job_data: dict):
+    """Chosen option properties (DesignProperties or its columnar equivalent) of designs given as choices dicts
+    or as a designs x blocks matrix of option rows"""
+    if isinstance(choices_list, np.ndarray):
+        return get_design_space(job_data).take(choices_list)
+    return DesignProperties(choices_list)
+
+
+def _to_column(value: Any, number_of_designs: int) -> np.ndarray:
+    """Broadcasts a metric value to one float entry per design (None becomes NaN)"""
+    if value is None:
+        return np.full(number_of_designs, np.nan)
+    return np.broadcast_to(np.asarray(value, dtype=float), (number_of_designs,)).copy()
+
+
+# dummy_choices, dummy_job_data = load_demo_data()
 # out = get_metrics(choices=dummy_choices, job_data=dummy_job_data)
 # print(out)
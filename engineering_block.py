@@ -1,19 +1,61 @@
 # Install packages
-import pandas as pd
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
-# from economics_package.economics_calculator import get_metrics
+from archetypes.registry import get_resources, get_spec
 from metrics import get_archetype_user_input, get_data
+from src.instrumentation import instrument, recorder
+from src.utilities import Archetypes
 
-# Archetype packages
-from archetypes.offshore_wind.offshore_wind import offshore_wind
-from archetypes.green_hydrogen.green_hydrogen import green_hydrogen
-from archetypes.pipelines.pipelines import pipelines
-from archetypes.carbon_capture.carbon_capture import carbon_capture
-from archetypes.ammonia.ammonia import ammonia
-from archetypes.solar.solar import solar
+# Threads evaluating the archetypes of a multi-archetype job, created on first use of an opt-in pool
+_executor = None
+# Number of threads: 1 (default) evaluates the archetypes one after another, None for one per archetype
+_max_workers = 1
 
 
+def get_executor() -> ThreadPoolExecutor:
+    """Gets the opt-in thread pool of the engineering blocks (see set_max_workers). Threads share the cached
+    resource data, but the archetype engineering is mostly short numpy calls that hold the GIL, so on the dummy
+    data a hybrid job is slower on the pool than serial (see benchmarks/engineering_block.py)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_max_workers or len(Archetypes), thread_name_prefix="engineering_block"
+        )
+    return _executor
+
+
+def set_max_workers(max_workers: int | None):
+    """Sets the number of engineering threads: 1 (default) for serial evaluation, None for one per archetype.
+    The pool starts threads, so enable it only after processes that fork (e.g. ParallelEvaluator) have started"""
+    global _executor, _max_workers
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+    _max_workers = max_workers
+
+
+def get_engineering_archetypes(job_data, batch: bool = False) -> list[str]:
+    """Archetypes of the job that declare an engineering function"""
+    attribute = "engineering_batch" if batch else "engineering"
+    return [arc for arc in job_data.archetypes if getattr(get_spec(arc), attribute) is not None]
+
+
+def _evaluate_archetypes(evaluate, archetypes: list[str]) -> dict:
+    """Runs evaluate(arc) for every archetype, concurrently on the pool when it is enabled and there are several"""
+    if len(archetypes) <= 1 or _max_workers == 1:
+        return {arc: evaluate(arc) for arc in archetypes}
+    # the workers record their stages under the caller's stage path
+    evaluate = recorder.bind(evaluate)
+    futures = {arc: get_executor().submit(evaluate, arc) for arc in archetypes}
+    return {arc: future.result() for arc, future in futures.items()}
+
+
+def _get_resource_data(archetypes: list[str]) -> dict:
+    """Resource data of the given archetypes by resource name, read once per call"""
+    return {resource: get_data(resource) for resource in get_resources(archetypes)}
+
+
+@instrument()
 def engineering_block(general_user_inputs: dict, job_data: dict, choices: dict[int, dict], wacc_real: float):
     """This block calls the relevant engineering blocks and gets the engineering output for economics calculator
 
@@ -26,24 +68,48 @@ def engineering_block(general_user_inputs: dict, job_data: dict, choices: dict[i
     Returns:
         _dict_: Engineering output per archetype in a dictionary
     """
-    archetypes = job_data.archetypes
-    engineering_outputs = {}
-
-    # DUMMY STRUCTURE engineering calc
-    for arc in archetypes:
-        archetype_user_input = get_archetype_user_input(arc)
-        if arc == "OWF":
-            wind_data = get_data("wind")
-            engineering_outputs[f"{arc}"] = offshore_wind(
-                wacc_real=wacc_real,
-                general_user_inputs=general_user_inputs,
-                archetype_user_input=archetype_user_input,
-                choices=choices,
-                job_data=job_data,
-                wind_data=wind_data,
-            )
-
-        elif arc == "green_hydrogen":
-            pass
-
-    return engineering_outputs
+    archetypes = get_engineering_archetypes(job_data)
+    resource_data = _get_resource_data(archetypes)
+
+    def evaluate(arc):
+        spec = get_spec(arc)
+        return spec.get_function(spec.engineering)(
+            wacc_real=wacc_real,
+            general_user_inputs=general_user_inputs,
+            archetype_user_input=get_archetype_user_input(arc),
+            choices=choices,
+            job_data=job_data,
+            **{f"{resource}_data": resource_data[resource] for resource in spec.resources},
+        )
+
+    return _evaluate_archetypes(evaluate, archetypes)
+
+
+@instrument()
+def engineering_block_batch(general_user_inputs: dict, job_data: dict, design_properties, wacc_real: float):
+    """Batch version of engineering_block: evaluates the engineering of many designs at once
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        job_data (dict): Contains all archetype and vendor data
+        design_properties (DesignProperties): Chosen option properties per design
+        wacc_real (float): weighted average cost of capital (adjusted for inflation)
+
+    Returns:
+        _dict_: Engineering output per archetype, with one array entry per design
+    """
+    archetypes = get_engineering_archetypes(job_data, batch=True)
+    resource_data = _get_resource_data(archetypes)
+
+    def evaluate(arc):
+        spec = get_spec(arc)
+        return spec.get_function(spec.engineering_batch)(
+            wacc_real=wacc_real,
+            general_user_inputs=general_user_inputs,
+            archetype_user_input=get_archetype_user_input(arc),
+            design_properties=design_properties,
+            job_data=job_data,
+            **{f"{resource}_data": resource_data[resource] for resource in spec.resources},
+        )
+
+    return _evaluate_archetypes(evaluate, archetypes)
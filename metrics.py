@@ -1,6 +1,6 @@
 # Install packages
-import pandas as pd
-import numpy as np
+from src.data_io.resource_cache import resource_cache
+from src.instrumentation import instrument
 
 
 def get_general_user_inputs():
@@ -15,6 +15,7 @@ def get_general_user_inputs():
         in_phasing (tuple)      : In-phasing period and distribution
         project_lifetime (float): Expected lifetime of the project
         archetype (str)         : Project archtype selected by user
+        price (float)           : Value per MWh of production, in the units of the LCOX
     """
 
     wacc_nominal = 0.08
@@ -23,6 +24,7 @@ def get_general_user_inputs():
     in_phasing = (3, (0.1, 0.5, 0.4))
     project_lifetime = 25
     discount_rate = 0.02
+    price = 5.0
 
     return {
         "wacc_nominal": wacc_nominal,
@@ -31,6 +33,7 @@ def get_general_user_inputs():
         "in_phasing": in_phasing,
         "project_lifetime": project_lifetime,
         "discount_rate": discount_rate,
+        "price": price,
     }
 
 
@@ -43,31 +46,84 @@ def get_archetype_user_input(archetype):
     Returns (EXPECTED: NOT USING ALL NOW):
         water_depth (float)         : The water depth at the desired location
         project_area (float)        : The desired project area
-        capacity (float)            : The desire capacity of the project (in MW)
+        capacity (float)            : The desire capacity of the project (in MW, ammonia in t/day)
         distance_from_shore (float) : Based on the coordinates
+        production_model (str)      : "simple" or "hourly" energy production
+        system_losses (float)       : solar DC losses (soiling, wiring, mismatch) as a fraction
+        power_capacity (float)      : capacity of the wind farm feeding the electrolyzer (in MW)
+        fluid (str)                 : fluid transported by the pipeline, "hydrogen" or "co2"
+        flow_rate (float)           : pipeline mass flow (in kg/s)
+        supply_pressure (float)     : pressure at which the fluid is delivered to the pipeline (in bar)
+        outlet_pressure (float)     : minimum pressure along the pipeline and at its outlet (in bar)
+        max_velocity (float)        : maximum flow velocity in the pipeline (in m/s)
+        design_percentile (float)   : percentile of the hourly flue gas flow the capture unit is sized for
+        electrolyzer_capacity (float): capacity of the electrolyzer feeding the ammonia plant (in MW)
     """
     if "OWF" in archetype:
-        offshore_wind_input = {"water_depth": 60, "project_area": 100, "capacity": 100, "distance_from_shore": 100}
+        offshore_wind_input = {
+            "water_depth": 60,
+            "project_area": 100,
+            "capacity": 100,
+            "distance_from_shore": 100,
+            "production_model": "simple",
+        }
         return offshore_wind_input
+    if "solar" in archetype:
+        solar_input = {
+            "capacity": 100,
+            "system_losses": 0.1,
+        }
+        return solar_input
     if "green_hydrogen" in archetype:
         green_hydrogen_input = {
-            "placeholder1": 10,
-            "placeholder2": 10,
+            "capacity": 100,
+            "power_capacity": 150,
         }
         return green_hydrogen_input
+    if "pipelines" in archetype:
+        pipelines_input = {
+            "fluid": "hydrogen",
+            "flow_rate": 10,
+            "supply_pressure": 30,
+            "outlet_pressure": 30,
+            "max_velocity": 20,
+        }
+        return pipelines_input
+    if "carbon_capture" in archetype:
+        carbon_capture_input = {
+            "design_percentile": 95,
+        }
+        return carbon_capture_input
+    if "ammonia" in archetype:
+        ammonia_input = {
+            "capacity": 300,
+            "electrolyzer_capacity": 400,
+            "power_capacity": 800,
+        }
+        return ammonia_input
+
 
+def get_data_file_name(archetype):
+    return "data/dummy_" + archetype + ".xlsx"
 
+
+@instrument()
 def get_data(archetype):
-    file_name = "data/dummy_" + archetype + ".xlsx"
-    xl = pd.read_excel(file_name, sheet_name=None, index_col=0)
+    """Gets the resource data of an archetype. Files are read once per process and kept in resource_cache
+    (cleared with resource_cache.clear(), re-read when the file changes)
+
+    Args:
+        archetype (str): archetype name, e.g. "wind"
 
-    # empty dictionary
-    dfs = {}
+    Returns:
+        ResourceData: sheet name -> DataFrame, with rows indexed by country. Shared, treat as read-only
+    """
+    return resource_cache.get(archetype, get_data_file_name(archetype))
 
-    for sheet_name, df in xl.items():
-        dfs[sheet_name] = df
 
-    return dfs
+def preload_data(archetypes):
+    """Reads the resource data of the given archetypes into the cache, e.g. at worker start-up"""
+    resource_cache.preload((archetype, get_data_file_name(archetype)) for archetype in archetypes)
 
 
 def get_start_date(fid_date: float, in_phasing_years: float) -> float:
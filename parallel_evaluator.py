@@ -0,0 +1,145 @@
+# Import packages
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Import functions and utilities
+from archetypes.registry import get_resources
+from engine_interface import get_metrics, get_metrics_batch
+from metrics import preload_data
+from src.data_io.design_space import get_design_space
+
+# Per-process state, set once by _init_worker
+_worker_state = {}
+
+
+def _init_worker(job_data, resources: tuple):
+    """Initialises a worker once: keeps the job data and warms the resource cache and design space index"""
+    _worker_state["job_data"] = job_data
+    preload_data(resources)
+    get_design_space(job_data)
+
+
+def _evaluate_chunk(start: int, choices_chunk, batch: bool):
+    """Evaluates a chunk of designs in a worker
+
+    Returns:
+        _tuple_: chunk start, worker pid, number of designs, elapsed seconds, results
+    """
+    job_data = _worker_state["job_data"]
+    tic = time.perf_counter()
+    if batch:
+        results = get_metrics_batch(choices_chunk, job_data)
+    else:
+        results = [get_metrics(choices=choices, job_data=job_data) for choices in choices_chunk]
+    return start, os.getpid(), len(choices_chunk), time.perf_counter() - tic, results
+
+
+class ParallelEvaluator:
+    """Evaluates designs over a pool of worker processes.
+
+    Each worker is initialised once with the job data (inherited through fork where available, otherwise
+    pickled once per worker), preloads the resource data (by default the resources the job's archetypes declare in
+    the archetype registry) and compiles the design space index. Designs are
+    submitted in chunks and results come back in the order of the input.
+    """
+
+    def __init__(
+        self,
+        job_data,
+        max_workers: int | None = None,
+        chunksize: int = 64,
+        resources: tuple | None = None,
+        mp_context=None,
+    ):
+        if mp_context is None and "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+        self.job_data = job_data
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.stats = {}
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(job_data, get_resources(job_data.archetypes) if resources is None else tuple(resources)),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def shutdown(self):
+        self._executor.shutdown()
+
+    def evaluate(self, choices_list: list[dict[int, dict]]) -> list[dict]:
+        """Drop-in for [get_metrics(choices, job_data) for choices in choices_list]
+
+        Args:
+            choices_list (list[dict[int, dict]]): Chosen project designs
+
+        Returns:
+            _list_: metrics dict per design, in the order of choices_list
+        """
+        results = [None] * len(choices_list)
+        for start, chunk_results in self._map(choices_list, batch=False):
+            results[start : start + len(chunk_results)] = chunk_results
+        return results
+
+    def evaluate_batch(self, choices_list: list[dict[int, dict]] | np.ndarray) -> dict[str, np.ndarray]:
+        """Parallel get_metrics_batch: chunks are evaluated vectorised in the workers and concatenated
+
+        Args:
+            choices_list (list[dict[int, dict]] | np.ndarray): Chosen project designs (choices dicts or a
+                designs x blocks matrix of option rows)
+
+        Returns:
+            _dict_: columnar metrics, in the order of choices_list
+        """
+        chunks = sorted(self._map(choices_list, batch=True), key=lambda x: x[0])
+        if not chunks:
+            return {}
+        return {metric: np.concatenate([chunk[metric] for _, chunk in chunks]) for metric in chunks[0][1]}
+
+    def report(self) -> dict:
+        """Per-worker throughput since the evaluator was created
+
+        Returns:
+            _dict_: worker pid -> designs, busy seconds and designs per second
+        """
+        return {
+            pid: {**stats, "designs_per_second": stats["designs"] / stats["seconds"] if stats["seconds"] else 0.0}
+            for pid, stats in self.stats.items()
+        }
+
+    def _map(self, choices_list, batch: bool):
+        futures = [
+            self._executor.submit(_evaluate_chunk, start, choices_list[start : start + self.chunksize], batch)
+            for start in range(0, len(choices_list), self.chunksize)
+        ]
+        for future in futures:
+            start, pid, designs, seconds, results = future.result()
+            stats = self.stats.setdefault(pid, {"designs": 0, "seconds": 0.0})
+            stats["designs"] += designs
+            stats["seconds"] += seconds
+            yield start, results
+
+
+def get_metrics_parallel(choices_list: list[dict[int, dict]], job_data, max_workers: int | None = None) -> list[dict]:
+    """Evaluates a list of designs over a process pool (see ParallelEvaluator)
+
+    Args:
+        choices_list (list[dict[int, dict]]): Chosen project designs
+        job_data (dict): Contains all archetype and vendor data
+        max_workers (int, optional): number of worker processes, defaults to the number of cpus
+
+    Returns:
+        _list_: metrics dict per design, in the order of choices_list
+    """
+    with ParallelEvaluator(job_data, max_workers=max_workers) as evaluator:
+        return evaluator.evaluate(choices_list)
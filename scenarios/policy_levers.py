@@ -0,0 +1,182 @@
+# Install packages
+import itertools
+from collections.abc import Sequence
+
+import numpy as np
+
+from economics_package.cash_flows import REFERENCE_YEAR, get_archetype_values, get_opex_flows, get_production_flows
+from economics_package.economics_metrics import get_carbon_footprint
+from engine_interface import get_design_properties
+from engineering_block import engineering_block_batch
+from metrics import get_general_user_inputs, get_start_date, get_wacc_real
+from src.instrumentation import instrument
+
+# General user inputs that can be swept
+FINANCIAL_LEVERS = ("wacc_nominal", "inflation_rate", "discount_rate", "fid", "in_phasing")
+
+# Policy levers and their base values, in the currency unit of the capex
+POLICY_LEVERS = {
+    "carbon_price": 0.0,  # per t CO2 of the yearly carbon footprint
+    "capex_subsidy": 0.0,  # share of the capex
+    "production_subsidy": 0.0,  # per unit of production
+}
+
+
+def get_base_scenario() -> dict:
+    """Lever values of the base case: the general user inputs and no carbon price or subsidies"""
+    general_user_inputs = get_general_user_inputs()
+    return {**{lever: general_user_inputs[lever] for lever in FINANCIAL_LEVERS}, **POLICY_LEVERS}
+
+
+def get_scenario_grid(levers: dict[str, Sequence]) -> list[dict]:
+    """Scenarios of every combination of the lever values (the last lever varying fastest), other levers at
+    their base value
+
+    Args:
+        levers (dict[str, Sequence]): lever name -> values, e.g. {"carbon_price": [0, 1e-4], "fid": [2026, 2028]}
+
+    Returns:
+        _list_: scenario dicts with a value for every lever
+    """
+    base = get_base_scenario()
+    unknown = [lever for lever in levers if lever not in base]
+    if unknown:
+        raise ValueError(f"Unknown levers: {unknown}")
+    names = list(levers)
+    return [{**base, **dict(zip(names, values))} for values in itertools.product(*(levers[name] for name in names))]
+
+
+def get_scenario_factors(scenarios: list[dict], project_lifetime: int) -> dict:
+    """Scenario side of the economics: everything the discounting of a scenario needs, as arrays over the
+    scenarios (and the operating years)
+
+    Operating year k of a scenario is timeline year start date + k, so the opex and production streams of a design
+    are the same in every scenario on the operating year axis and only these factors differ.
+
+    Args:
+        scenarios (list[dict]): lever values per scenario
+        project_lifetime (int): operating years
+
+    Returns:
+        _dict_: capex_weight (present value of one unit of capex phased from the FID), opex_factors and
+            production_factors (scenarios x operating years) and the policy lever values per scenario
+    """
+    wacc_real = np.array([get_wacc_real(s["wacc_nominal"], s["inflation_rate"]) for s in scenarios])
+    rate = np.array([s["discount_rate"] for s in scenarios], dtype=float)
+    start_date = np.array([get_start_date(s["fid"], s["in_phasing"][0]) for s in scenarios], dtype=float)
+
+    # lead time of every operating year and phasing year from REFERENCE_YEAR, negative for years before it
+    years = (start_date - REFERENCE_YEAR).astype(int)[:, None] + np.arange(project_lifetime)
+    capex_weight = np.empty(len(scenarios))
+    for index, scenario in enumerate(scenarios):
+        phasing_years, phasing = scenario["in_phasing"]
+        phasing_timeline = int(scenario["fid"] - REFERENCE_YEAR) + np.arange(phasing_years)
+        phasing = np.asarray(phasing, dtype=float)[:phasing_years]
+        capex_weight[index] = (phasing / (1 + wacc_real[index]) ** phasing_timeline).sum()
+
+    return {
+        "capex_weight": capex_weight,
+        "opex_factors": 1 / (1 + rate[:, None]) ** years,
+        "production_factors": 1 / (1 + rate[:, None] ** years),
+        **{lever: np.array([s[lever] for s in scenarios], dtype=float) for lever in POLICY_LEVERS},
+    }
+
+
+def get_design_streams(general_user_inputs: dict, engineering_outputs: dict, job_data, number_of_designs: int) -> dict:
+    """Design side of the economics: capex, and opex and production per operating year summed over the
+    archetypes. The streams are the cash flows of get_opex_flows and get_production_flows on a timeline that
+    starts with the first operating year
+
+    Args:
+        general_user_inputs (dict): DUMMY general user inputs
+        engineering_outputs (dict): Contains all archetype engineering output, one entry per design
+        job_data (dict): Contains all archetype and vendor data
+        number_of_designs (int): number of designs
+
+    Returns:
+        _dict_: capex and carbon_footprint per design, opex and production (designs x operating years)
+    """
+    project_lifetime = general_user_inputs["project_lifetime"]
+    flows = (general_user_inputs, engineering_outputs, job_data, REFERENCE_YEAR, project_lifetime, REFERENCE_YEAR)
+    carbon_footprint = get_carbon_footprint(job_data=job_data, engineering_outputs=engineering_outputs)
+
+    return {
+        "capex": np.broadcast_to(
+            get_archetype_values(engineering_outputs, job_data, "capex").sum(axis=-1), (number_of_designs,)
+        ),
+        "opex": np.broadcast_to(get_opex_flows(*flows).sum(axis=-2), (number_of_designs, project_lifetime)),
+        "production": np.broadcast_to(
+            get_production_flows(*flows).sum(axis=-2), (number_of_designs, project_lifetime)
+        ),
+        "carbon_footprint": np.zeros(number_of_designs)
+        if carbon_footprint is None
+        else np.nan_to_num(np.broadcast_to(np.asarray(carbon_footprint, dtype=float), (number_of_designs,))),
+    }
+
+
+@instrument()
+def evaluate_scenarios(
+    choices_list: list[dict[int, dict]] | np.ndarray, job_data, scenarios: list[dict]
+) -> dict[str, np.ndarray]:
+    """Evaluates the economics of every design under every scenario. The engineering runs once per design (at
+    the base case general user inputs, which also fix engineering choices that use the WACC such as the pipeline
+    diameter); the scenarios only change the discounting, timing and policy terms, so all of them are evaluated
+    as designs x scenarios matrix products over the operating years
+
+    Args:
+        choices_list (list[dict[int, dict]] | np.ndarray): Chosen project designs, either as choices dicts or as
+            a designs x blocks matrix of option rows of the job's DesignSpaceIndex
+        job_data (JobData): Contains all archetype and vendor data
+        scenarios (list[dict]): lever values per scenario, e.g. from get_scenario_grid
+
+    Returns:
+        _dict_: capex, opex, production (net present values), carbon_cost, subsidy and LCOX (net of the carbon
+            cost and subsidies) - one designs x scenarios array each
+    """
+    general_user_inputs = get_general_user_inputs()
+    project_lifetime = general_user_inputs["project_lifetime"]
+    design_properties = get_design_properties(choices_list, job_data)
+    number_of_designs = len(design_properties)
+
+    engineering_outputs = engineering_block_batch(
+        general_user_inputs=general_user_inputs,
+        job_data=job_data,
+        design_properties=design_properties,
+        wacc_real=get_wacc_real(general_user_inputs["wacc_nominal"], general_user_inputs["inflation_rate"]),
+    )
+    streams = get_design_streams(general_user_inputs, engineering_outputs, job_data, number_of_designs)
+    factors = get_scenario_factors(scenarios, project_lifetime)
+
+    capex = streams["capex"][:, None] * factors["capex_weight"]
+    opex = streams["opex"] @ factors["opex_factors"].T
+    production = streams["production"] @ factors["production_factors"].T
+    carbon_cost = streams["carbon_footprint"][:, None] * (
+        factors["carbon_price"] * factors["opex_factors"].sum(axis=1)
+    )
+    subsidy = factors["capex_subsidy"] * capex + factors["production_subsidy"] * (
+        streams["production"] @ factors["opex_factors"].T
+    )
+
+    return {
+        "capex": capex,
+        "opex": opex,
+        "production": production,
+        "carbon_cost": carbon_cost,
+        "subsidy": subsidy,
+        "LCOX": (capex + opex + carbon_cost - subsidy) / production,
+    }
+
+
+def run_policy_sweep(choices_list: list[dict[int, dict]] | np.ndarray, job_data, levers: dict[str, Sequence]) -> dict:
+    """Evaluates designs over the grid of the given lever values (see get_scenario_grid and evaluate_scenarios)
+
+    Args:
+        choices_list (list[dict[int, dict]] | np.ndarray): Chosen project designs
+        job_data (JobData): Contains all archetype and vendor data
+        levers (dict[str, Sequence]): lever name -> values
+
+    Returns:
+        _dict_: "scenarios" (lever values per scenario) and "metrics" (designs x scenarios arrays)
+    """
+    scenarios = get_scenario_grid(levers)
+    return {"scenarios": scenarios, "metrics": evaluate_scenarios(choices_list, job_data, scenarios)}
@@ -0,0 +1,191 @@
+# Install packages
+import numpy as np
+
+from src.data_io.design_space import get_design_space
+
+# Constraint types of JobData.option_constraints:
+#   never  - the listed options must not all be chosen together
+#   always - once one listed option is chosen, every block with listed options must choose one of them (listed
+#            options of the same block are alternatives, at most one of them can be chosen)
+NEVER = "never"
+ALWAYS = "always"
+
+
+class OptionConstraints:
+    """Compiled option constraints over the global option index of a design space.
+
+    Each constraint is a bitmask (Python int) over all options of all blocks, used to check single designs and to
+    propagate partial designs. Batches are checked through the inverse map option -> constraints, so the work per
+    design only depends on the constraints its options take part in.
+    """
+
+    def __init__(self, block_sizes, constraints: list[tuple[str, list[int]]]):
+        """
+        Args:
+            block_sizes (array_like): number of options per block
+            constraints (list[tuple[str, list[int]]]): (type, global option indices) per constraint
+        """
+        self.block_sizes = np.asarray(block_sizes, dtype=np.int64)
+        self.block_offsets = np.concatenate(([0], np.cumsum(self.block_sizes)[:-1])).astype(np.int64)
+        self.number_of_options = int(self.block_sizes.sum())
+        self.option_block = np.repeat(np.arange(len(self.block_sizes)), self.block_sizes)
+
+        for constraint_type, _ in constraints:
+            if constraint_type not in (NEVER, ALWAYS):
+                raise ValueError(f"Unknown option constraint type: {constraint_type}")
+
+        self.types = [constraint_type for constraint_type, _ in constraints]
+        self.options = [sorted(set(int(x) for x in options)) for _, options in constraints]
+        self.sizes = np.array([len(options) for options in self.options], dtype=np.int64)
+        self.masks = [sum(1 << x for x in options) for options in self.options]
+        self.is_never = np.array([t == NEVER for t in self.types], dtype=bool)
+        # listed options per block of each constraint, and the number of those blocks
+        self.block_options = [
+            {block: [x for x in options if self.option_block[x] == block] for block in self.option_block[options].tolist()}
+            for options in self.options
+        ]
+        self.block_counts = np.array([len(x) for x in self.block_options], dtype=np.int64)
+
+        # option -> constraints, in compressed sparse row form
+        option_constraints = [[] for _ in range(self.number_of_options)]
+        for k, options in enumerate(self.options):
+            for x in options:
+                option_constraints[x].append(k)
+        self.option_constraint_ptr = np.cumsum([0] + [len(x) for x in option_constraints]).astype(np.int64)
+        self.option_constraint_ids = np.array([k for x in option_constraints for k in x], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    @classmethod
+    def from_job_data(cls, job_data) -> "OptionConstraints":
+        """Compiles JobData.option_constraints over the job's DesignSpaceIndex"""
+        design_space = get_design_space(job_data)
+        return cls(
+            block_sizes=design_space.block_sizes,
+            constraints=[
+                (constraint.type, [design_space.option_id_to_global[x] for x in constraint.options])
+                for constraint in job_data.option_constraints
+            ],
+        )
+
+    def global_options(self, designs: np.ndarray) -> np.ndarray:
+        """Maps option rows (designs x blocks) to the global option index; missing choices stay -1"""
+        designs = np.asarray(designs, dtype=np.int64)
+        return np.where(designs >= 0, designs + self.block_offsets, -1)
+
+    def design_mask(self, design: np.ndarray) -> int:
+        """Bitmask of the chosen options of a (partial) design"""
+        return sum(1 << x for x in self.global_options(design).tolist() if x >= 0)
+
+    def is_feasible(self, design: np.ndarray) -> bool:
+        """Checks a complete design against every constraint, O(constraints) bit operations"""
+        mask = self.design_mask(design)
+        for constraint_type, constraint_mask, block_count in zip(self.types, self.masks, self.block_counts.tolist()):
+            present = mask & constraint_mask
+            if constraint_type == NEVER:
+                if present == constraint_mask:
+                    return False
+            elif present and present.bit_count() < block_count:
+                # a design chooses at most one option per block, so this counts the blocks that comply
+                return False
+        return True
+
+    def check(self, designs: np.ndarray, chunksize: int | None = None) -> np.ndarray:
+        """Vectorised feasibility of a batch of complete designs
+
+        Args:
+            designs (np.ndarray): designs x blocks option rows
+            chunksize (int, optional): designs per chunk, bounds the designs x constraints count table
+
+        Returns:
+            np.ndarray: feasible flag per design
+        """
+        designs = np.atleast_2d(designs)
+        feasible = np.ones(designs.shape[0], dtype=bool)
+        if not len(self):
+            return feasible
+
+        number_of_constraints = len(self)
+        chunksize = chunksize or max(1, min(4096, 2**16 // number_of_constraints))
+        for start in range(0, designs.shape[0], chunksize):
+            options = self.global_options(designs[start : start + chunksize])
+            design_of_option, _ = np.nonzero(options >= 0)
+            options = options[options >= 0]
+
+            # expand every chosen option into the constraints it takes part in
+            degree = self.option_constraint_ptr[options + 1] - self.option_constraint_ptr[options]
+            pair_design = np.repeat(design_of_option, degree)
+            pair_offset = np.arange(degree.sum()) - np.repeat(np.cumsum(degree) - degree, degree)
+            pair_constraint = self.option_constraint_ids[
+                np.repeat(self.option_constraint_ptr[options], degree) + pair_offset
+            ]
+
+            # number of chosen options per touched (design, constraint)
+            keys = pair_design * number_of_constraints + pair_constraint
+            counts = np.bincount(keys)[keys]
+            violated = np.where(
+                self.is_never[pair_constraint],
+                counts == self.sizes[pair_constraint],
+                counts < self.block_counts[pair_constraint],
+            )
+            chunk = feasible[start : start + chunksize]
+            chunk[pair_design[violated]] = False
+        return feasible
+
+    def feasible_options(self, partial_design: np.ndarray) -> list[np.ndarray]:
+        """Propagates the constraints through a partial design
+
+        Args:
+            partial_design (np.ndarray): option row per block, -1 for blocks not chosen yet
+
+        Returns:
+            list[np.ndarray]: per block, a flag per option telling whether it can still be chosen. Chosen blocks
+            only allow their option; all flags are False when the partial design can no longer be completed
+        """
+        partial_design = np.asarray(partial_design, dtype=np.int64)
+        allowed = [np.ones(size, dtype=bool) for size in self.block_sizes.tolist()]
+        for block, row in enumerate(partial_design.tolist()):
+            if row >= 0:
+                allowed[block][:] = False
+                allowed[block][row] = True
+
+        assigned = partial_design >= 0
+        mask = self.design_mask(partial_design)
+        infeasible = [np.zeros(size, dtype=bool) for size in self.block_sizes.tolist()]
+
+        for constraint_type, options, constraint_mask, block_options in zip(
+            self.types, self.options, self.masks, self.block_options
+        ):
+            present = mask & constraint_mask
+
+            if constraint_type == NEVER:
+                missing = [x for x in options if not (mask >> x) & 1]
+                if not missing:
+                    return infeasible
+                block = self.option_block[missing[0]]
+                if len(missing) == 1 and not assigned[block]:
+                    allowed[block][missing[0] - self.block_offsets[block]] = False
+
+            elif present:
+                # triggered: every block without a listed option is restricted to its listed options
+                for block, block_listed in block_options.items():
+                    if any((mask >> x) & 1 for x in block_listed):
+                        continue
+                    if assigned[block]:
+                        return infeasible
+                    forced = np.zeros_like(allowed[block])
+                    rows = np.array(block_listed) - self.block_offsets[block]
+                    forced[rows] = allowed[block][rows]
+                    allowed[block] = forced
+
+            elif len(block_options) > 1 and assigned[list(block_options)].any():
+                # an assigned block chose none of its listed options, so choosing any would violate the constraint
+                for x in options:
+                    block = self.option_block[x]
+                    if not assigned[block]:
+                        allowed[block][x - self.block_offsets[block]] = False
+
+        if any(not flags.any() for flags in allowed):
+            return infeasible
+        return allowed
@@ -0,0 +1,164 @@
+# Install packages
+import time
+from collections.abc import Callable, Iterator
+
+import numpy as np
+
+from engine_interface import get_metrics_batch
+from search_package.constraints import OptionConstraints
+from search_package.pareto import ParetoArchive, get_objective_matrix
+from src.data_io.design_space import get_design_space
+from src.utilities import get_objectives
+
+
+def get_strides(block_sizes: np.ndarray) -> np.ndarray:
+    """Mixed radix place values of the blocks, the last block varying fastest (as itertools.product)"""
+    block_sizes = np.asarray(block_sizes, dtype=np.int64)
+    if int(np.prod(block_sizes.astype(object))) > np.iinfo(np.int64).max:
+        raise ValueError("Design space too large to index with 64 bit integers")
+    strides = np.ones(len(block_sizes), dtype=np.int64)
+    strides[:-1] = np.cumprod(block_sizes[::-1])[::-1][1:]
+    return strides
+
+
+def index_to_designs(indices: np.ndarray, block_sizes: np.ndarray) -> np.ndarray:
+    """Decodes design indices of the cartesian design space into a designs x blocks matrix of option rows"""
+    indices = np.asarray(indices, dtype=np.int64)
+    return indices[:, None] // get_strides(block_sizes) % np.asarray(block_sizes, dtype=np.int64)
+
+
+def designs_to_index(designs: np.ndarray, block_sizes: np.ndarray) -> np.ndarray:
+    """Encodes a designs x blocks matrix of option rows into design indices of the cartesian design space"""
+    return np.atleast_2d(np.asarray(designs, dtype=np.int64)) @ get_strides(block_sizes)
+
+
+class DesignEnumerator:
+    """Lazy, chunked enumeration of the cartesian design space of a job.
+
+    Design i of the space has the mixed radix digits of i as option rows, so a chunk is decoded from a range of
+    indices without materialising the space. Chunks are filtered by the option constraints before they are
+    yielded; memory is bounded by the chunk size.
+    """
+
+    def __init__(self, job_data, chunksize: int = 4096, start: int = 0, stop: int | None = None):
+        """
+        Args:
+            job_data (JobData): Contains all archetype and vendor data
+            chunksize (int): design indices decoded per chunk
+            start (int): first design index, e.g. to split the space over workers
+            stop (int, optional): design index to stop at (exclusive), defaults to the size of the space
+        """
+        self.design_space = get_design_space(job_data)
+        self.constraints = OptionConstraints.from_job_data(job_data)
+        self.strides = get_strides(self.design_space.block_sizes)
+        self.chunksize = chunksize
+        self.start = start
+        self.stop = self.design_space.number_of_designs if stop is None else stop
+
+    def __len__(self) -> int:
+        """Number of design indices in the range, feasible or not"""
+        return max(0, self.stop - self.start)
+
+    def __iter__(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Yields (design indices, designs x blocks option rows) of the feasible designs, chunk by chunk"""
+        for start in range(self.start, self.stop, self.chunksize):
+            indices = np.arange(start, min(start + self.chunksize, self.stop), dtype=np.int64)
+            designs = indices[:, None] // self.strides % self.design_space.block_sizes
+            feasible = self.constraints.check(designs)
+            if feasible.any():
+                yield indices[feasible], designs[feasible]
+
+
+def evaluate_design_space(
+    job_data,
+    chunksize: int = 4096,
+    evaluate: Callable[[np.ndarray], dict[str, np.ndarray]] | None = None,
+    start: int = 0,
+    stop: int | None = None,
+) -> Iterator[dict]:
+    """Streams the metrics of every feasible design of the job, one vectorised batch per chunk
+
+    Args:
+        job_data (JobData): Contains all archetype and vendor data
+        chunksize (int): design indices per chunk
+        evaluate (callable, optional): designs x blocks matrix -> columnar metrics, defaults to get_metrics_batch
+        start (int): first design index
+        stop (int, optional): design index to stop at (exclusive)
+
+    Yields:
+        _dict_: "index" (design indices), "designs" (designs x blocks option rows) and "metrics" (columnar)
+    """
+    evaluate = evaluate or (lambda designs: get_metrics_batch(designs, job_data))
+    for indices, designs in DesignEnumerator(job_data, chunksize=chunksize, start=start, stop=stop):
+        yield {"index": indices, "designs": designs, "metrics": evaluate(designs)}
+
+
+def run_enumeration(
+    job_data,
+    chunksize: int = 4096,
+    evaluate: Callable[[np.ndarray], dict[str, np.ndarray]] | None = None,
+    pareto: bool = True,
+    on_chunk: Callable[[dict], None] | None = None,
+) -> dict:
+    """Evaluates the whole design space of a job, keeping only the best designs per driver and the Pareto front
+
+    Args:
+        job_data (JobData): Contains all archetype and vendor data
+        chunksize (int): design indices per chunk
+        evaluate (callable, optional): designs x blocks matrix -> columnar metrics, defaults to get_metrics_batch
+        pareto (bool): maintain a ParetoArchive over the objective drivers
+        on_chunk (callable, optional): called with every evaluated chunk, e.g. to write the results out
+
+    Returns:
+        _dict_: best design per driver, Pareto front (design indices) and throughput
+    """
+    design_space = get_design_space(job_data)
+    objectives = get_objectives(job_data)
+    archive = None
+    best = {}  # driver -> (value, design index)
+    number_of_designs = 0
+
+    tic = time.perf_counter()
+    for chunk in evaluate_design_space(job_data, chunksize=chunksize, evaluate=evaluate):
+        number_of_designs += len(chunk["index"])
+        results = chunk["metrics"]
+
+        for driver, metric, direction in objectives:
+            scores = np.asarray(results.get(metric, []), dtype=float) * direction
+            if not np.isfinite(scores).any():
+                continue
+            i = int(np.argmax(np.where(np.isfinite(scores), scores, -np.inf)))
+            if driver not in best or scores[i] > direction * best[driver][0]:
+                best[driver] = (float(results[metric][i]), int(chunk["index"][i]))
+
+        if pareto:
+            # the objective columns are fixed by the first chunk, so all chunks share one archive
+            points, drivers = get_objective_matrix(results, job_data)
+            if archive is None:
+                archive, pareto_drivers = ParetoArchive(len(drivers)), drivers
+            aligned = np.full((len(points), len(pareto_drivers)), np.inf)
+            for column, driver in enumerate(pareto_drivers):
+                if driver in drivers:
+                    aligned[:, column] = points[:, drivers.index(driver)]
+            archive.add(aligned, chunk["index"].tolist())
+
+        if on_chunk is not None:
+            on_chunk(chunk)
+
+    elapsed = time.perf_counter() - tic
+    return {
+        "best": {
+            driver: {
+                "value": value,
+                "index": index,
+                "choices": design_space.decode(index_to_designs([index], design_space.block_sizes)[0]),
+            }
+            for driver, (value, index) in best.items()
+        },
+        "pareto_front": sorted(archive.items) if archive is not None else [],
+        "pareto_drivers": pareto_drivers if archive is not None else [],
+        "space_size": design_space.number_of_designs,
+        "feasible_designs": number_of_designs,
+        "elapsed": elapsed,
+        "designs_per_second": number_of_designs / elapsed if elapsed else 0.0,
+    }
@@ -0,0 +1,266 @@
+# Install packages
+import math
+import time
+
+import numpy as np
+
+from engine_interface import get_metrics_batch
+from search_package.constraints import OptionConstraints
+from search_package.priors import PriorScorer
+from src.data_io.design_space import get_design_space
+from src.utilities import get_objectives
+
+
+class Node:
+    """Search statistics of a partial design (an entry of the transposition table)"""
+
+    __slots__ = ("visits", "value", "virtual", "children", "untried")
+
+    def __init__(self):
+        self.visits = 0
+        self.value = 0.0
+        self.virtual = 0  # pending visits of the batch being collected (virtual loss)
+        self.children = []  # option rows of the next block that have a node
+        self.untried = None  # option rows of the next block not expanded yet (None until first visit)
+
+
+class MCTS:
+    """Monte Carlo tree search over the designs of a job ("mcts.1").
+
+    Blocks are decided in the order of JobData.blocks; a node is the partial design of the first blocks and is
+    stored in a transposition table keyed by that partial design. Leaves are completed by random rollouts that
+    respect the option constraints and evaluated in batches through get_metrics_batch. The reward of a design is
+    the mean over the objective drivers of its min-max normalised score (1 best, 0 worst or missing).
+
+    With rollout_policy="prior", rollouts sample options by their block prior scores (see PriorScorer) and nodes
+    expand their children from the best prior score down.
+    """
+
+    def __init__(
+        self,
+        job_data,
+        evaluate=None,
+        exploration: float = 1.4,
+        batch_size: int = 32,
+        seed: int | None = None,
+        rollout_policy: str = "random",
+        prior_temperature: float = 0.25,
+    ):
+        """
+        Args:
+            job_data (JobData): Contains all archetype and vendor data
+            evaluate (callable, optional): designs x blocks matrix -> columnar metrics, defaults to
+                get_metrics_batch
+            exploration (float): UCT exploration constant
+            batch_size (int): leaves collected per batched evaluation
+            seed (int, optional): random seed
+            rollout_policy (str): "random" (uniform over feasible options) or "prior" (weighted by block priors)
+            prior_temperature (float): softmax temperature of the prior policy
+        """
+        self.job_data = job_data
+        self.design_space = get_design_space(job_data)
+        self.constraints = OptionConstraints.from_job_data(job_data)
+        self.evaluate = evaluate or (lambda designs: get_metrics_batch(designs, job_data))
+        self.exploration = exploration
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(seed)
+        self.objectives = get_objectives(job_data)
+
+        if rollout_policy == "random":
+            self.option_weights = None
+        elif rollout_policy == "prior":
+            self.option_weights = PriorScorer(job_data).option_weights(
+                [driver for driver, _, _ in self.objectives], temperature=prior_temperature
+            )
+        else:
+            raise ValueError(f"Unknown rollout policy: {rollout_policy}")
+
+        self.bounds = {metric: [math.inf, -math.inf] for _, metric, _ in self.objectives}
+        self.table = {b"": Node()}  # transposition table: partial design -> Node
+        self.evaluated = {}  # complete design -> metrics
+        self.best = {}  # driver -> (value, design key)
+        self.history = []
+        self.rollouts = 0
+
+    def run(self, max_rollouts: int = 1000, time_limit: float | None = None) -> dict:
+        """Runs the search until the rollout budget or the wall-clock limit is used up
+
+        Args:
+            max_rollouts (int): number of rollouts (simulations)
+            time_limit (float, optional): wall-clock limit in seconds
+
+        Returns:
+            _dict_: best design per driver, throughput and convergence history
+        """
+        tic = time.perf_counter()
+        evaluation_time = 0.0
+        while self.rollouts < max_rollouts and (time_limit is None or time.perf_counter() - tic < time_limit):
+            leaves = [self._select() for _ in range(min(self.batch_size, max_rollouts - self.rollouts))]
+            self.rollouts += len(leaves)
+
+            new_designs = {}
+            for _, design in leaves:
+                if design is not None:
+                    key = design.tobytes()
+                    if key not in self.evaluated:
+                        new_designs[key] = design
+            if new_designs:
+                toc = time.perf_counter()
+                self._record(list(new_designs), self.evaluate(np.stack(list(new_designs.values()))))
+                evaluation_time += time.perf_counter() - toc
+
+            for path, design in leaves:
+                reward = 0.0 if design is None else self._reward(self.evaluated[design.tobytes()])
+                self._backpropagate(path, reward)
+
+            self.history.append(
+                {
+                    "rollouts": self.rollouts,
+                    "evaluations": len(self.evaluated),
+                    "elapsed": time.perf_counter() - tic,
+                    "best": {driver: value for driver, (value, _) in self.best.items()},
+                }
+            )
+
+        elapsed = time.perf_counter() - tic
+        return {
+            "best": {
+                driver: {
+                    "value": value,
+                    "design": np.frombuffer(key, dtype=np.int64),
+                    "choices": self.design_space.decode(np.frombuffer(key, dtype=np.int64)),
+                }
+                for driver, (value, key) in self.best.items()
+            },
+            "rollouts": self.rollouts,
+            "evaluations": len(self.evaluated),
+            "elapsed": elapsed,
+            "rollouts_per_second": self.rollouts / elapsed if elapsed else 0.0,
+            "designs_per_second": len(self.evaluated) / evaluation_time if evaluation_time else 0.0,
+            "history": self.history,
+        }
+
+    def _select(self) -> tuple[list[Node], np.ndarray | None]:
+        """Walks the tree by UCT, expands one node and completes the design by a rollout
+
+        Returns:
+            _tuple_: nodes on the path and the complete design (None at a dead end)
+        """
+        design = np.full(len(self.design_space), -1, dtype=np.int64)
+        node = self.table[b""]
+        path = [node]
+
+        for depth in range(len(design)):
+            if node.untried is None:
+                allowed = self.constraints.feasible_options(design)[depth]
+                node.untried = np.flatnonzero(allowed).tolist()
+                self.rng.shuffle(node.untried)
+                if self.option_weights is not None:
+                    # popped from the end, so the best prior is expanded first
+                    node.untried.sort(key=lambda row: self.option_weights[depth][row])
+
+            if node.untried:
+                design[depth] = node.untried.pop()
+                node.children.append(int(design[depth]))
+                node = self.table.setdefault(design[: depth + 1].tobytes(), Node())
+                path.append(node)
+                break
+
+            if not node.children:
+                return self._mark(path), None
+
+            design[depth] = self._best_child(node, design, depth)
+            node = self.table[design[: depth + 1].tobytes()]
+            path.append(node)
+
+        return self._mark(path), self._rollout(design)
+
+    def _best_child(self, node: Node, design: np.ndarray, depth: int) -> int:
+        """Child with the highest upper confidence bound, counting pending visits as losses"""
+        log_visits = math.log(node.visits + node.virtual + 1)
+        best_score, best_row = -math.inf, node.children[0]
+        for row in node.children:
+            design[depth] = row
+            child = self.table[design[: depth + 1].tobytes()]
+            visits = child.visits + child.virtual
+            if visits == 0:
+                return row
+            score = child.value / visits + self.exploration * math.sqrt(log_visits / visits)
+            if score > best_score:
+                best_score, best_row = score, row
+        return best_row
+
+    def _rollout(self, design: np.ndarray) -> np.ndarray | None:
+        """Completes a partial design with random feasible options (None at a dead end)"""
+        design = design.copy()
+        for depth in np.flatnonzero(design < 0).tolist():
+            allowed = np.flatnonzero(self.constraints.feasible_options(design)[depth])
+            if not allowed.size:
+                return None
+            if self.option_weights is None:
+                design[depth] = self.rng.choice(allowed)
+            else:
+                weights = self.option_weights[depth][allowed]
+                design[depth] = self.rng.choice(allowed, p=weights / weights.sum())
+        return design if self.constraints.is_feasible(design) else None
+
+    def _mark(self, path: list[Node]) -> list[Node]:
+        for node in path:
+            node.virtual += 1
+        return path
+
+    def _backpropagate(self, path: list[Node], reward: float):
+        for node in path:
+            node.virtual -= 1
+            node.visits += 1
+            node.value += reward
+
+    def _record(self, keys: list[bytes], results: dict[str, np.ndarray]):
+        """Stores the metrics of newly evaluated designs and updates the normalisation bounds and best designs"""
+        for i, key in enumerate(keys):
+            self.evaluated[key] = {metric: float(values[i]) for metric, values in results.items()}
+
+        for driver, metric, direction in self.objectives:
+            values = np.asarray(results.get(metric, []), dtype=float)
+            if not np.isfinite(values).any():
+                continue
+            bounds = self.bounds[metric]
+            bounds[0] = min(bounds[0], np.nanmin(values[np.isfinite(values)]))
+            bounds[1] = max(bounds[1], np.nanmax(values[np.isfinite(values)]))
+
+            scores = np.where(np.isfinite(values), direction * values, -np.inf)
+            i = int(np.argmax(scores))
+            if driver not in self.best or scores[i] > direction * self.best[driver][0]:
+                self.best[driver] = (float(values[i]), keys[i])
+
+    def _reward(self, metrics: dict[str, float]) -> float:
+        """Mean normalised score over the objectives with a known range"""
+        scores = []
+        for _, metric, direction in self.objectives:
+            low, high = self.bounds[metric]
+            if low > high:
+                continue
+            value = metrics.get(metric, math.nan)
+            if not math.isfinite(value):
+                scores.append(0.0)
+            elif high == low:
+                scores.append(1.0)
+            else:
+                score = (value - low) / (high - low)
+                scores.append(score if direction > 0 else 1.0 - score)
+        return sum(scores) / len(scores) if scores else 0.0
+
+
+def run_mcts(job_data, max_rollouts: int = 1000, time_limit: float | None = None, **kwargs) -> dict:
+    """Runs a Monte Carlo tree search over the designs of a job (see MCTS)
+
+    Args:
+        job_data (JobData): Contains all archetype and vendor data
+        max_rollouts (int): number of rollouts
+        time_limit (float, optional): wall-clock limit in seconds
+        **kwargs: MCTS options (evaluate, exploration, batch_size, seed, rollout_policy, prior_temperature)
+
+    Returns:
+        _dict_: best design per driver, throughput and convergence history
+    """
+    return MCTS(job_data, **kwargs).run(max_rollouts=max_rollouts, time_limit=time_limit)
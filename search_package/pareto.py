@@ -0,0 +1,199 @@
+# Install packages
+from bisect import bisect_right
+
+import numpy as np
+
+from src.utilities import get_objectives
+
+
+def get_objective_matrix(results: dict[str, np.ndarray], job_data) -> tuple[np.ndarray, list[str]]:
+    """Builds the (designs x objectives) matrix to minimise from a columnar result set
+
+    Objective drivers of the job whose metric is missing or never finite are left out; maximised drivers are
+    negated and missing values become +inf (worst).
+
+    Args:
+        results (dict[str, np.ndarray]): columnar metrics, e.g. from get_metrics_batch
+        job_data (JobData): Contains all archetype and vendor data
+
+    Returns:
+        _tuple_: objective matrix and the driver name of each column
+    """
+    columns, drivers = [], []
+    for driver, metric, direction in get_objectives(job_data):
+        values = np.asarray(results.get(metric, []), dtype=float)
+        if values.size and np.isfinite(values).any():
+            columns.append(np.where(np.isfinite(values), -direction * values, np.inf))
+            drivers.append(driver)
+    number_of_designs = len(next(iter(results.values()))) if results else 0
+    if not columns:
+        return np.zeros((number_of_designs, 0)), drivers
+    return np.stack(columns, axis=1), drivers
+
+
+def non_dominated(points: np.ndarray) -> np.ndarray:
+    """Flags the non-dominated points (minimisation); identical points do not dominate each other
+
+    Sort based for up to 3 objectives (O(n log n)); beyond that vectorised pairwise dominance against the front.
+
+    Args:
+        points (np.ndarray): points x objectives
+
+    Returns:
+        np.ndarray: non-dominated flag per point
+    """
+    points = np.asarray(points, dtype=float)
+    if points.shape[0] == 0 or points.shape[1] == 0:
+        return np.ones(points.shape[0], dtype=bool)
+
+    # duplicates share their flag; np.unique also sorts lexicographically
+    unique, inverse = np.unique(points, axis=0, return_inverse=True)
+    if unique.shape[1] == 1:
+        front = np.arange(len(unique)) == 0
+    elif unique.shape[1] == 2:
+        front = _non_dominated_2d(unique)
+    elif unique.shape[1] == 3:
+        front = _non_dominated_3d(unique)
+    else:
+        front = _non_dominated_nd(unique)
+    return front[inverse.reshape(-1)]
+
+
+def _non_dominated_2d(points: np.ndarray) -> np.ndarray:
+    """Unique points in lexicographic order: a point is dominated iff an earlier point has a lower or equal f1"""
+    front = np.ones(len(points), dtype=bool)
+    front[1:] = points[1:, 1] < np.minimum.accumulate(points[:-1, 1])
+    return front
+
+
+def _non_dominated_3d(points: np.ndarray) -> np.ndarray:
+    """Unique points in lexicographic order, swept with a staircase of the (f1, f2) of the front so far"""
+    front = np.zeros(len(points), dtype=bool)
+    stair_f1, stair_f2 = [], []  # f1 increasing, f2 decreasing
+    for i, (_, f1, f2) in enumerate(points.tolist()):
+        position = bisect_right(stair_f1, f1)
+        if position and stair_f2[position - 1] <= f2:
+            continue
+        front[i] = True
+        # drop the staircase points the new point dominates
+        end = position
+        while end < len(stair_f1) and stair_f2[end] >= f2:
+            end += 1
+        stair_f1[position:end] = [f1]
+        stair_f2[position:end] = [f2]
+    return front
+
+
+def _non_dominated_nd(points: np.ndarray, chunksize: int = 1024) -> np.ndarray:
+    """Unique points in lexicographic order, checked chunk by chunk against the front so far and each other
+
+    A dominating point always comes earlier in lexicographic order, so only the (usually small) front found so
+    far has to be compared with instead of all points.
+    """
+    front = np.zeros(len(points), dtype=bool)
+    front_points = points[:0]
+    for start in range(0, len(points), chunksize):
+        chunk = np.arange(start, min(start + chunksize, len(points)))
+        chunk = chunk[_dominance_counts(points[chunk], front_points) == 0]
+        chunk = chunk[_dominance_counts(points[chunk], points[chunk]) == 0]
+        front[chunk] = True
+        front_points = np.concatenate((front_points, points[chunk]))
+    return front
+
+
+def _dominance_counts(candidates: np.ndarray, points: np.ndarray, chunksize: int = 1024) -> np.ndarray:
+    """Number of points dominating each candidate, in chunks of candidates x points x objectives"""
+    counts = np.zeros(len(candidates), dtype=np.int64)
+    for start in range(0, len(candidates), chunksize):
+        chunk = candidates[start : start + chunksize, None, :]
+        dominates = np.all(points[None, :, :] <= chunk, axis=-1) & np.any(points[None, :, :] < chunk, axis=-1)
+        counts[start : start + chunksize] = dominates.sum(axis=1)
+    return counts
+
+
+def non_dominated_sort(points: np.ndarray) -> np.ndarray:
+    """Pareto rank of every point (0 for the first front)
+
+    Up to 3 objectives the fronts are peeled with the sort based non_dominated; beyond that the fast non-dominated
+    sort (Deb et al.) runs on a vectorised dominance matrix.
+
+    Args:
+        points (np.ndarray): points x objectives (minimisation)
+
+    Returns:
+        np.ndarray: front index per point
+    """
+    points = np.asarray(points, dtype=float)
+    ranks = np.full(points.shape[0], -1, dtype=np.int64)
+
+    if points.shape[1] <= 3:
+        remaining = np.arange(points.shape[0])
+        rank = 0
+        while remaining.size:
+            front = non_dominated(points[remaining])
+            ranks[remaining[front]] = rank
+            remaining = remaining[~front]
+            rank += 1
+        return ranks
+
+    dominates = np.zeros((points.shape[0], points.shape[0]), dtype=bool)  # [i, j]: i dominates j
+    for start in range(0, points.shape[0], 1024):
+        chunk = points[start : start + 1024, None, :]
+        dominates[start : start + 1024] = np.all(chunk <= points[None], axis=-1) & np.any(chunk < points[None], axis=-1)
+    counts = dominates.sum(axis=0)
+    front = counts == 0
+    rank = 0
+    while front.any():
+        ranks[front] = rank
+        counts -= dominates[front].sum(axis=0)
+        counts[front] = -1
+        front = counts == 0
+        rank += 1
+    return ranks
+
+
+def pareto_front(results: dict[str, np.ndarray], job_data) -> np.ndarray:
+    """Indices of the non-dominated designs of a columnar result set over the job's objective drivers"""
+    points, _ = get_objective_matrix(results, job_data)
+    return np.flatnonzero(non_dominated(points))
+
+
+class ParetoArchive:
+    """Incrementally updated set of non-dominated points, e.g. for streaming evaluation results"""
+
+    def __init__(self, number_of_objectives: int):
+        self.points = np.zeros((0, number_of_objectives))
+        self.items = []
+        # number of points added so far, the default item of the next point
+        self.added = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, points: np.ndarray, items: list | None = None) -> np.ndarray:
+        """Adds a batch of points, keeping only the non-dominated ones
+
+        Args:
+            points (np.ndarray): points x objectives (minimisation)
+            items (list, optional): payload per point (e.g. design keys), defaults to the index of the point
+                among all points added to the archive
+
+        Returns:
+            np.ndarray: flag per added point telling whether it entered the archive
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        if items is None:
+            items = list(range(self.added, self.added + len(points)))
+        self.added += len(points)
+
+        accepted = non_dominated(points)
+        if len(self.items):
+            candidates = np.flatnonzero(accepted)
+            accepted[candidates[_dominance_counts(points[candidates], self.points) > 0]] = False
+            kept = _dominance_counts(self.points, points[accepted]) == 0
+            self.points = self.points[kept]
+            self.items = [item for item, keep in zip(self.items, kept.tolist()) if keep]
+
+        self.points = np.concatenate((self.points, points[accepted]))
+        self.items.extend(item for item, accept in zip(items, accepted.tolist()) if accept)
+        return accepted
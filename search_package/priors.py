@@ -0,0 +1,139 @@
+# Install packages
+import numpy as np
+
+from src.data_io.design_space import get_design_space
+from src.utilities import DRIVER_DIRECTIONS
+
+
+def _weighted_sum(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    return values @ weights
+
+
+def _weighted_product(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    # weighted product model: the weights are exponents
+    return np.prod(values**weights, axis=-1)
+
+
+def _weighted_mean(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    return values @ weights / weights.sum()
+
+
+def _weighted_min(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    return np.min(values * weights, axis=-1)
+
+
+def _weighted_max(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    return np.max(values * weights, axis=-1)
+
+
+# PriorData.aggregation -> vectorised aggregation of (options x properties) values with per-property weights
+AGGREGATIONS = {
+    "sum": _weighted_sum,
+    "product": _weighted_product,
+    "mean": _weighted_mean,
+    "min": _weighted_min,
+    "max": _weighted_max,
+}
+
+
+class PriorScorer:
+    """Compiled block priors (BlockData.priors) of a job.
+
+    A prior scores the options of a block for one driver by aggregating weighted option properties. Scores are
+    evaluated once per block and driver as a vector over the options; a design scores the sum of the scores of
+    its chosen options. Options missing any prior property score NaN.
+    """
+
+    def __init__(self, job_data):
+        self.design_space = get_design_space(job_data)
+        self.drivers = sorted({driver for block in job_data.blocks.values() for driver in block.priors})
+
+        # driver -> blocks x (max options + 1) table of option scores, last column NaN for missing choices
+        width = int(self.design_space.block_sizes.max(initial=0)) + 1
+        self.tables = {driver: np.full((len(self.design_space), width), np.nan) for driver in self.drivers}
+
+        for position, block in enumerate(self.design_space.blocks):
+            for driver, prior in job_data.blocks[block.uuid].priors.items():
+                self.tables[driver][position, : len(block)] = self._score_block(block, prior)
+
+    @staticmethod
+    def _score_block(block, prior) -> np.ndarray:
+        """Scores all options of a block for one prior in one vectorised aggregation"""
+        aggregate = AGGREGATIONS.get(prior.aggregation)
+        if aggregate is None:
+            raise ValueError(f"Unknown prior aggregation: {prior.aggregation}")
+        if not prior.properties:
+            return np.full(len(block), np.nan)
+
+        # prior properties use display names (e.g. ratedPower), option properties the lower case name
+        values = np.stack([block.get_property(x.property.lower()) for x in prior.properties], axis=-1)
+        weights = np.array([x.weight for x in prior.properties])
+        return aggregate(values, weights)
+
+    def score_options(self, block_uuid: str, driver: str) -> np.ndarray:
+        """Prior score of every option of a block for a driver (NaN where the block has no prior)"""
+        position = self.design_space.block_position[block_uuid]
+        table = self.tables.get(driver)
+        if table is None:
+            return np.full(len(self.design_space.blocks[position]), np.nan)
+        return table[position, : len(self.design_space.blocks[position])]
+
+    def score_designs(self, designs: np.ndarray, driver: str) -> np.ndarray:
+        """Prior score of a batch of designs for a driver, the sum over blocks of the chosen option scores
+
+        Args:
+            designs (np.ndarray): designs x blocks option rows (-1 scores NaN)
+            driver (str): driver name
+
+        Returns:
+            np.ndarray: score per design
+        """
+        designs = np.atleast_2d(designs)
+        table = self.tables.get(driver)
+        if table is None:
+            return np.full(designs.shape[0], np.nan)
+        return table[np.arange(len(self.design_space)), designs].sum(axis=1)
+
+    def score_all(self, designs: np.ndarray) -> dict[str, np.ndarray]:
+        """Prior scores of a batch of designs for every driver with priors"""
+        return {driver: self.score_designs(designs, driver) for driver in self.drivers}
+
+    def rank_options(self, block_uuid: str, driver: str) -> np.ndarray:
+        """Option rows of a block from best to worst prior score for the driver's direction (NaN last)"""
+        scores = DRIVER_DIRECTIONS.get(driver, -1) * self.score_options(block_uuid, driver)
+        return np.argsort(np.where(np.isnan(scores), np.inf, -scores), kind="stable")
+
+    def prune_options(self, block_uuid: str, driver: str, keep: int) -> np.ndarray:
+        """Pre-screens a block down to the option rows with the best prior scores"""
+        return np.sort(self.rank_options(block_uuid, driver)[:keep])
+
+    def option_weights(self, drivers: list[str], temperature: float = 1.0) -> list[np.ndarray]:
+        """Sampling probabilities per block for a prior-guided rollout policy
+
+        Each option gets the mean over drivers of its min-max normalised, direction adjusted score within the
+        block (0.5 where unknown), turned into probabilities by a softmax with the given temperature.
+
+        Args:
+            drivers (list[str]): drivers to combine
+            temperature (float): softmax temperature, higher is closer to uniform
+
+        Returns:
+            list[np.ndarray]: option probabilities per block
+        """
+        weights = []
+        for position, block in enumerate(self.design_space.blocks):
+            scores = []
+            for driver in drivers:
+                if driver not in self.tables:
+                    continue
+                values = DRIVER_DIRECTIONS.get(driver, -1) * self.tables[driver][position, : len(block)]
+                finite = np.isfinite(values)
+                if not finite.any():
+                    continue
+                low, high = values[finite].min(), values[finite].max()
+                normalised = (values - low) / (high - low) if high > low else np.ones_like(values)
+                scores.append(np.where(finite, normalised, 0.5))
+            score = np.mean(scores, axis=0) if scores else np.full(len(block), 0.5)
+            probabilities = np.exp((score - score.max()) / temperature)
+            weights.append(probabilities / probabilities.sum())
+        return weights
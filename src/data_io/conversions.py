@@ -0,0 +1,192 @@
+import weakref
+from collections import deque
+from typing import Any
+
+import numpy as np
+
+
+class UnitConverter:
+    """Compiled unit conversions of a job (JobData.conversions).
+
+    Every conversion category is a graph of units whose edges are the listed conversions (and their inverses).
+    Factors between all connected units are resolved once by a breadth first search from each unit, so chained
+    conversions (e.g. km -> m -> feet) cost a dictionary lookup and arrays are converted with a single multiply.
+    """
+
+    def __init__(self, conversions: dict[str, Any]):
+        """
+        Args:
+            conversions (dict[str, ConversionCategoryData]): conversion category -> conversions
+        """
+        # category -> from unit -> to unit -> factor
+        self.factors: dict[str, dict[str, dict[str, float]]] = {}
+        # category -> units converted to (the target system of the category, e.g. imperial units)
+        self.target_units: dict[str, set[str]] = {}
+
+        for category, category_data in conversions.items():
+            graph = {}
+            for conversion in category_data.conversions:
+                factor = conversion.to_value / conversion.from_value
+                graph.setdefault(conversion.from_unit, {})[conversion.to_unit] = factor
+                graph.setdefault(conversion.to_unit, {})[conversion.from_unit] = 1 / factor
+            self.factors[category] = {unit: self._resolve(graph, unit) for unit in graph}
+            # units only converted to (the end of a chain) when there are any, otherwise all converted to units
+            to_units = {conversion.to_unit for conversion in category_data.conversions}
+            from_units = {conversion.from_unit for conversion in category_data.conversions}
+            self.target_units[category] = (to_units - from_units) or to_units
+
+    @classmethod
+    def from_job_data(cls, job_data) -> "UnitConverter":
+        return cls(job_data.conversions)
+
+    @staticmethod
+    def _resolve(graph: dict[str, dict[str, float]], source: str) -> dict[str, float]:
+        """Factors from a unit to every unit reachable from it, over the fewest conversion steps"""
+        factors = {source: 1.0}
+        queue = deque([source])
+        while queue:
+            unit = queue.popleft()
+            for neighbour, factor in graph[unit].items():
+                if neighbour not in factors:
+                    factors[neighbour] = factors[unit] * factor
+                    queue.append(neighbour)
+        return factors
+
+    def _get_category(self, from_unit: str, category: str | None) -> str:
+        if category is not None:
+            return category
+        for name, factors in self.factors.items():
+            if from_unit in factors:
+                return name
+        raise KeyError(f"No conversion category for unit: {from_unit}")
+
+    def factor(self, from_unit: str, to_unit: str, category: str | None = None) -> float:
+        """Multiplication factor from one unit to another
+
+        Args:
+            from_unit (str): unit of the values
+            to_unit (str): unit to convert to
+            category (str, optional): conversion category, defaults to the first category knowing from_unit
+
+        Returns:
+            float: conversion factor
+        """
+        if from_unit == to_unit:
+            return 1.0
+        factors = self.factors[self._get_category(from_unit, category)]
+        try:
+            return factors[from_unit][to_unit]
+        except KeyError:
+            raise KeyError(f"No conversion from {from_unit} to {to_unit}") from None
+
+    def target_unit(self, si_unit: str | None, category: str) -> str | None:
+        """Unit an SI unit converts to in a category: the closest target unit of the category (None if none)"""
+        factors = self.factors.get(category, {}).get(si_unit)
+        if factors is None:
+            return None
+        if si_unit in self.target_units[category]:
+            return si_unit
+        # the resolved factors are in breadth first order, so the first target unit is the closest one
+        return next((unit for unit in factors if unit in self.target_units[category]), None)
+
+    def convert(self, values, from_unit: str, to_unit: str, category: str | None = None) -> np.ndarray:
+        """Converts a scalar or an array of values in one vectorised multiply"""
+        return np.asarray(values, dtype=float) * self.factor(from_unit, to_unit, category)
+
+    def get_factors(self, units: list[str | None], category: str) -> tuple[np.ndarray, list[str | None]]:
+        """Factors and target units for a list of SI units; units without a conversion keep factor 1
+
+        Args:
+            units (list[str | None]): SI unit per column (e.g. PropertyData.si_unit)
+            category (str): conversion category
+
+        Returns:
+            _tuple_: factor per column and the converted unit per column
+        """
+        factors = np.ones(len(units))
+        converted = list(units)
+        for column, unit in enumerate(units):
+            target = self.target_unit(unit, category)
+            if target is not None:
+                factors[column] = self.factors[category][unit][target]
+                converted[column] = target
+        return factors, converted
+
+    def convert_array(self, array: np.ndarray, units: list[str | None], category: str):
+        """Converts the columns of a (rows x columns) array given the SI unit of each column
+
+        Args:
+            array (np.ndarray): values, the last axis are the columns
+            units (list[str | None]): SI unit per column
+            category (str): conversion category, e.g. "SI to Imperial"
+
+        Returns:
+            _tuple_: converted array and the unit per column
+        """
+        factors, converted = self.get_factors(units, category)
+        return np.asarray(array, dtype=float) * factors, converted
+
+    def convert_results(self, results: dict[str, Any], units: dict[str, str | None], category: str):
+        """Converts a columnar result set (e.g. from get_metrics_batch) given the SI unit of each metric
+
+        Args:
+            results (dict[str, Any]): metric -> values (scalar or array)
+            units (dict[str, str | None]): metric -> SI unit, metrics not listed are kept as they are
+            category (str): conversion category
+
+        Returns:
+            _tuple_: converted results and the unit per metric
+        """
+        names = list(results)
+        factors, converted = self.get_factors([units.get(name) for name in names], category)
+        return (
+            {
+                name: results[name] if factor == 1.0 else np.asarray(results[name], dtype=float) * factor
+                for name, factor in zip(names, factors.tolist())
+            },
+            dict(zip(names, converted)),
+        )
+
+    def convert_properties(self, properties: dict[str, Any], category: str) -> dict[str, tuple[Any, str | None]]:
+        """Converts PropertyData values (option properties, parameters) by their si_unit
+
+        Args:
+            properties (dict[str, PropertyData]): property name -> property
+            category (str): conversion category
+
+        Returns:
+            _dict_: property name -> (converted value, unit); non-numeric values are kept as they are
+        """
+        converted = {}
+        for name, prop in properties.items():
+            target = self.target_unit(prop.si_unit, category)
+            if target is None or prop.value is None:
+                converted[name] = (prop.value, prop.si_unit)
+                continue
+            try:
+                converted[name] = (float(prop.value) * self.factors[category][prop.si_unit][target], target)
+            except (TypeError, ValueError):
+                converted[name] = (prop.value, prop.si_unit)
+        return converted
+
+
+_unit_converters: dict[int, tuple[Any, UnitConverter]] = {}
+
+
+def get_unit_converter(job_data) -> UnitConverter:
+    """Gets the UnitConverter of a job, compiling it on first use
+
+    Args:
+        job_data (JobData): Contains all archetype and vendor data
+
+    Returns:
+        UnitConverter: compiled conversions, kept for as long as job_data is alive
+    """
+    key = id(job_data)
+    entry = _unit_converters.get(key)
+    if entry is not None and entry[0]() is job_data:
+        return entry[1]
+
+    unit_converter = UnitConverter.from_job_data(job_data)
+    _unit_converters[key] = (weakref.ref(job_data, lambda _: _unit_converters.pop(key, None)), unit_converter)
+    return unit_converter
@@ -0,0 +1,174 @@
+import weakref
+from typing import Any
+
+import numpy as np
+
+from src.utilities import to_float
+
+
+class BlockIndex:
+    """Dense option x property matrix of a block, with option id/name <-> row maps.
+
+    The matrix has one extra all-NaN row at the end, so a missing choice (row -1) reads as NaN.
+    """
+
+    def __init__(self, block_data):
+        self.uuid = block_data.uuid
+        self.name = block_data.name
+        options = [option for choice in block_data.choices.values() for option in choice.options.values()]
+
+        self.option_ids = np.array([option.id for option in options], dtype=np.int64)
+        self.option_names = [option.name for option in options]
+        self.options = options
+        self.id_to_row = {option.id: row for row, option in enumerate(options)}
+        self.name_to_row = {option.name: row for row, option in enumerate(options)}
+
+        self.property_names = list(dict.fromkeys(name for option in options for name in option.properties))
+        self.property_to_column = {name: column for column, name in enumerate(self.property_names)}
+
+        self.matrix = np.full((len(options) + 1, len(self.property_names)), np.nan)
+        for row, option in enumerate(options):
+            for name, prop in option.properties.items():
+                self.matrix[row, self.property_to_column[name]] = to_float(prop.value)
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def get_property(self, property_name: str) -> np.ndarray:
+        """Gets a property for every option of the block (NaN where missing)"""
+        column = self.property_to_column.get(property_name)
+        if column is None:
+            return np.full(len(self.options), np.nan)
+        return self.matrix[:-1, column]
+
+
+class DesignSpaceIndex:
+    """Compiled design space of a job: a design is an integer vector with the chosen option row per block.
+
+    Built once from JobData.blocks; designs are evaluated by fancy-indexing the block matrices.
+    """
+
+    def __init__(self, job_data):
+        self.blocks = [BlockIndex(block_data) for block_data in job_data.blocks.values()]
+        self.block_uuids = [block.uuid for block in self.blocks]
+        self.block_position = {uuid: position for position, uuid in enumerate(self.block_uuids)}
+        self.block_sizes = np.array([len(block) for block in self.blocks], dtype=np.int64)
+        # offset of each block in the global option index (all options of all blocks)
+        self.block_offsets = np.concatenate(([0], np.cumsum(self.block_sizes)[:-1])).astype(np.int64)
+        self.option_ids = np.concatenate([block.option_ids for block in self.blocks])
+        self.option_id_to_global = {option_id: index for index, option_id in enumerate(self.option_ids.tolist())}
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    @property
+    def number_of_options(self) -> int:
+        return int(self.block_sizes.sum())
+
+    @property
+    def number_of_designs(self) -> int:
+        """Size of the full cartesian design space"""
+        return int(np.prod(self.block_sizes.astype(object)))
+
+    def block(self, block_uuid: str) -> BlockIndex:
+        return self.blocks[self.block_position[block_uuid]]
+
+    def encode(self, choices: dict[str, dict]) -> np.ndarray:
+        """Converts a choices dict (as returned by get_choices) into a design vector
+
+        Args:
+            choices (dict[str, dict]): block uuid -> {option name: properties}
+
+        Returns:
+            np.ndarray: chosen option row per block (-1 where the block has no choice)
+        """
+        design = np.full(len(self.blocks), -1, dtype=np.int64)
+        for block_uuid, block_data in choices.items():
+            position = self.block_position.get(block_uuid)
+            if position is not None and block_data:
+                # the chosen option is the last entry of the block, as in the engineering metrics
+                design[position] = self.blocks[position].name_to_row[next(reversed(block_data))]
+        return design
+
+    def encode_many(self, choices_list: list[dict[str, dict]]) -> np.ndarray:
+        """Converts a list of choices dicts into a designs x blocks matrix"""
+        designs = np.full((len(choices_list), len(self.blocks)), -1, dtype=np.int64)
+        for i, choices in enumerate(choices_list):
+            designs[i] = self.encode(choices)
+        return designs
+
+    def encode_option_ids(self, option_ids: list[int]) -> np.ndarray:
+        """Converts a list of chosen option ids (one per block) into a design vector"""
+        design = np.full(len(self.blocks), -1, dtype=np.int64)
+        for option_id in option_ids:
+            index = self.option_id_to_global[option_id]
+            position = int(np.searchsorted(self.block_offsets, index, side="right")) - 1
+            design[position] = index - self.block_offsets[position]
+        return design
+
+    def decode(self, design: np.ndarray) -> dict[str, dict]:
+        """Converts a design vector back into a choices dict in the get_choices format"""
+        choices = {}
+        for block, row in zip(self.blocks, np.asarray(design).tolist()):
+            if row >= 0:
+                option = block.options[row]
+                choices[block.uuid] = {option.name: {name: prop.value for name, prop in option.properties.items()}}
+        return choices
+
+    def global_options(self, designs: np.ndarray) -> np.ndarray:
+        """Maps option rows to the global option index (over all blocks); missing choices stay -1"""
+        designs = np.asarray(designs)
+        return np.where(designs >= 0, designs + self.block_offsets, -1)
+
+    def take(self, designs: np.ndarray) -> "DesignArrayProperties":
+        """Columnar property view of a designs x blocks matrix, usable wherever DesignProperties is"""
+        return DesignArrayProperties(self, designs)
+
+    @staticmethod
+    def design_key(design: np.ndarray) -> bytes:
+        """Hashable key of a design vector"""
+        return np.ascontiguousarray(design, dtype=np.int64).tobytes()
+
+
+class DesignArrayProperties:
+    """Columnar view of the option properties of a designs x blocks matrix (see DesignProperties)"""
+
+    def __init__(self, design_space: DesignSpaceIndex, designs: np.ndarray):
+        self.design_space = design_space
+        self.designs = np.atleast_2d(np.asarray(designs, dtype=np.int64))
+
+    def __len__(self) -> int:
+        return self.designs.shape[0]
+
+    def get(self, block_uuid: str, property_name: str) -> np.ndarray:
+        """Gets a property of the chosen option of a block for every design (NaN where missing)"""
+        position = self.design_space.block_position.get(block_uuid)
+        if position is None:
+            return np.full(len(self), np.nan)
+        block = self.design_space.blocks[position]
+        column = block.property_to_column.get(property_name)
+        if column is None:
+            return np.full(len(self), np.nan)
+        return block.matrix[self.designs[:, position], column]
+
+
+_design_spaces: dict[int, tuple[Any, DesignSpaceIndex]] = {}
+
+
+def get_design_space(job_data) -> DesignSpaceIndex:
+    """Gets the DesignSpaceIndex of a job, compiling it on first use
+
+    Args:
+        job_data (JobData): Contains all archetype and vendor data
+
+    Returns:
+        DesignSpaceIndex: compiled design space, kept for as long as job_data is alive
+    """
+    key = id(job_data)
+    entry = _design_spaces.get(key)
+    if entry is not None and entry[0]() is job_data:
+        return entry[1]
+
+    design_space = DesignSpaceIndex(job_data)
+    _design_spaces[key] = (weakref.ref(job_data, lambda _: _design_spaces.pop(key, None)), design_space)
+    return design_space
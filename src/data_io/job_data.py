@@ -1,9 +1,25 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import types
+from functools import lru_cache
 from itertools import groupby
-from typing import Any
+from pathlib import Path
+from typing import Any, Union, get_args, get_origin
 
 from munch import munchify
 from pydantic import BaseModel, ConfigDict, Field
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard library parser
+    orjson = None
+
+# Bump when the transformed structure changes, so stale cache files are ignored
+JOB_DATA_CACHE_VERSION = 1
+
 
 class CustomBaseModel(BaseModel):
     model_config = ConfigDict(extra='ignore')
@@ -110,20 +126,72 @@ class JobData(CustomBaseModel):
     option_constraints: list[OptionConstraintData]
 
     def __init__(self, **data):
+        # raw job files carry a "project" entry, already transformed data (e.g. from the cache) does not
+        if "project" in data:
+            data = self.transform_data(data)
+        super().__init__(**data)
+
+    @classmethod
+    def transform_data(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """Transforms the raw job file structure into the JobData field structure (mutates data)"""
         data["country"] = data["project"]["country"]
         data["region"] = data["project"]["region"]
         data["project_id"] = data["project"]["pk"]
         data["project_name"] = data["project"]["name"]
         data["archetypes"] = data["project"]["archetypes"]
-        data["conversions"] = self._transform_conversions(data["project"]["conversions"])
-        data["drivers"] = self._transform_drivers(data["project"]["drivers"])
-        data["parameters"] = self._transform_parameters(data["project"]["parameters"])
+        data["conversions"] = cls._transform_conversions(data["project"]["conversions"])
+        data["drivers"] = cls._transform_drivers(data["project"]["drivers"])
+        data["parameters"] = cls._transform_parameters(data["project"]["parameters"])
         data["currency"] = data["parameters"]["default"]["categories"]["Financials"]["parameters"] \
             .pop("default_financials_project_currency")["value"]
-        data["blocks"] = self._transform_blocks(data["project"])
-        data["option_constraints"] = self._transform_option_constraints(data["project"]["option_constraints"])
+        data["blocks"] = cls._transform_blocks(data["project"])
+        data["option_constraints"] = cls._transform_option_constraints(data["project"]["option_constraints"])
+        del data["project"]
+        return data
 
-        super().__init__(**data)
+    @classmethod
+    def from_file(
+        cls,
+        input_file: Union[str, Path],
+        validate: bool = True,
+        cache_dir: Union[str, Path, None] = None,
+        use_cache: bool = True,
+    ) -> "JobData":
+        """Loads job data from a file. The built JobData is cached on disk keyed by a hash of the file content,
+        so repeated jobs on the same project skip parsing, transformation and validation
+
+        Args:
+            input_file (str | Path): input file path
+            validate (bool): validate with pydantic when the file has to be parsed; False builds the models
+                without validation and should only be used for trusted job files
+            cache_dir (str | Path, optional): cache directory, defaults to get_job_data_cache_dir()
+            use_cache (bool): read/write the on-disk cache
+
+        Returns:
+            JobData: job data
+        """
+        content = Path(input_file).read_bytes()
+        cache_file = None
+
+        if use_cache:
+            digest = hashlib.sha256(content).hexdigest()
+            cache_file = Path(cache_dir or get_job_data_cache_dir()) / f"{digest}.v{JOB_DATA_CACHE_VERSION}.pickle"
+            try:
+                with cache_file.open("rb") as f:
+                    validated, job_data = pickle.load(f)
+                # an entry built without validation does not satisfy a validating load
+                if validated or not validate:
+                    return job_data
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError):
+                # missing, corrupt or stale (pickled before a class was renamed or moved): parse the file again
+                pass
+
+        data = cls.transform_data(orjson.loads(content) if orjson is not None else json.loads(content))
+        job_data = cls.model_validate(data) if validate else construct_model(cls, data)
+
+        if cache_file is not None:
+            _write_cache_file(cache_file, (validate, job_data))
+        return job_data
 
     @classmethod
     def get_schema(cls) -> dict:
@@ -163,20 +231,23 @@ class JobData(CustomBaseModel):
 
         return process_schema(json_schema)
 
-    def _transform_conversions(self, conversion_data: list) -> dict[str, Any]:
+    @staticmethod
+    def _transform_conversions(conversion_data: list) -> dict[str, Any]:
         conversion_data.sort(key=lambda x: x["category"])
         return {
             category: {"conversions": list(group)}
             for category, group in groupby(conversion_data, key=lambda x: x["category"])
         }
 
-    def _transform_drivers(self, driver_data: list) -> dict[str, Any]:
+    @staticmethod
+    def _transform_drivers(driver_data: list) -> dict[str, Any]:
         drivers = {x["name"]: x for x in driver_data}
         for driver in drivers.values():
             driver["properties"] = {x["name"]: x for x in driver["properties"]}
         return drivers
 
-    def _transform_parameters(self, parameter_data: list) -> dict[str, Any]:
+    @staticmethod
+    def _transform_parameters(parameter_data: list) -> dict[str, Any]:
         parameter_data.sort(key=lambda x: (x["archetype"] or "default", x["category"]))
         parameters = {
             archetype: {
@@ -194,7 +265,8 @@ class JobData(CustomBaseModel):
         }
         return parameters
 
-    def _transform_blocks(self, project_data: dict[str, Any]) -> dict[str, Any]:
+    @staticmethod
+    def _transform_blocks(project_data: dict[str, Any]) -> dict[str, Any]:
         block_data = project_data["blocks"]
         connection_data = project_data["connections"]
         driver_names = {x["id"]: x["name"] for x in project_data["drivers"]}
@@ -283,7 +355,8 @@ class JobData(CustomBaseModel):
         }
         return blocks
 
-    def _transform_option_constraints(self, option_constraint_data: list) -> list:
+    @staticmethod
+    def _transform_option_constraints(option_constraint_data: list) -> list:
         option_constraints = [
             {
                 "type": option_constraint["type"],
@@ -291,4 +364,70 @@ class JobData(CustomBaseModel):
             }
             for option_constraint in option_constraint_data
         ]
-        return option_constraints
\ No newline at end of file
+        return option_constraints
+
+
+def get_job_data_cache_dir() -> Path:
+    """Directory of the transformed job data cache ($ENGINEERING_BLOCK_CACHE_DIR or ~/.cache/engineering_block)"""
+    root = os.environ.get("ENGINEERING_BLOCK_CACHE_DIR") or Path.home() / ".cache" / "engineering_block"
+    return Path(root) / "job_data"
+
+
+def _write_cache_file(cache_file: Path, data: Any):
+    """Writes a cache file atomically; a failing cache write does not fail the load"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=cache_file.parent, delete=False) as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, cache_file)
+    except OSError:
+        pass
+
+
+def construct_model(model: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    """Builds a model and its nested models from already transformed data without validation, the recursive
+    counterpart of model_construct. Only for trusted data
+
+    Args:
+        model (type[BaseModel]): model class
+        data (dict): transformed data
+
+    Returns:
+        BaseModel: the constructed model
+    """
+    return _get_builder(model)(data)
+
+
+@lru_cache(maxsize=None)
+def _get_builder(annotation: Any):
+    """Compiles a function converting plain data into the given annotation (model, dict, list or plain value)"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        fields = [(name, _get_builder(field.annotation)) for name, field in annotation.model_fields.items()]
+        construct = annotation.model_construct
+
+        def build_model(value):
+            return construct(**{name: build(value[name]) for name, build in fields if name in value})
+
+        return build_model
+
+    origin = get_origin(annotation)
+    if origin is dict:
+        build_item = _get_builder(get_args(annotation)[1])
+        if build_item is _identity:
+            return dict
+        return lambda value: {key: build_item(item) for key, item in value.items()}
+    if origin is list:
+        build_item = _get_builder(get_args(annotation)[0])
+        if build_item is _identity:
+            return list
+        return lambda value: [build_item(item) for item in value]
+    if origin in (Union, types.UnionType):
+        models = [x for x in get_args(annotation) if isinstance(x, type) and issubclass(x, BaseModel)]
+        if models:
+            build_model = _get_builder(models[0])
+            return lambda value: None if value is None else build_model(value)
+    return _identity
+
+
+def _identity(value):
+    return value
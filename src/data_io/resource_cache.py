@@ -0,0 +1,122 @@
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Union
+
+from src.utilities import LRUCache
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class ResourceData(dict):
+    """Sheets of a resource file (sheet name -> DataFrame), with rows pre-indexed by country.
+
+    Instances are shared between evaluations through the ResourceCache and must be treated as read-only.
+    """
+
+    def __init__(self, sheets: "dict[str, pd.DataFrame]"):
+        super().__init__(sheets)
+        self.countries = {}
+        for sheet_name, df in sheets.items():
+            if "country" in df.columns:
+                rows = {}
+                for row in df.to_dict("records"):
+                    # keep the first row per country, as a boolean mask lookup would
+                    rows.setdefault(row["country"], row)
+                self.countries[sheet_name] = rows
+        self.derived = {}
+
+    def get_country(self, sheet_name: str, country: str) -> dict:
+        """Gets the row of a sheet for a country
+
+        Args:
+            sheet_name (str): sheet name
+            country (str): country code
+
+        Returns:
+            dict: column name -> value
+        """
+        return self.countries[sheet_name][country]
+
+    def get_derived(self, key, build):
+        """Gets data derived from this resource (e.g. an hourly wind series), building it on first use.
+        Derived data lives as long as the resource data, so it is rebuilt when the file is re-read
+
+        Args:
+            key (hashable): key of the derived data
+            build (callable): builds the derived data from this resource data
+
+        Returns:
+            Any: the derived data, shared like the resource data itself
+        """
+        value = self.derived.get(key)
+        if value is None:
+            value = self.derived[key] = build(self)
+        return value
+
+
+def read_resource_file(file_name: Union[str, Path]) -> ResourceData:
+    """Reads all sheets of a resource workbook
+
+    Args:
+        file_name (str | Path): path of the workbook
+
+    Returns:
+        ResourceData: sheets of the workbook
+    """
+    import pandas as pd
+
+    xl = pd.read_excel(file_name, sheet_name=None, index_col=0)
+    return ResourceData(xl)
+
+
+class ResourceCache:
+    """Process level cache of resource files keyed by archetype and file path.
+
+    Entries are invalidated when the modification time or size of the file changes and the least
+    recently used entries are evicted beyond maxsize.
+    """
+
+    def __init__(self, maxsize: int = 16, loader=read_resource_file):
+        self.loader = loader
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def get(self, archetype: str, file_name: Union[str, Path]) -> ResourceData:
+        """Gets the resource data of an archetype, reading the file only if it is not cached or has changed
+
+        Args:
+            archetype (str): archetype the resource belongs to
+            file_name (str | Path): path of the resource file
+
+        Returns:
+            ResourceData: resource data
+        """
+        path = os.path.abspath(file_name)
+        stat = os.stat(path)
+        key = (archetype, path)
+
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == (stat.st_mtime_ns, stat.st_size):
+            return entry[1]
+
+        data = self.loader(path)
+        self._cache.put(key, ((stat.st_mtime_ns, stat.st_size), data))
+        return data
+
+    def preload(self, resources: Iterable[tuple[str, Union[str, Path]]]):
+        """Reads the given (archetype, file name) resources into the cache"""
+        for archetype, file_name in resources:
+            self.get(archetype, file_name)
+
+    def clear(self):
+        self._cache.clear()
+
+    def resize(self, maxsize: int):
+        self._cache.resize(maxsize)
+
+    def cache_info(self) -> dict:
+        return self._cache.cache_info()
+
+
+resource_cache = ResourceCache()
@@ -0,0 +1,246 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Union
+
+# Functions decorated with instrument() are only wrapped when this is set before the engine is imported, so the
+# disabled engine runs the undecorated functions
+WRAP_FUNCTIONS = os.environ.get("ENGINEERING_BLOCK_INSTRUMENTATION", "") not in ("", "0")
+
+
+class StageStats:
+    """Call count, wall time and a log2 histogram of the durations of one stage"""
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.histogram = [0] * 64  # bucket b holds durations in [2**(b-1), 2**b) ns
+
+    def add(self, duration_ns: int):
+        self.count += 1
+        self.total_ns += duration_ns
+        self.min_ns = duration_ns if self.min_ns is None else min(self.min_ns, duration_ns)
+        self.max_ns = max(self.max_ns, duration_ns)
+        self.histogram[min(duration_ns.bit_length(), 63)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile (in seconds) from the histogram, using the geometric middle of the bucket"""
+        target = q * self.count
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= target:
+                low, high = (2 ** (bucket - 1) if bucket else 0), 2**bucket
+                return min(max((low * high) ** 0.5, self.min_ns), self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_s": self.total_ns / 1e9,
+            "mean_s": self.total_ns / self.count / 1e9 if self.count else 0.0,
+            "min_s": (self.min_ns or 0) / 1e9,
+            "max_s": self.max_ns / 1e9,
+            "p50_s": self.quantile(0.5),
+            "p90_s": self.quantile(0.9),
+            "p99_s": self.quantile(0.99),
+            "histogram": {f"<{2**bucket / 1e9:.3g}s": count for bucket, count in enumerate(self.histogram) if count},
+        }
+
+
+class _Stage:
+    """Context manager timing one stage; nested stages are recorded under their parent's path"""
+
+    __slots__ = ("recorder", "name", "path", "start_ns")
+
+    def __init__(self, recorder: "Recorder", name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        stack = self.recorder._stack()
+        self.path = f"{stack[-1]}/{self.name}" if stack else self.name
+        stack.append(self.path)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end_ns = time.perf_counter_ns()
+        self.recorder._stack().pop()
+        self.recorder._record(self.path, self.name, self.start_ns, end_ns)
+        return False
+
+
+class Recorder:
+    """Collects stage timings of get_metrics and its sub-functions across evaluations.
+
+    Disabled by default: instrumented functions then call straight through after a single flag check (or are not
+    wrapped at all, see WRAP_FUNCTIONS). Stages are
+    aggregated per path (e.g. "get_metrics/engineering_block/offshore_wind"); with trace=True every call is also
+    kept as an event for the Chrome trace export.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.trace = False
+        self.max_events = 0
+        self.stats: dict[str, StageStats] = {}
+        self.events = []
+        self.dropped_events = 0
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, trace: bool = False, max_events: int = 1_000_000):
+        """Starts recording
+
+        Args:
+            trace (bool): also keep every call as a trace event
+            max_events (int): bound on the kept trace events, later events are counted as dropped
+        """
+        self.trace = trace
+        self.max_events = max_events
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Drops everything recorded so far"""
+        with self._lock:
+            self.stats = {}
+            self.events = []
+            self.dropped_events = 0
+            self._origin_ns = time.perf_counter_ns()
+
+    def bind(self, function: Callable) -> Callable:
+        """Wraps a function handed to another thread (e.g. a pool worker) so that its stages are recorded under
+        the stage path of the calling thread instead of as new roots (returned unchanged while disabled)"""
+        if not self.enabled:
+            return function
+        parent = list(self._stack())
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            stack = self._stack()
+            saved = stack[:]
+            stack[:] = parent
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stack[:] = saved
+
+        return wrapper
+
+    def _stack(self) -> list[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, path: str, name: str, start_ns: int, end_ns: int):
+        with self._lock:
+            stats = self.stats.get(path)
+            if stats is None:
+                stats = self.stats[path] = StageStats()
+            stats.add(end_ns - start_ns)
+            if self.trace:
+                if len(self.events) < self.max_events:
+                    self.events.append((name, path, start_ns, end_ns, threading.get_ident()))
+                else:
+                    self.dropped_events += 1
+
+    def report(self) -> dict:
+        """Aggregated timings per stage path, sorted by path
+
+        Returns:
+            _dict_: path -> count, total/mean/min/max and estimated quantiles in seconds, and the histogram
+        """
+        with self._lock:
+            return {path: self.stats[path].to_dict() for path in sorted(self.stats)}
+
+    def write_report(self, file_path: Union[str, Path]):
+        """Writes the aggregated timings as JSON"""
+        Path(file_path).write_text(json.dumps({"pid": os.getpid(), "stages": self.report()}, indent=2))
+
+    def chrome_trace(self) -> dict:
+        """Recorded events in the Chrome trace event format (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        with self._lock:
+            events = [
+                {
+                    "name": name,
+                    "cat": "engine",
+                    "ph": "X",
+                    "ts": (start_ns - self._origin_ns) / 1e3,
+                    "dur": (end_ns - start_ns) / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"path": path},
+                }
+                for name, path, start_ns, end_ns, tid in self.events
+            ]
+            return {"traceEvents": events, "otherData": {"dropped_events": self.dropped_events}}
+
+    def write_chrome_trace(self, file_path: Union[str, Path]):
+        """Writes the recorded events as a Chrome trace JSON file"""
+        Path(file_path).write_text(json.dumps(self.chrome_trace()))
+
+
+recorder = Recorder()
+
+
+def instrument(name: str | None = None) -> Callable:
+    """Decorator registering a function as a stage of the global recorder, named after the function by default.
+    Returns the function unchanged unless ENGINEERING_BLOCK_INSTRUMENTATION is set (see WRAP_FUNCTIONS)
+
+    Args:
+        name (str, optional): stage name
+
+    Returns:
+        callable: decorator
+    """
+
+    def decorator(function: Callable) -> Callable:
+        if not WRAP_FUNCTIONS:
+            return function
+        stage_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not recorder.enabled:
+                return function(*args, **kwargs)
+            with _Stage(recorder, stage_name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profile(trace: bool = False, reset: bool = True):
+    """Records the stage timings of the enclosed code on the global recorder
+
+    Args:
+        trace (bool): also keep every call as a trace event
+        reset (bool): drop earlier recordings first
+
+    Yields:
+        Recorder: the global recorder, e.g. to call report() or write_chrome_trace() afterwards
+    """
+    if reset:
+        recorder.reset()
+    recorder.enable(trace=trace)
+    try:
+        yield recorder
+    finally:
+        recorder.disable()
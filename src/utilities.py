@@ -1,12 +1,13 @@
-from datetime import datetime
-from io import StringIO
+from collections import OrderedDict
 from enum import Enum
 import pickle
+import threading
 from pathlib import Path
-from typing import Any, Union
-from munch import Munch, munchify
-from pprint import pprint
-from src.data_io.job_data import JobData
+from typing import TYPE_CHECKING, Any, Union
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.data_io.job_data import JobData
 
 
 def unpack_tuple(tup: tuple) -> tuple:
@@ -42,23 +43,164 @@ def get_choices(file_path: str) -> dict:
     return arc_choices
 
 
-def load_job_data_from_file(input_file: Union[str, Path]) -> Munch:
-    """Load job data from file path and return the job data
+def to_float(value: Any) -> float:
+    """Converts an option property value to a float, mapping missing and non-numeric values to NaN
 
     Args:
-        input_file (str | Path): input file path
+        value (Any): property value as stored in the job data (None, number or numeric string)
+
+    Returns:
+        float: the numeric value or NaN
+    """
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def fill_missing(value: Any, default: float) -> np.ndarray:
+    """Converts option property values to a float array, with the default where a value is missing (NaN)
+
+    Args:
+        value (Any): property value or property column (see DesignProperties.get)
+        default (float): value used where the property is missing
+
+    Returns:
+        np.ndarray: the values with the default where missing
+    """
+    value = np.asarray(value, dtype=float)
+    return np.where(np.isnan(value), default, value)
+
+
+def get_option_data(choices: dict[str, dict], block_uuid: str) -> dict:
+    """Gets the properties of the chosen option of a block: the last option of the block in the choices
+
+    Args:
+        choices (dict[str, dict]): Chosen project design
+        block_uuid (str): uuid of the block
 
     Returns:
-        Munch: job data
+        dict: the option properties, empty if the block has no choice
+    """
+    block_data = choices.get(block_uuid)
+    return next(reversed(block_data.values())) if block_data else {}
+
+
+class DesignProperties:
+    """Columnar view of the option properties of a list of designs.
+
+    Each design is a choices dict as returned by get_choices. Property columns are
+    extracted lazily, once per (block, property), as float arrays with one entry per design.
     """
-    input_file = Path(input_file)
 
-    with input_file.open() as f:
-        file_data = Munch.fromJSON(f.read())
+    def __init__(self, choices_list: list[dict[str, dict]]):
+        self.choices_list = list(choices_list)
+        self._columns = {}
 
-    job_data = JobData(**file_data)
+    def __len__(self) -> int:
+        return len(self.choices_list)
 
-    return job_data
+    def get(self, block_uuid: str, property_name: str) -> np.ndarray:
+        """Gets a property of the chosen option of a block for every design
+
+        Args:
+            block_uuid (str): block uuid
+            property_name (str): option property name
+
+        Returns:
+            np.ndarray: property value per design (NaN where missing)
+        """
+        key = (block_uuid, property_name)
+        if key not in self._columns:
+            column = np.empty(len(self.choices_list))
+            for i, choices in enumerate(self.choices_list):
+                # the chosen option is the last entry of the block, as in the engineering metrics
+                block_data = choices.get(block_uuid)
+                option_data = next(reversed(block_data.values())) if block_data else {}
+                column[i] = to_float(option_data.get(property_name))
+            self._columns[key] = column
+        return self._columns[key]
+
+
+def load_job_data_from_file(input_file: Union[str, Path], use_cache: bool = True) -> "JobData":
+    """Load job data from file path and return the job data, served from the on-disk job data cache when the
+    file was loaded before (see JobData.from_file)
+
+    Args:
+        input_file (str | Path): input file path
+        use_cache (bool): read/write the on-disk cache
+
+    Returns:
+        JobData: job data
+    """
+    # imported here so that modules only needing the utilities do not pay for pydantic at import
+    from src.data_io.job_data import JobData
+
+    return JobData.from_file(input_file, use_cache=use_cache)
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with a bounded number of entries and hit/miss counters"""
+
+    _missing = object()
+
+    def __init__(self, maxsize: int | None = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Gets a cached value and marks it as most recently used, counting a hit or a miss"""
+        with self._lock:
+            value = self._data.get(key, self._missing)
+            if value is self._missing:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Stores a value, evicting the least recently used entries beyond maxsize"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def resize(self, maxsize: int | None):
+        """Changes the maximum number of entries (None for unbounded)"""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """Drops all entries and resets the counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "maxsize": self.maxsize, "currsize": len(self._data)}
+
+    def _evict(self):
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
 
 
 class Archetypes(str, Enum):
@@ -70,3 +212,36 @@ class Archetypes(str, Enum):
     PIPELINES = "pipelines"
     BLUE_HYDROGEN = "blue_hydrogen"
     CARBON_LIQUEFACTION = "carbon_liquefaction"
+
+
+# Optimisation direction per driver (-1 minimise, 1 maximise); drivers not listed are minimised
+DRIVER_DIRECTIONS = {
+    "capex": -1,
+    "opex": -1,
+    "lcox": -1,
+    "schedule": -1,
+    "carbon_footprint": -1,
+    "layout": -1,
+    "trl": 1,
+    "feedstock_availability": 1,
+    "safety": 1,
+}
+
+# Metric key of a driver in the get_metrics output, where it differs from the driver name
+DRIVER_METRICS = {"lcox": "LCOX"}
+
+
+def get_objectives(job_data) -> list[tuple[str, str, int]]:
+    """Gets the objective drivers of a job
+
+    Args:
+        job_data (JobData): Contains all archetype and vendor data
+
+    Returns:
+        list[tuple[str, str, int]]: (driver name, metric key, direction) per driver flagged as objective
+    """
+    return [
+        (name, DRIVER_METRICS.get(name, name), DRIVER_DIRECTIONS.get(name, -1))
+        for name, driver in job_data.drivers.items()
+        if driver.objective
+    ]
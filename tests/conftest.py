@@ -0,0 +1,30 @@
+# Install packages
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.utilities import get_choices, load_job_data_from_file  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def job_data():
+    """The sample job"""
+    return load_job_data_from_file(ROOT / "src" / "local_project_9_default_2_input.json")
+
+
+@pytest.fixture(scope="session")
+def choices():
+    """The demo concept of the sample job"""
+    return get_choices(ROOT / "src" / "example_concept.pickle")
+
+
+@pytest.fixture(scope="session")
+def constrained_job_data(job_data):
+    """The sample job with an always constraint across blocks: export cable option 64 or 65 goes with option 70
+    of the third block"""
+    constraint = type(job_data.option_constraints[0])(type="always", options=[64, 65, 70])
+    return job_data.model_copy(update={"option_constraints": [constraint]})
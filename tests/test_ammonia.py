@@ -0,0 +1,122 @@
+# Install packages
+import numpy as np
+import pytest
+
+from archetypes.ammonia import hydrogen_buffer
+from archetypes.ammonia.ammonia import ammonia, ammonia_batch
+from archetypes.ammonia.ammonia_metrics import AMMONIA_LHV, STORAGE_BLOCK_UUID, SYNTHESIS_BLOCK_UUID
+from archetypes.ammonia.hydrogen_buffer import scan_storage, simulate_storage
+from archetypes.green_hydrogen.green_hydrogen_metrics import ELECTROLYZER_BLOCK_UUID
+from engine_interface import get_design_properties
+from metrics import get_archetype_user_input, get_data, get_general_user_inputs, get_wacc_real
+
+ELECTROLYZERS = [
+    {"PEM": {"efficiency": 62, "minload": 5}},
+    {"ALK": {"efficiency": 68, "minload": 25}},
+]
+STORAGES = [
+    {"vessels": {"costpertonne": 0.6, "cushiongas": 5}},
+    {"cavern": {"costpertonne": 0.05, "cushiongas": 30}},
+]
+SYNTHESES = [
+    {"HB": {"energyuse": 350, "costfactor": 1.1}},
+    {"default": {}},
+]
+
+
+def naive_storage(supply: np.ndarray, demand: float, capacity: float, hours: int) -> dict:
+    """Hour by hour buffer of one supply profile and storage size, the profile repeated over the hours"""
+    level = shortfall = spill = 0.0
+    for hour in range(hours):
+        level += supply[hour % len(supply)] - demand
+        if level < 0:
+            shortfall -= level
+            level = 0.0
+        elif level > capacity:
+            spill += level - capacity
+            level = capacity
+    return {"shortfall": shortfall, "spill": spill, "level": level}
+
+
+def test_scan_storage_equals_an_hourly_loop():
+    rng = np.random.default_rng(24)
+    net_flow = rng.normal(0, 10, size=(6, 300))
+    capacity = np.array([0.0, 5.0, 20.0, 50.0, 200.0, 1e9])
+    level = np.minimum(rng.uniform(0, 60, size=6), capacity)
+    levels = scan_storage(net_flow, capacity, level)
+    for state in range(6):
+        state_level = level[state]
+        for hour in range(300):
+            state_level = min(max(state_level + net_flow[state, hour], 0.0), capacity[state])
+            assert levels[state, hour] == pytest.approx(state_level, abs=1e-9)
+
+
+@pytest.mark.parametrize("hours, chunk_hours", [(200, 1024), (1000, 64), (4007, 100)])
+def test_simulate_storage_equals_an_hourly_loop(hours, chunk_hours):
+    rng = np.random.default_rng(hours)
+    supply = rng.choice([0.0, 4.0, 10.0, 25.0], size=(3, 150))
+    capacity = np.array([0.0, 10.0, 60.0, 400.0])
+    storage = simulate_storage(supply, 9.0, capacity, hours, chunk_hours)
+    for profile in range(3):
+        for column, size in enumerate(capacity.tolist()):
+            expected = naive_storage(supply[profile], 9.0, size, hours)
+            for key, value in expected.items():
+                assert storage[key][profile, column] == pytest.approx(value, rel=1e-9, abs=1e-9)
+
+
+def test_periodic_storage_is_not_simulated_to_the_end(monkeypatch):
+    scanned_hours = []
+
+    def counting_scan(net_flow, capacity, level):
+        scanned_hours.append(net_flow.shape[1])
+        return scan_storage(net_flow, capacity, level)
+
+    monkeypatch.setattr(hydrogen_buffer, "scan_storage", counting_scan)
+    supply = np.array([[0.0, 30.0, 0.0, 12.0, 6.0] * 20])
+    capacity = np.array([0.0, 25.0])
+    hours = 100 * 500 + 37
+    storage = simulate_storage(supply, 9.0, capacity, hours, chunk_hours=50)
+    # the level repeats after a few repetitions of the profile, the remaining ones are added without a scan
+    assert sum(scanned_hours) < 10 * supply.shape[1]
+    for column, size in enumerate(capacity.tolist()):
+        expected = naive_storage(supply[0], 9.0, size, hours)
+        for key, value in expected.items():
+            assert storage[key][0, column] == pytest.approx(value, rel=1e-9, abs=1e-9)
+
+
+@pytest.fixture(scope="module")
+def ammonia_inputs(job_data):
+    general_user_inputs = get_general_user_inputs()
+    return {
+        "wacc_real": get_wacc_real(general_user_inputs["wacc_nominal"], general_user_inputs["inflation_rate"]),
+        "general_user_inputs": general_user_inputs,
+        "archetype_user_input": get_archetype_user_input("ammonia"),
+        "job_data": job_data.model_copy(update={"archetypes": ["ammonia"]}),
+        "wind_data": get_data("wind"),
+    }
+
+
+def test_batch_equals_scalar(ammonia_inputs, choices):
+    choices_list = [
+        {
+            **choices,
+            ELECTROLYZER_BLOCK_UUID: electrolyzer,
+            STORAGE_BLOCK_UUID: storage,
+            SYNTHESIS_BLOCK_UUID: synthesis,
+        }
+        for electrolyzer in ELECTROLYZERS
+        for storage in STORAGES
+        for synthesis in SYNTHESES
+    ]
+    scalar = [ammonia(choices=design, **ammonia_inputs) for design in choices_list]
+    assert len({outputs["opex"] for outputs in scalar}) == len(choices_list)
+    assert len({outputs["storage_hours"] for outputs in scalar}) > 1
+    for outputs in scalar:
+        assert outputs["production"] == pytest.approx(outputs["ammonia"] * AMMONIA_LHV)
+
+    batch = ammonia_batch(
+        design_properties=get_design_properties(choices_list, ammonia_inputs["job_data"]), **ammonia_inputs
+    )
+    keys = ("capex", "opex", "production", "ammonia", "layout", "storage_size", "storage_hours", "availability")
+    for key in keys:
+        np.testing.assert_allclose(batch[key], [outputs[key] for outputs in scalar])
@@ -0,0 +1,133 @@
+# Install packages
+import math
+
+import numpy as np
+import pytest
+
+from archetypes.carbon_capture.absorption import (
+    MAX_ABSORBER_DIAMETER,
+    PART_LOAD_PENALTY,
+    FlueGasSeries,
+    size_absorber,
+)
+from archetypes.carbon_capture.carbon_capture import carbon_capture, carbon_capture_batch
+from archetypes.carbon_capture.carbon_capture_metrics import CAPTURE_BLOCK_UUID
+from engine_interface import get_design_properties
+from metrics import get_archetype_user_input, get_data, get_general_user_inputs, get_wacc_real
+
+CAPTURE_OPTIONS = [
+    {"MEA": {"capturerate": 88, "regenerationenergy": 3.9, "minload": 30, "gasvelocity": 2.0}},
+    {"KS-1": {"capturerate": 95, "regenerationenergy": 2.8, "electricityuse": 110, "minload": 60, "costfactor": 1.3}},
+    {"PZ": {"capturerate": 98, "regenerationenergy": 2.5, "minload": 20, "gasvelocity": 3.2, "cyclicloading": 80}},
+    {"default": {}},
+]
+
+
+def naive_capture_balance(
+    flow, co2_fraction, design_flow, capture_rate, regeneration_energy, electricity_use, min_load
+) -> dict:
+    """Hour by hour balance of one capture technology, per year"""
+    balance = {"captured": [], "emitted": [], "regeneration": [], "electricity": [], "operating_hours": []}
+    peak_duty = 0.0
+    for year_flow, year_fraction in zip(flow.tolist(), np.broadcast_to(co2_fraction, flow.shape).tolist()):
+        captured = regeneration = operating_hours = annual_co2 = 0.0
+        for hour_flow, fraction in zip(year_flow, year_fraction):
+            co2 = hour_flow * fraction * 3.6
+            annual_co2 += co2
+            if hour_flow <= 0:
+                continue
+            load = min(hour_flow / design_flow, 1.0)
+            if load < min_load:
+                continue
+            treated = co2 * load * design_flow / hour_flow
+            hour_regeneration = regeneration_energy * capture_rate * treated * (1 + PART_LOAD_PENALTY * (1 - load))
+            captured += capture_rate * treated
+            regeneration += hour_regeneration / 3.6
+            operating_hours += 1
+            peak_duty = max(peak_duty, hour_regeneration / 3.6)
+        balance["captured"].append(captured)
+        balance["emitted"].append(annual_co2 - captured)
+        balance["regeneration"].append(regeneration)
+        balance["electricity"].append(electricity_use * captured / 1000)
+        balance["operating_hours"].append(operating_hours)
+    balance["reboiler_duty"] = peak_duty
+    return balance
+
+
+@pytest.fixture(scope="module")
+def flue_gas():
+    # two years with stops, part load and flows above the design flow
+    rng = np.random.default_rng(23)
+    flow = np.clip(rng.normal(100, 35, size=(2, 1500)), 0, None)
+    flow[:, 200:260] = 0
+    co2_fraction = rng.uniform(0.1, 0.2, size=flow.shape)
+    return flow, co2_fraction
+
+
+@pytest.mark.parametrize(
+    "capture_rate, regeneration_energy, electricity_use, min_load",
+    [(0.9, 3.6, 130, 0.4), (0.95, 2.8, 110, 0.0), (0.98, 2.5, 150, 0.75), (0.85, 3.0, 120, 1.0)],
+)
+def test_capture_balance_equals_an_hourly_loop(flue_gas, capture_rate, regeneration_energy, electricity_use, min_load):
+    flow, co2_fraction = flue_gas
+    series = FlueGasSeries(flow, co2_fraction)
+    design_flow = series.get_design_flow(90)
+    balance = series.capture_balance(design_flow, capture_rate, regeneration_energy, electricity_use, min_load)
+    expected = naive_capture_balance(
+        flow, co2_fraction, design_flow, capture_rate, regeneration_energy, electricity_use, min_load
+    )
+    for key in ("captured", "emitted", "regeneration", "electricity", "operating_hours"):
+        np.testing.assert_allclose(balance[key][0], expected[key], rtol=1e-9, atol=1e-9)
+    assert balance["reboiler_duty"][0] == pytest.approx(expected["reboiler_duty"])
+
+
+def test_capture_balance_per_option(flue_gas):
+    flow, co2_fraction = flue_gas
+    series = FlueGasSeries(flow, co2_fraction)
+    options = np.array([[0.9, 3.6, 130, 0.4], [0.95, 2.8, 110, 0.6], [0.98, 2.5, 150, 0.2]])
+    balance = series.capture_balance(series.get_design_flow(95), *options.T)
+    assert balance["captured"].shape == (3, 2)
+    for option, values in enumerate(options.tolist()):
+        expected = naive_capture_balance(flow, co2_fraction, series.get_design_flow(95), *values)
+        np.testing.assert_allclose(balance["captured"][option], expected["captured"], rtol=1e-9)
+
+
+@pytest.mark.parametrize("design_flow", [50.0, 400.0, 1000.0, 5000.0])
+def test_size_absorber_equals_adding_trains(design_flow):
+    gas_velocity = np.array([1.5, 2.5, 3.5])
+    absorber = size_absorber(design_flow, gas_velocity)
+    for option, velocity in enumerate(gas_velocity.tolist()):
+        area = design_flow / (1.2 * velocity)
+        trains = 1
+        while area / trains > math.pi * MAX_ABSORBER_DIAMETER**2 / 4:
+            trains += 1
+        assert absorber["trains"][option] == trains
+        assert absorber["diameter"][option] == pytest.approx(math.sqrt(4 * area / (math.pi * trains)))
+        assert absorber["diameter"][option] <= MAX_ABSORBER_DIAMETER
+
+
+@pytest.fixture(scope="module")
+def carbon_capture_inputs(job_data):
+    general_user_inputs = get_general_user_inputs()
+    return {
+        "wacc_real": get_wacc_real(general_user_inputs["wacc_nominal"], general_user_inputs["inflation_rate"]),
+        "general_user_inputs": general_user_inputs,
+        "archetype_user_input": get_archetype_user_input("carbon_capture"),
+        "job_data": job_data.model_copy(update={"archetypes": ["carbon_capture"]}),
+        "carbon_capture_data": get_data("carbon_capture"),
+    }
+
+
+def test_batch_equals_scalar(carbon_capture_inputs, choices):
+    choices_list = [{**choices, CAPTURE_BLOCK_UUID: option} for option in CAPTURE_OPTIONS]
+    scalar = [carbon_capture(choices=design, **carbon_capture_inputs) for design in choices_list]
+    assert len({outputs["captured_co2"] for outputs in scalar}) == len(choices_list)
+    assert all(outputs["production"] == 0 for outputs in scalar)
+
+    batch = carbon_capture_batch(
+        design_properties=get_design_properties(choices_list, carbon_capture_inputs["job_data"]),
+        **carbon_capture_inputs,
+    )
+    keys = ("capex", "opex", "production", "captured_co2", "carbon_footprint", "layout", "absorber_trains")
+    for key in keys:
+        np.testing.assert_allclose(batch[key], [outputs[key] for outputs in scalar])
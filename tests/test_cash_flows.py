@@ -0,0 +1,95 @@
+# Install packages
+import numpy as np
+import pytest
+
+from economics_package.cash_flows import get_cash_flows
+from metrics import get_general_user_inputs, get_start_date
+
+WACC_REAL = 0.05
+
+
+def baseline_capex(general_user_inputs, engineering_outputs, wacc_real, job_data):
+    """Loop formula of the original get_capex"""
+    lead_time = general_user_inputs["fid"] - 2024
+    capex = 0
+    for arc in job_data.archetypes:
+        for i in range(general_user_inputs["in_phasing"][0]):
+            capex += (
+                engineering_outputs[arc]["capex"]
+                * general_user_inputs["in_phasing"][1][i]
+                / ((1 + wacc_real) ** (lead_time + i))
+            )
+    return capex
+
+
+def baseline_opex(general_user_inputs, engineering_outputs, job_data, start_date):
+    """Loop formula of the original get_opex"""
+    lead_time = start_date - 2024
+    rate = general_user_inputs["discount_rate"]
+    return sum(
+        engineering_outputs[arc]["opex"] / ((1 + rate) ** (lead_time + i))
+        for arc in job_data.archetypes
+        for i in range(general_user_inputs["project_lifetime"])
+    )
+
+
+def baseline_production(general_user_inputs, engineering_outputs, job_data, start_date):
+    """Loop formula of the original get_production, including its 1 / (1 + rate ** n) weighting"""
+    lead_time = start_date - 2024
+    rate = general_user_inputs["discount_rate"]
+    return sum(
+        engineering_outputs[arc]["production"] / (1 + rate ** (lead_time + i))
+        for arc in job_data.archetypes
+        for i in range(general_user_inputs["project_lifetime"])
+    )
+
+
+@pytest.fixture
+def engineering_outputs(job_data):
+    return {
+        arc: {"capex": 100.0 + i, "opex": 2.0, "production": 10.0, "stack_replacement_time": 0, "degradation_rate": 0}
+        for i, arc in enumerate(job_data.archetypes)
+    }
+
+
+@pytest.mark.parametrize("fid", [2018, 2021, 2023, 2024, 2026])
+def test_streams_match_baseline_formulas(job_data, engineering_outputs, fid):
+    general_user_inputs = {**get_general_user_inputs(), "fid": fid}
+    start_date = get_start_date(fid, general_user_inputs["in_phasing"][0])
+
+    capex = baseline_capex(general_user_inputs, engineering_outputs, WACC_REAL, job_data)
+    opex = baseline_opex(general_user_inputs, engineering_outputs, job_data, start_date)
+    production = baseline_production(general_user_inputs, engineering_outputs, job_data, start_date)
+
+    cash_flows = get_cash_flows(general_user_inputs, engineering_outputs, job_data, start_date, WACC_REAL)
+    assert cash_flows.npv("capex") == pytest.approx(capex)
+    assert cash_flows.npv("opex") == pytest.approx(opex)
+    assert cash_flows.npv("production") == pytest.approx(production)
+    assert cash_flows.years[0] == min(fid, 2024)
+
+
+def test_batch_streams_before_reference_year(job_data, engineering_outputs):
+    general_user_inputs = {**get_general_user_inputs(), "fid": 2021}
+    start_date = get_start_date(2021, general_user_inputs["in_phasing"][0])
+    batch_outputs = {
+        arc: {key: np.full(3, value) * (np.arange(3) + 1 if key == "capex" else 1) for key, value in outputs.items()}
+        for arc, outputs in engineering_outputs.items()
+    }
+
+    capex = get_cash_flows(general_user_inputs, batch_outputs, job_data, start_date, WACC_REAL).npv("capex")
+    expected = baseline_capex(general_user_inputs, engineering_outputs, WACC_REAL, job_data)
+    np.testing.assert_allclose(capex, expected * (np.arange(3) + 1))
+
+
+def test_lcox_and_payback(job_data, engineering_outputs):
+    general_user_inputs = get_general_user_inputs()
+    start_date = get_start_date(general_user_inputs["fid"], general_user_inputs["in_phasing"][0])
+    cash_flows = get_cash_flows(general_user_inputs, engineering_outputs, job_data, start_date, WACC_REAL)
+    lcox = cash_flows.lcox()
+    assert lcox == pytest.approx((cash_flows.npv("capex") + cash_flows.npv("opex")) / cash_flows.npv("production"))
+
+    # at the LCOX the discounted revenue covers the costs in the last operating year
+    assert cash_flows.payback(lcox) == general_user_inputs["project_lifetime"]
+    assert np.isnan(cash_flows.payback(0.9 * lcox))
+    payback = cash_flows.payback(np.array([1.2, 2.0, 100.0]) * lcox)
+    assert np.all(np.diff(payback) < 0) and payback[-1] == 1
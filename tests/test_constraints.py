@@ -0,0 +1,58 @@
+# Install packages
+import itertools
+
+import numpy as np
+import pytest
+
+from search_package.constraints import OptionConstraints
+from src.data_io.design_space import get_design_space
+
+# two blocks of three options: global options 0-2 and 3-5
+BLOCK_SIZES = [3, 3]
+
+
+def all_designs(block_sizes) -> np.ndarray:
+    return np.array(list(itertools.product(*(range(size) for size in block_sizes))))
+
+
+def test_demo_concept_is_feasible(job_data, choices):
+    constraints = OptionConstraints.from_job_data(job_data)
+    design = get_design_space(job_data).encode(choices)
+    assert constraints.is_feasible(design)
+    assert constraints.check(design[None, :]).all()
+
+
+def test_sample_job_keeps_the_whole_design_space(job_data):
+    constraints = OptionConstraints.from_job_data(job_data)
+    design_space = get_design_space(job_data)
+    assert constraints.check(all_designs(design_space.block_sizes)).all()
+    assert all(flags.all() for flags in constraints.feasible_options(np.full(len(design_space), -1)))
+
+
+@pytest.mark.parametrize(
+    "constraint, infeasible",
+    [
+        # options of one block are alternatives, so the constraint always holds
+        (("always", [0, 1]), []),
+        # across blocks: both or neither
+        (("always", [0, 3]), [(0, 1), (0, 2), (1, 0), (2, 0)]),
+        # option 0 or 1 goes with option 3
+        (("always", [0, 1, 3]), [(0, 1), (0, 2), (1, 1), (1, 2), (2, 0)]),
+        (("never", [0, 3]), [(0, 0)]),
+        (("never", [0, 1]), []),
+    ],
+)
+def test_constraint_semantics(constraint, infeasible):
+    constraints = OptionConstraints(BLOCK_SIZES, [constraint])
+    designs = all_designs(BLOCK_SIZES)
+    expected = np.array([tuple(design) not in infeasible for design in designs.tolist()])
+    np.testing.assert_array_equal(constraints.check(designs), expected)
+    assert [constraints.is_feasible(design) for design in designs] == expected.tolist()
+
+
+def test_propagation_restricts_to_listed_alternatives():
+    constraints = OptionConstraints(BLOCK_SIZES, [("always", [0, 1, 3, 4])])
+    allowed = constraints.feasible_options(np.array([1, -1]))
+    assert allowed[1].tolist() == [True, True, False]
+    allowed = constraints.feasible_options(np.array([-1, 2]))
+    assert allowed[0].tolist() == [False, False, True]
@@ -0,0 +1,29 @@
+# Install packages
+import numpy as np
+import pytest
+
+from engine_interface import convert_metrics, get_metrics_batch
+from src.data_io.conversions import get_unit_converter
+
+CATEGORY = "SI to Imperial"
+
+
+def test_factors(job_data):
+    unit_converter = get_unit_converter(job_data)
+    assert unit_converter.factor("tonne", "(long) ton") == pytest.approx(0.98)
+    assert unit_converter.factor("feet", "m") == pytest.approx(1 / 3.28)
+    np.testing.assert_allclose(unit_converter.convert([1.0, 2.0], "m", "feet"), [3.28, 6.56])
+    with pytest.raises(KeyError):
+        unit_converter.factor("tonne", "feet", CATEGORY)
+
+
+def test_convert_metrics(job_data, choices):
+    carbon_capture_job = job_data.model_copy(update={"archetypes": ["OWF", "carbon_capture"]})
+    metrics = get_metrics_batch([choices, choices], carbon_capture_job)
+    converted, units = convert_metrics(metrics, carbon_capture_job, CATEGORY)
+
+    np.testing.assert_allclose(converted["carbon_footprint"], metrics["carbon_footprint"] * 0.98)
+    assert units["carbon_footprint"] == "(long) ton"
+    # no conversion for the area or for metrics without a unit
+    assert converted["layout"] is metrics["layout"] and units["layout"] == "m^sq"
+    assert converted["capex"] is metrics["capex"] and units["capex"] is None
@@ -0,0 +1,55 @@
+# Install packages
+import itertools
+
+import numpy as np
+
+from src.data_io.design_space import DesignSpaceIndex, get_design_space
+from src.utilities import DesignProperties
+
+
+def all_designs(design_space: DesignSpaceIndex) -> np.ndarray:
+    return np.array(list(itertools.product(*(range(size) for size in design_space.block_sizes.tolist()))))
+
+
+def test_design_space_shape(job_data):
+    design_space = get_design_space(job_data)
+    assert get_design_space(job_data) is design_space
+    assert design_space.block_uuids == list(job_data.blocks)
+    assert design_space.block_sizes.tolist() == [3, 3, 3, 4, 5, 3]
+    assert design_space.number_of_options == 21
+    assert design_space.number_of_designs == 1620
+    assert design_space.option_ids.tolist() == list(range(64, 85))
+
+
+def test_encode_decode_round_trip(job_data, choices):
+    design_space = get_design_space(job_data)
+    assert design_space.decode(design_space.encode(choices)) == choices
+
+    designs = all_designs(design_space)
+    decoded = [design_space.decode(design) for design in designs]
+    np.testing.assert_array_equal(design_space.encode_many(decoded), designs)
+    option_ids = design_space.option_ids[design_space.global_options(designs)]
+    for design, ids in zip(designs[::97], option_ids[::97]):
+        np.testing.assert_array_equal(design_space.encode_option_ids(ids.tolist()), design)
+
+
+def test_missing_choices(job_data, choices):
+    design_space = get_design_space(job_data)
+    partial = dict(list(choices.items())[1:])
+    design = design_space.encode(partial)
+    assert design[0] == -1
+    assert design_space.decode(design) == partial
+    assert design_space.global_options(design)[0] == -1
+    assert np.isnan(design_space.take(design).get(design_space.block_uuids[0], "trl")).all()
+
+
+def test_take_equals_the_properties_of_the_choices(job_data):
+    design_space = get_design_space(job_data)
+    designs = all_designs(design_space)
+    taken = design_space.take(designs)
+    reference = DesignProperties([design_space.decode(design) for design in designs])
+    assert len(taken) == len(reference) == 1620
+    for block in design_space.blocks:
+        for name in [*block.property_names, "no_such_property"]:
+            np.testing.assert_array_equal(taken.get(block.uuid, name), reference.get(block.uuid, name))
+    assert np.isnan(taken.get("no-such-block", "trl")).all()
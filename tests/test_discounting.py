@@ -0,0 +1,34 @@
+# Install packages
+import numpy as np
+import pytest
+
+from economics_package.discounting import get_annuity_factor, get_discount_factors, get_npv, get_production_factors
+
+
+def test_discount_factors():
+    np.testing.assert_allclose(get_discount_factors(0.05, 2, 3), [1 / 1.05**2, 1 / 1.05**3, 1 / 1.05**4])
+    np.testing.assert_allclose(get_discount_factors(0.1, -2, 3), [1.21, 1.1, 1.0])
+
+
+def test_production_factors_keep_the_rate_power_weighting():
+    # the production stream weights year n by 1 / (1 + rate ** n), not by 1 / (1 + rate) ** n
+    np.testing.assert_allclose(get_production_factors(0.02, 0, 3), [0.5, 1 / 1.02, 1 / 1.0004])
+    np.testing.assert_allclose(get_production_factors(0.5, -1, 2), [1 / 3, 0.5])
+
+
+def test_factors_are_cached_and_read_only():
+    factors = get_discount_factors(0.03, 1, 10)
+    assert get_discount_factors(0.03, 1, 10) is factors
+    with pytest.raises(ValueError):
+        factors[0] = 0.0
+
+
+def test_npv_over_the_last_axis():
+    values = np.arange(12.0).reshape(2, 2, 3)
+    factors = get_discount_factors(0.05, 0, 3)
+    np.testing.assert_allclose(get_npv(values, factors), (values * factors).sum(axis=-1))
+
+
+def test_annuity_factor_sums_the_discount_factors():
+    assert get_annuity_factor(0.05, 20) == pytest.approx(get_discount_factors(0.05, 1, 20).sum())
+    assert get_annuity_factor(0.0, 20) == 20.0
@@ -0,0 +1,33 @@
+# Install packages
+import itertools
+
+import numpy as np
+import pytest
+
+from engine_interface import get_metrics_batch
+from search_package.constraints import OptionConstraints
+from search_package.enumeration import DesignEnumerator, designs_to_index, run_enumeration
+from src.data_io.design_space import get_design_space
+
+
+def feasible_designs(job_data) -> np.ndarray:
+    design_space = get_design_space(job_data)
+    designs = np.array(list(itertools.product(*(range(size) for size in design_space.block_sizes))))
+    return designs[OptionConstraints.from_job_data(job_data).check(designs)]
+
+
+def test_enumerates_the_demo_concept(job_data, choices):
+    design_space = get_design_space(job_data)
+    demo_index = designs_to_index(design_space.encode(choices)[None, :], design_space.block_sizes)[0]
+    indices = np.concatenate([indices for indices, _ in DesignEnumerator(job_data, chunksize=100)])
+    assert demo_index in indices
+    assert len(indices) == design_space.number_of_designs
+
+
+@pytest.mark.parametrize("job", ["job_data", "constrained_job_data"])
+def test_best_designs_match_brute_force(job, request):
+    job_data = request.getfixturevalue(job)
+    designs = feasible_designs(job_data)
+    result = run_enumeration(job_data, chunksize=97)
+    assert result["feasible_designs"] == len(designs)
+    assert result["best"]["lcox"]["value"] == pytest.approx(np.nanmin(get_metrics_batch(designs, job_data)["LCOX"]))
@@ -0,0 +1,115 @@
+# Install packages
+import numpy as np
+import pytest
+
+from archetypes.green_hydrogen.electrolyzer import (
+    HYDROGEN_LHV,
+    PART_LOAD_EFFICIENCY,
+    PART_LOAD_POINTS,
+    PowerProfile,
+    get_replacement_time,
+)
+from archetypes.green_hydrogen.green_hydrogen import green_hydrogen, green_hydrogen_batch
+from archetypes.green_hydrogen.green_hydrogen_metrics import ELECTROLYZER_BLOCK_UUID
+from engine_interface import get_design_properties
+from metrics import get_archetype_user_input, get_data, get_general_user_inputs, get_wacc_real
+
+ELECTROLYZERS = [
+    {"PEM": {"efficiency": 62, "minload": 5, "stacklifetime": 60000, "stackcostshare": 40}},
+    {"ALK": {"efficiency": 66, "minload": 20, "stacklifetime": 90000}},
+    {"SOEC": {"efficiency": 80, "minload": 30, "stacklifetime": 20000, "stackcostshare": 55}},
+    {"default": {}},
+]
+
+
+def naive_annual_output(power: np.ndarray, capacity: float, rated_efficiency: float, min_load: float) -> dict:
+    """Hour by hour hydrogen, operating hours and energy of one electrolyzer, per year"""
+    output = {"hydrogen": [], "operating_hours": [], "energy": []}
+    for year in np.atleast_2d(power):
+        hydrogen = operating_hours = energy = 0.0
+        for hour_power in year.tolist():
+            load = min(hour_power / capacity, 1.0)
+            if load < min_load:
+                continue
+            efficiency = rated_efficiency * np.interp(load, PART_LOAD_POINTS, PART_LOAD_EFFICIENCY)
+            hydrogen += capacity * load * 1000 * efficiency / HYDROGEN_LHV
+            operating_hours += 1
+            energy += capacity * load
+        output["hydrogen"].append(hydrogen)
+        output["operating_hours"].append(operating_hours)
+        output["energy"].append(energy)
+    return output
+
+
+def naive_replacement_time(operating_hours: list, stack_lifetime: float, lifetime: int) -> int:
+    cumulative = 0.0
+    for year in range(lifetime):
+        cumulative += operating_hours[year % len(operating_hours)]
+        if cumulative >= stack_lifetime:
+            return year + 1
+    return 0
+
+
+@pytest.fixture(scope="module")
+def power():
+    # two years of hourly power with calm hours, part load and hours above the electrolyzer capacity
+    rng = np.random.default_rng(21)
+    return np.clip(rng.normal(60, 45, size=(2, 2000)), 0, 150)
+
+
+@pytest.mark.parametrize(
+    "capacity, rated_efficiency, min_load", [(100, 0.6, 0.1), (50, 0.7, 0.25), (200, 0.55, 0.0), (80, 0.65, 1.0)]
+)
+def test_annual_output_equals_an_hourly_loop(power, capacity, rated_efficiency, min_load):
+    output = PowerProfile(power).annual_output(capacity, rated_efficiency, min_load)
+    expected = naive_annual_output(power, capacity, rated_efficiency, min_load)
+    for key, values in expected.items():
+        np.testing.assert_allclose(output[key][0], values, rtol=1e-9)
+
+
+def test_annual_output_per_option(power):
+    capacity, rated_efficiency, min_load = np.array([100, 50, 200]), np.array([0.6, 0.7, 0.55]), np.array([0.1, 0.3, 0])
+    output = PowerProfile(power).annual_output(capacity, rated_efficiency, min_load)
+    assert output["hydrogen"].shape == (3, 2)
+    for option in range(3):
+        expected = naive_annual_output(power, capacity[option], rated_efficiency[option], min_load[option])
+        np.testing.assert_allclose(output["hydrogen"][option], expected["hydrogen"], rtol=1e-9)
+
+
+@pytest.mark.parametrize("stack_lifetime", [1000, 7000, 20000, 80000, 1e9])
+def test_replacement_time_equals_a_yearly_loop(stack_lifetime):
+    operating_hours = np.array([[3000.0, 5000.0, 4000.0], [8760.0, 0.0, 100.0]])
+    expected = [naive_replacement_time(hours, stack_lifetime, 25) for hours in operating_hours.tolist()]
+    np.testing.assert_array_equal(get_replacement_time(operating_hours, stack_lifetime, 25), expected)
+
+
+@pytest.fixture(scope="module")
+def green_hydrogen_inputs(job_data):
+    general_user_inputs = get_general_user_inputs()
+    return {
+        "wacc_real": get_wacc_real(general_user_inputs["wacc_nominal"], general_user_inputs["inflation_rate"]),
+        "general_user_inputs": general_user_inputs,
+        "archetype_user_input": get_archetype_user_input("green_hydrogen"),
+        "job_data": job_data.model_copy(update={"archetypes": ["green_hydrogen"]}),
+        "wind_data": get_data("wind"),
+    }
+
+
+def test_batch_equals_scalar(green_hydrogen_inputs, choices):
+    choices_list = [{**choices, ELECTROLYZER_BLOCK_UUID: electrolyzer} for electrolyzer in ELECTROLYZERS]
+    scalar = [green_hydrogen(choices=design, **green_hydrogen_inputs) for design in choices_list]
+    assert len({outputs["production"] for outputs in scalar}) == len(choices_list)
+    assert len({outputs["stack_replacement_time"] for outputs in scalar}) > 1
+
+    batch = green_hydrogen_batch(
+        design_properties=get_design_properties(choices_list, green_hydrogen_inputs["job_data"]),
+        **green_hydrogen_inputs,
+    )
+    keys = ("capex", "opex", "production", "hydrogen", "layout", "stack_replacement_cost", "stack_replacement_time")
+    for key in keys:
+        np.testing.assert_allclose(batch[key], [outputs[key] for outputs in scalar])
+
+
+def test_production_is_the_hydrogen_energy(green_hydrogen_inputs, choices):
+    outputs = green_hydrogen(choices={**choices, ELECTROLYZER_BLOCK_UUID: ELECTROLYZERS[0]}, **green_hydrogen_inputs)
+    assert outputs["production"] == pytest.approx(outputs["hydrogen"] * HYDROGEN_LHV / 1000)
@@ -0,0 +1,14 @@
+# Install packages
+from benchmarks.import_time import measure_import
+
+# Generous bound on the cumulative import time of engine_interface (the benchmark budget is 400 ms)
+IMPORT_BOUND_MS = 2000
+FORBIDDEN_IMPORTS = {"pandas", "pydantic", "munch"}
+
+
+def test_engine_interface_imports_light_and_fast():
+    imports = [measure_import("engine_interface") for _ in range(3)]
+    packages = {module.split(".")[0] for module in imports[0]["modules"]}
+    assert "engine_interface" in imports[0]["modules"]
+    assert packages & FORBIDDEN_IMPORTS == set()
+    assert min(result["import_ms"] for result in imports) < IMPORT_BOUND_MS
@@ -0,0 +1,120 @@
+# Install packages
+import threading
+
+import numpy as np
+import pytest
+
+from src import instrumentation
+from src.instrumentation import StageStats, profile, recorder
+
+
+@pytest.fixture
+def stages(monkeypatch):
+    """Instrumented outer and inner functions, wrapped as with ENGINEERING_BLOCK_INSTRUMENTATION set"""
+    monkeypatch.setattr(instrumentation, "WRAP_FUNCTIONS", True)
+
+    @instrumentation.instrument()
+    def inner():
+        return "inner"
+
+    @instrumentation.instrument("outer_stage")
+    def outer(calls: int = 2):
+        return [inner() for _ in range(calls)]
+
+    return outer, inner
+
+
+def test_functions_are_not_wrapped_without_the_environment_flag(monkeypatch):
+    monkeypatch.setattr(instrumentation, "WRAP_FUNCTIONS", False)
+
+    def function():
+        pass
+
+    assert instrumentation.instrument()(function) is function
+
+
+def test_nested_stages_are_recorded_per_path(stages):
+    outer, inner = stages
+    with profile() as profiled:
+        assert outer() == ["inner", "inner"]
+        outer(calls=1)
+        inner()
+    report = profiled.report()
+    assert list(report) == ["inner", "outer_stage", "outer_stage/inner"]
+    assert [report[path]["count"] for path in report] == [1, 2, 3]
+    assert report["outer_stage"]["total_s"] >= report["outer_stage/inner"]["total_s"]
+
+
+def test_nothing_is_recorded_while_disabled(stages):
+    outer, _ = stages
+    with profile():
+        pass
+    outer()
+    assert recorder.report() == {}
+
+
+def test_bound_functions_keep_the_callers_path_on_other_threads(stages):
+    outer, inner = stages
+    with profile() as profiled:
+
+        @instrumentation.instrument("caller")
+        def caller():
+            thread = threading.Thread(target=recorder.bind(inner))
+            thread.start()
+            thread.join()
+
+        caller()
+        thread = threading.Thread(target=inner)
+        thread.start()
+        thread.join()
+    assert list(profiled.report()) == ["caller", "caller/inner", "inner"]
+
+
+def test_quantiles_are_within_a_histogram_bucket():
+    durations = np.random.default_rng(0).lognormal(np.log(1e5), 1.5, size=2000).astype(int) + 1
+    stats = StageStats()
+    for duration in durations.tolist():
+        stats.add(duration)
+    for q in (0.1, 0.5, 0.9, 0.99):
+        exact = np.quantile(durations, q) / 1e9
+        # the estimate is the geometric middle of a power of two bucket
+        assert exact / 2 <= stats.quantile(q) <= exact * 2
+    summary = stats.to_dict()
+    assert summary["count"] == len(durations)
+    assert summary["min_s"] == durations.min() / 1e9
+    assert summary["max_s"] == durations.max() / 1e9
+    assert sum(summary["histogram"].values()) == len(durations)
+
+
+def test_quantiles_are_clamped_to_the_recorded_range():
+    stats = StageStats()
+    for _ in range(10):
+        stats.add(1000)
+    assert stats.quantile(0.5) == stats.quantile(0.99) == 1000 / 1e9
+
+
+def test_chrome_trace_events(stages):
+    outer, _ = stages
+    with profile(trace=True) as profiled:
+        outer()
+    trace = profiled.chrome_trace()
+    events = trace["traceEvents"]
+    assert [(event["name"], event["args"]["path"]) for event in events] == [
+        ("inner", "outer_stage/inner"),
+        ("inner", "outer_stage/inner"),
+        ("outer_stage", "outer_stage"),
+    ]
+    assert all(event["ph"] == "X" and event["ts"] >= 0 and event["dur"] >= 0 for event in events)
+    parent = events[-1]
+    for child in events[:-1]:
+        assert parent["ts"] <= child["ts"] and child["ts"] + child["dur"] <= parent["ts"] + parent["dur"]
+    assert trace["otherData"]["dropped_events"] == 0
+
+
+def test_chrome_trace_drops_events_beyond_the_bound(stages):
+    outer, _ = stages
+    with profile(trace=True) as profiled:
+        profiled.max_events = 2
+        outer(calls=3)
+    assert len(profiled.chrome_trace()["traceEvents"]) == 2
+    assert profiled.dropped_events == 2
@@ -0,0 +1,62 @@
+# Install packages
+import pickle
+
+import pytest
+
+from src.data_io.job_data import JOB_DATA_CACHE_VERSION, JobData
+from src.utilities import load_job_data_from_file
+
+from conftest import ROOT
+
+JOB_FILE = ROOT / "src" / "local_project_9_default_2_input.json"
+
+
+def get_cache_files(cache_dir):
+    return list(cache_dir.glob(f"*.v{JOB_DATA_CACHE_VERSION}.pickle"))
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ENGINEERING_BLOCK_CACHE_DIR", str(tmp_path))
+    return tmp_path / "job_data"
+
+
+def test_cached_load_equals_validated_load(cache_dir):
+    validated = JobData.from_file(JOB_FILE, use_cache=False)
+    first = load_job_data_from_file(JOB_FILE)
+    assert len(get_cache_files(cache_dir)) == 1
+    cached = load_job_data_from_file(JOB_FILE)
+    assert cached is not first
+    assert first == validated
+    assert cached == validated
+    assert cached.model_dump() == validated.model_dump()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not a pickle",
+        b"",
+        # pickled before a module was removed or a class renamed
+        b"cno_such_module\nJobData\n.",
+        b"csrc.data_io.job_data\nRenamedJobData\n.",
+    ],
+    ids=["corrupt", "empty", "missing-module", "renamed-class"],
+)
+def test_corrupt_or_stale_cache_is_rebuilt(cache_dir, content):
+    validated = load_job_data_from_file(JOB_FILE)
+    (cache_file,) = get_cache_files(cache_dir)
+    cache_file.write_bytes(content)
+
+    assert load_job_data_from_file(JOB_FILE) == validated
+    with cache_file.open("rb") as f:
+        assert pickle.load(f) == (True, validated)
+
+
+def test_unvalidated_entry_does_not_serve_a_validating_load(tmp_path):
+    constructed = JobData.from_file(JOB_FILE, validate=False, cache_dir=tmp_path)
+    assert JobData.from_file(JOB_FILE, validate=False, cache_dir=tmp_path) == constructed
+    validated = JobData.from_file(JOB_FILE, cache_dir=tmp_path)
+    with get_cache_files(tmp_path)[0].open("rb") as f:
+        assert pickle.load(f)[0] is True
+    assert validated == JobData.from_file(JOB_FILE, use_cache=False)
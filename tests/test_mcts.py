@@ -0,0 +1,29 @@
+# Install packages
+import numpy as np
+import pytest
+
+from engine_interface import get_metrics_batch
+from search_package.constraints import OptionConstraints
+from search_package.enumeration import run_enumeration
+from search_package.mcts import run_mcts
+
+
+def test_finds_the_best_lcox(job_data):
+    result = run_mcts(job_data, max_rollouts=2000, seed=0)
+    expected = run_enumeration(job_data, pareto=False)["best"]["lcox"]["value"]
+    assert result["best"]["lcox"]["value"] == pytest.approx(expected)
+
+
+def test_only_evaluates_feasible_designs(constrained_job_data):
+    evaluated = []
+
+    def evaluate(designs):
+        evaluated.append(designs)
+        return get_metrics_batch(designs, constrained_job_data)
+
+    run_mcts(constrained_job_data, max_rollouts=500, seed=0, evaluate=evaluate)
+    designs = np.concatenate(evaluated)
+    constraints = OptionConstraints.from_job_data(constrained_job_data)
+    assert constraints.check(designs).all()
+    # both alternatives of the export cable block are reached
+    assert {0, 1} <= set(designs[:, 0].tolist())
@@ -0,0 +1,67 @@
+# Install packages
+import copy
+
+import pytest
+
+from archetypes.offshore_wind.offshore_wind_cache import cache_info, clear_cache
+from engine_interface import get_metrics
+from conftest import ROOT
+from src.utilities import load_job_data_from_file
+
+METRICS = ("capex", "opex", "layout", "production")
+
+
+def edited(choices: dict, factor: float) -> dict:
+    """Choices with the same option names and every numeric property value scaled"""
+    choices = copy.deepcopy(choices)
+    for block_data in choices.values():
+        for properties in block_data.values():
+            for name, value in properties.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    properties[name] = value * factor
+    return choices
+
+
+def cold_metrics(choices: dict, job_data) -> dict:
+    clear_cache()
+    return get_metrics(choices=choices, job_data=job_data)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_edited_option_values_do_not_hit(job_data, choices):
+    get_metrics(choices=choices, job_data=job_data)
+    edited_choices = edited(choices, 1.1)
+    warm = get_metrics(choices=edited_choices, job_data=job_data)
+    cold = cold_metrics(edited_choices, job_data)
+    for metric in METRICS:
+        assert warm[metric] == pytest.approx(cold[metric])
+    assert warm["capex"] != pytest.approx(cold_metrics(choices, job_data)["capex"])
+
+
+def test_jobs_sharing_engine_job_id_do_not_share_results(job_data, choices):
+    other_job = load_job_data_from_file(ROOT / "src" / "local_project_9_default_2_input.json")
+    assert other_job.engine_job_id == job_data.engine_job_id
+
+    get_metrics(choices=choices, job_data=job_data)
+    misses = cache_info()["misses"]
+    get_metrics(choices=choices, job_data=other_job)
+    assert cache_info()["misses"] > misses
+
+    # the same job object reuses its sub-results
+    misses = cache_info()["misses"]
+    get_metrics(choices=choices, job_data=other_job)
+    assert cache_info()["misses"] == misses
+
+
+def test_warm_results_match_cold(job_data, choices):
+    get_metrics(choices=choices, job_data=job_data)
+    warm = get_metrics(choices=choices, job_data=job_data)
+    cold = cold_metrics(choices, job_data)
+    for metric in METRICS:
+        assert warm[metric] == pytest.approx(cold[metric])
@@ -0,0 +1,65 @@
+# Install packages
+import numpy as np
+import pytest
+
+from archetypes.offshore_wind.offshore_wind_metrics import REQUIRED_PROPERTIES
+from benchmarks.synthetic_job_data import has_required_properties
+from engine_interface import get_metrics, get_metrics_batch
+from parallel_evaluator import ParallelEvaluator, get_metrics_parallel
+from src.data_io.design_space import get_design_space
+
+
+@pytest.fixture(scope="module")
+def designs(job_data):
+    """A spread of sample designs the scalar path can evaluate, as design matrix rows"""
+    design_space = get_design_space(job_data)
+    rows = [
+        [
+            row
+            for row, option in enumerate(block.options)
+            if has_required_properties(option, REQUIRED_PROPERTIES.get(block.uuid, ()))
+        ]
+        for block in design_space.blocks
+    ]
+    rng = np.random.default_rng(6)
+    return np.array([[rng.choice(block_rows) for block_rows in rows] for _ in range(45)])
+
+
+@pytest.fixture(scope="module")
+def choices_list(job_data, designs):
+    design_space = get_design_space(job_data)
+    return [design_space.decode(design) for design in designs]
+
+
+@pytest.fixture(scope="module")
+def evaluator(job_data):
+    with ParallelEvaluator(job_data, max_workers=2, chunksize=7) as evaluator:
+        yield evaluator
+
+
+def test_evaluate_equals_serial_in_order(evaluator, job_data, choices_list):
+    serial = [get_metrics(choices=choices, job_data=job_data) for choices in choices_list]
+    assert evaluator.evaluate(choices_list) == serial
+
+
+def test_evaluate_batch_equals_serial_in_order(evaluator, job_data, choices_list, designs):
+    serial = get_metrics_batch(choices_list, job_data)
+    for parallel in (evaluator.evaluate_batch(choices_list), evaluator.evaluate_batch(designs)):
+        assert list(parallel) == list(serial)
+        for metric, values in serial.items():
+            np.testing.assert_array_equal(parallel[metric], values)
+
+
+def test_report_counts_every_design(evaluator, choices_list):
+    evaluator.stats.clear()
+    evaluator.evaluate(choices_list)
+    report = evaluator.report()
+    assert 1 <= len(report) <= 2
+    assert sum(stats["designs"] for stats in report.values()) == len(choices_list)
+    assert evaluator.evaluate([]) == []
+    assert evaluator.evaluate_batch([]) == {}
+
+
+def test_get_metrics_parallel(job_data, choices_list):
+    serial = [get_metrics(choices=choices, job_data=job_data) for choices in choices_list[:5]]
+    assert get_metrics_parallel(choices_list[:5], job_data, max_workers=2) == serial
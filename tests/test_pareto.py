@@ -0,0 +1,80 @@
+# Install packages
+import numpy as np
+import pytest
+
+from search_package.pareto import ParetoArchive, get_objective_matrix, non_dominated, non_dominated_sort, pareto_front
+
+
+def dominates(a, b) -> bool:
+    return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+
+
+def naive_non_dominated(points: np.ndarray) -> np.ndarray:
+    return np.array([not any(dominates(other, point) for other in points.tolist()) for point in points.tolist()])
+
+
+def naive_ranks(points: np.ndarray) -> np.ndarray:
+    ranks = np.full(len(points), -1)
+    remaining = list(range(len(points)))
+    rank = 0
+    while remaining:
+        front = [i for i in remaining if not any(dominates(points[j], points[i]) for j in remaining)]
+        ranks[front] = rank
+        remaining = [i for i in remaining if i not in front]
+        rank += 1
+    return ranks
+
+
+def random_points(rng: np.random.Generator) -> np.ndarray:
+    """Random point sets with ties and duplicates (small integer grids) or continuous values"""
+    shape = (int(rng.integers(0, 60)), int(rng.integers(1, 6)))
+    if rng.random() < 0.5:
+        return rng.integers(0, 4, size=shape).astype(float)
+    return rng.normal(size=shape)
+
+
+CASES = [random_points(np.random.default_rng(seed)) for seed in range(300)]
+
+
+@pytest.mark.parametrize("points", CASES)
+def test_non_dominated_equals_brute_force(points):
+    np.testing.assert_array_equal(non_dominated(points), naive_non_dominated(points))
+
+
+@pytest.mark.parametrize("points", CASES[::3])
+def test_non_dominated_sort_equals_brute_force(points):
+    np.testing.assert_array_equal(non_dominated_sort(points), naive_ranks(points))
+
+
+def test_chunked_dominance_equals_brute_force():
+    points = np.random.default_rng(1).integers(0, 6, size=(2500, 4)).astype(float)
+    np.testing.assert_array_equal(non_dominated(points), naive_non_dominated(points))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_archive_keeps_the_front_of_everything_added(seed):
+    rng = np.random.default_rng(seed)
+    objectives = int(rng.integers(1, 5))
+    archive = ParetoArchive(objectives)
+    added = np.zeros((0, objectives))
+    for _ in range(int(rng.integers(1, 6))):
+        batch = rng.integers(0, 5, size=(int(rng.integers(0, 20)), objectives)).astype(float)
+        archive.add(batch)
+        added = np.concatenate((added, batch))
+    expected = np.flatnonzero(naive_non_dominated(added))
+    assert archive.items == expected.tolist()
+    np.testing.assert_array_equal(archive.points, added[expected])
+
+
+def test_objective_matrix_directions_and_missing_values(job_data):
+    results = {
+        "capex": np.array([1.0, 2.0, np.nan]),
+        "trl": np.array([5.0, 7.0, 6.0]),
+        "LCOX": np.array([np.nan, np.nan, np.nan]),
+    }
+    points, drivers = get_objective_matrix(results, job_data)
+    expected = {"capex": [1.0, 2.0, np.inf], "trl": [-5.0, -7.0, -6.0]}
+    assert set(drivers) <= set(expected)
+    for column, driver in enumerate(drivers):
+        np.testing.assert_array_equal(points[:, column], expected[driver])
+    np.testing.assert_array_equal(pareto_front(results, job_data), np.flatnonzero(naive_non_dominated(points)))
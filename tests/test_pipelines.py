@@ -0,0 +1,205 @@
+# Install packages
+import math
+
+import numpy as np
+import pytest
+
+from archetypes.pipelines.hydraulics import (
+    CANDIDATE_DIAMETERS,
+    FLUIDS,
+    GAS_CONSTANT,
+    GRAVITY,
+    TEMPERATURE,
+    Route,
+    compression_duty,
+    get_route,
+    size_pipeline,
+)
+from archetypes.pipelines.pipelines import pipelines, pipelines_batch
+from archetypes.pipelines.pipelines_metrics import (
+    COMPRESSOR_BLOCK_UUID,
+    FULL_LOAD_HOURS,
+    OFFSHORE_COST_FACTOR,
+    PIPE_BLOCK_UUID,
+    PIPE_COST,
+    PIPE_OPEX_SHARE,
+    POWER_COST,
+    get_pipeline_sizing,
+)
+from economics_package.discounting import get_annuity_factor
+from engine_interface import get_design_properties
+from metrics import get_archetype_user_input, get_data, get_general_user_inputs, get_wacc_real
+
+PIPES = [
+    {"P1": {"roughness": 0.02, "maxpressure": 80, "costfactor": 1.0}},
+    {"P2": {"roughness": 0.1, "maxpressure": 120, "costfactor": 0.8}},
+    # rated below the outlet pressure, so no diameter is feasible
+    {"P3": {"roughness": 0.045, "maxpressure": 20}},
+]
+COMPRESSORS = [
+    {"C1": {"efficiency": 70, "costpermw": 2.5}},
+    {"C2": {}},
+]
+
+
+def gas_constant(fluid: str) -> float:
+    properties = FLUIDS[fluid]
+    return properties["compressibility"] * GAS_CONSTANT * TEMPERATURE / properties["molar_mass"]
+
+
+def naive_inlet_pressure(route: Route, fluid: str, flow_rate, outlet_pressure, roughness, diameter) -> dict:
+    """Segment by segment hydraulics of one pipe: the lowest inlet pressure keeping every segment end at or above
+    the outlet pressure, and the highest velocity"""
+    properties = FLUIDS[fluid]
+    area = math.pi * diameter**2 / 4
+    reynolds = 4 * flow_rate / (math.pi * diameter * properties["viscosity"])
+    friction = 0.25 / math.log10(roughness / 1000 / (3.7 * diameter) + 5.74 / reynolds**0.9) ** 2
+    outlet = outlet_pressure * 1e5
+    if properties["compressible"]:
+        # p_end^2 = p_start^2 - drop per segment
+        velocity = flow_rate * gas_constant(fluid) / (outlet * area)
+        needed = cumulative = 0.0
+        for length in route.length.tolist():
+            drop = 16 * friction * length * 1000 * flow_rate**2 * gas_constant(fluid) / (math.pi**2 * diameter**5)
+            cumulative += drop
+            needed = max(needed, cumulative)
+        inlet = math.sqrt(outlet**2 + needed)
+    else:
+        density = properties["density"]
+        velocity = flow_rate / (density * area)
+        needed = cumulative = 0.0
+        for length, elevation in zip(route.length.tolist(), route.elevation.tolist()):
+            cumulative += friction * length * 1000 / diameter * density * velocity**2 / 2
+            cumulative += density * GRAVITY * elevation
+            needed = max(needed, cumulative)
+        inlet = outlet + needed
+    return {"inlet_pressure": inlet / 1e5, "velocity": velocity}
+
+
+def naive_duty(fluid: str, flow_rate, supply_pressure, inlet_pressure, efficiency) -> float:
+    properties = FLUIDS[fluid]
+    if inlet_pressure <= supply_pressure:
+        return 0.0
+    if properties["compressible"]:
+        exponent = (properties["heat_capacity_ratio"] - 1) / properties["heat_capacity_ratio"]
+        work = gas_constant(fluid) / exponent * ((inlet_pressure / supply_pressure) ** exponent - 1)
+    else:
+        work = (inlet_pressure - supply_pressure) * 1e5 / properties["density"]
+    return flow_rate * work / efficiency / 1e6
+
+
+@pytest.fixture(scope="module")
+def route(job_data):
+    return get_route(get_data("pipelines"), job_data.country)
+
+
+@pytest.fixture(scope="module")
+def hilly_route():
+    rng = np.random.default_rng(22)
+    return Route(rng.uniform(0.5, 5, 40), rng.normal(0, 30, 40), rng.random(40) < 0.3)
+
+
+@pytest.mark.parametrize("fluid, flow_rate", [("hydrogen", 10.0), ("hydrogen", 40.0), ("co2", 300.0)])
+def test_size_pipeline_equals_a_segment_loop(route, hilly_route, fluid, flow_rate):
+    roughness = np.array([0.02, 0.045, 0.1])
+    for pipe_route in (route, hilly_route):
+        sizing = size_pipeline(pipe_route, fluid, flow_rate, 30, roughness)
+        assert sizing["inlet_pressure"].shape == (len(roughness), len(CANDIDATE_DIAMETERS))
+        for option, option_roughness in enumerate(roughness.tolist()):
+            for column, diameter in enumerate(CANDIDATE_DIAMETERS.tolist()):
+                expected = naive_inlet_pressure(pipe_route, fluid, flow_rate, 30, option_roughness, diameter)
+                assert sizing["inlet_pressure"][option, column] == pytest.approx(expected["inlet_pressure"], rel=1e-9)
+                assert sizing["velocity"][option, column] == pytest.approx(expected["velocity"], rel=1e-12)
+
+
+@pytest.mark.parametrize("fluid", ["hydrogen", "co2"])
+def test_compression_duty_equals_the_scalar_formula(fluid):
+    inlet_pressure = np.array([[10.0, 30.0, 31.0], [45.0, 80.0, 150.0]])
+    efficiency = np.array([[0.7], [0.85]])
+    duty = compression_duty(fluid, 12.0, 30.0, inlet_pressure, efficiency)
+    for (row, column), pressure in np.ndenumerate(inlet_pressure):
+        assert duty[row, column] == pytest.approx(naive_duty(fluid, 12.0, 30.0, pressure, efficiency[row, 0]))
+    assert np.all(duty[0, :2] == 0)
+
+
+@pytest.fixture(scope="module")
+def pipelines_inputs(job_data):
+    general_user_inputs = get_general_user_inputs()
+    return {
+        "wacc_real": get_wacc_real(general_user_inputs["wacc_nominal"], general_user_inputs["inflation_rate"]),
+        "general_user_inputs": general_user_inputs,
+        "archetype_user_input": get_archetype_user_input("pipelines"),
+        "job_data": job_data.model_copy(update={"archetypes": ["pipelines"]}),
+        "pipelines_data": get_data("pipelines"),
+    }
+
+
+def naive_selection(pipelines_inputs, route, pipe: dict, compressor: dict) -> dict:
+    """Lifetime cost of every candidate diameter in turn, keeping the cheapest feasible one"""
+    user_input = pipelines_inputs["archetype_user_input"]
+    annuity = get_annuity_factor(
+        pipelines_inputs["wacc_real"], pipelines_inputs["general_user_inputs"]["project_lifetime"]
+    )
+    best = {"lifetime_cost": np.inf, "diameter": np.nan, "capex": np.nan, "compressor_duty": np.nan}
+    for diameter in CANDIDATE_DIAMETERS.tolist():
+        hydraulics = naive_inlet_pressure(
+            route,
+            user_input["fluid"],
+            user_input["flow_rate"],
+            user_input["outlet_pressure"],
+            pipe["roughness"],
+            diameter,
+        )
+        if hydraulics["inlet_pressure"] > pipe["maxpressure"] or hydraulics["velocity"] > user_input["max_velocity"]:
+            continue
+        duty = naive_duty(
+            user_input["fluid"],
+            user_input["flow_rate"],
+            user_input["supply_pressure"],
+            hydraulics["inlet_pressure"],
+            compressor["efficiency"] / 100,
+        )
+        pipe_capex = PIPE_COST * diameter * pipe["costfactor"] * route.get_weighted_length(OFFSHORE_COST_FACTOR)
+        capex = pipe_capex + duty * compressor["costpermw"]
+        opex = PIPE_OPEX_SHARE * pipe_capex + duty * FULL_LOAD_HOURS * POWER_COST
+        if capex + opex * annuity < best["lifetime_cost"]:
+            best = {
+                "lifetime_cost": capex + opex * annuity,
+                "diameter": diameter,
+                "capex": capex,
+                "compressor_duty": duty,
+            }
+    return best
+
+
+def test_selection_equals_a_loop_over_the_diameters(pipelines_inputs, route, choices):
+    defaults = {"roughness": 0.045, "maxpressure": 100.0, "costfactor": 1.0, "efficiency": 75.0, "costpermw": 3.0}
+    for pipe in PIPES:
+        for compressor in COMPRESSORS:
+            sizing = get_pipeline_sizing(
+                choices={**choices, PIPE_BLOCK_UUID: pipe, COMPRESSOR_BLOCK_UUID: compressor}, **pipelines_inputs
+            )
+            pipe_data = {**defaults, **next(iter(pipe.values()))}
+            compressor_data = {**defaults, **next(iter(compressor.values()))}
+            expected = naive_selection(pipelines_inputs, route, pipe_data, compressor_data)
+            for key in ("diameter", "capex", "compressor_duty"):
+                np.testing.assert_allclose(sizing[key], expected[key], rtol=1e-9)
+
+
+def test_batch_equals_scalar(pipelines_inputs, choices):
+    choices_list = [
+        {**choices, PIPE_BLOCK_UUID: pipe, COMPRESSOR_BLOCK_UUID: compressor}
+        for pipe in PIPES
+        for compressor in COMPRESSORS
+    ]
+    scalar = [pipelines(choices=design, **pipelines_inputs) for design in choices_list]
+    assert len({outputs["capex"] for outputs in scalar if not np.isnan(outputs["capex"])}) == 4
+    assert np.isnan([outputs["diameter"] for outputs in scalar[-2:]]).all()
+
+    batch = pipelines_batch(
+        design_properties=get_design_properties(choices_list, pipelines_inputs["job_data"]), **pipelines_inputs
+    )
+    keys = ("capex", "opex", "production", "throughput", "layout", "diameter", "inlet_pressure", "compressor_duty")
+    for key in keys:
+        np.testing.assert_allclose(batch[key], [outputs[key] for outputs in scalar])
+    np.testing.assert_array_equal(batch["production"], 0.0)
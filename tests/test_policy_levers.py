@@ -0,0 +1,88 @@
+# Install packages
+import numpy as np
+import pytest
+
+import engine_interface
+from economics_package.cash_flows import get_cash_flows, get_horizon, get_window
+from economics_package.economics_metrics import get_carbon_footprint
+from engine_interface import get_design_properties, get_metrics_batch
+from engineering_block import engineering_block_batch
+from metrics import get_general_user_inputs, get_start_date, get_wacc_real
+from scenarios.policy_levers import get_scenario_grid, run_policy_sweep
+
+
+def get_base_economics(job_data, choices) -> dict:
+    """Cash flows and carbon footprint of a design at the base case general user inputs"""
+    general_user_inputs = get_general_user_inputs()
+    start_date = get_start_date(general_user_inputs["fid"], general_user_inputs["in_phasing"][0])
+    wacc_real = get_wacc_real(general_user_inputs["wacc_nominal"], general_user_inputs["inflation_rate"])
+    engineering_outputs = engineering_block_batch(
+        general_user_inputs=general_user_inputs,
+        job_data=job_data,
+        design_properties=get_design_properties([choices], job_data),
+        wacc_real=wacc_real,
+    )
+    cash_flows = get_cash_flows(general_user_inputs, engineering_outputs, job_data, start_date, wacc_real)
+    operating = get_window(
+        get_horizon(general_user_inputs, start_date),
+        start_date,
+        general_user_inputs["project_lifetime"],
+        cash_flows.timeline_start,
+    )
+    return {
+        "cash_flows": cash_flows,
+        # discount factors of the operating years, at the discount rate
+        "operating_factors": cash_flows.factors["opex"][operating >= 0],
+        "carbon_footprint": get_carbon_footprint(job_data=job_data, engineering_outputs=engineering_outputs),
+    }
+
+
+def test_unknown_lever():
+    with pytest.raises(ValueError):
+        get_scenario_grid({"tax_rate": [0.1]})
+
+
+@pytest.mark.parametrize("fid", [2021, 2023, 2026])
+def test_fid_sweep_matches_metrics(job_data, choices, monkeypatch, fid):
+    sweep = run_policy_sweep([choices], job_data, {"fid": [2021, 2023, 2026]})
+    column = [scenario["fid"] for scenario in sweep["scenarios"]].index(fid)
+
+    general_user_inputs = {**get_general_user_inputs(), "fid": fid}
+    monkeypatch.setattr(engine_interface, "get_general_user_inputs", lambda: general_user_inputs)
+    expected = get_metrics_batch([choices], job_data)
+    for metric in ("capex", "opex", "production", "LCOX"):
+        np.testing.assert_allclose(sweep["metrics"][metric][:, column], expected[metric])
+
+
+def test_carbon_price_adds_the_discounted_footprint_cost(job_data, choices):
+    capture_job = job_data.model_copy(update={"archetypes": ["OWF", "carbon_capture"]})
+    prices = [0.0, 1e-4, 5e-4]
+    sweep = run_policy_sweep([choices], capture_job, {"carbon_price": prices})
+    base = get_base_economics(capture_job, choices)
+    cash_flows = base["cash_flows"]
+    assert base["carbon_footprint"][0] != 0
+
+    carbon_cost = base["carbon_footprint"][:, None] * np.array(prices) * base["operating_factors"].sum()
+    np.testing.assert_allclose(sweep["metrics"]["carbon_cost"], carbon_cost)
+    np.testing.assert_allclose(sweep["metrics"]["subsidy"], 0.0)
+    costs = (cash_flows.npv("capex") + cash_flows.npv("opex"))[:, None] + carbon_cost
+    np.testing.assert_allclose(sweep["metrics"]["LCOX"], costs / cash_flows.npv("production")[:, None])
+
+
+def test_subsidies_reduce_the_levelised_cost(job_data, choices):
+    # solar degrades and green hydrogen replaces its stacks, so the production and opex streams are not flat
+    hybrid_job = job_data.model_copy(update={"archetypes": ["OWF", "green_hydrogen", "solar"]})
+    sweep = run_policy_sweep([choices], hybrid_job, {"capex_subsidy": [0.0, 0.2], "production_subsidy": [0.0, 1.0]})
+    base = get_base_economics(hybrid_job, choices)
+    cash_flows = base["cash_flows"]
+    capex, opex, production = (cash_flows.npv(stream)[0] for stream in ("capex", "opex", "production"))
+    # the production subsidy is paid per unit produced, discounted like the opex
+    subsidised_production = (cash_flows.streams["production"] @ cash_flows.factors["opex"]).sum(axis=-1)[0]
+
+    for column, scenario in enumerate(sweep["scenarios"]):
+        subsidy = scenario["capex_subsidy"] * capex + scenario["production_subsidy"] * subsidised_production
+        assert sweep["metrics"]["subsidy"][0, column] == pytest.approx(subsidy)
+        assert sweep["metrics"]["LCOX"][0, column] == pytest.approx((capex + opex - subsidy) / production)
+        for metric, value in (("capex", capex), ("opex", opex), ("production", production)):
+            assert sweep["metrics"][metric][0, column] == pytest.approx(value)
+    assert np.all(np.diff(sweep["metrics"]["LCOX"][0, [0, 1, 3]]) < 0)
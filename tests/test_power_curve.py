@@ -0,0 +1,32 @@
+# Install packages
+from math import gamma
+
+import numpy as np
+
+from archetypes.offshore_wind.power_curve import WindSeries, get_weather_sequence, power_curve
+
+
+def weibull_quantiles(mean_speed: float, shape: float, hours: int) -> np.ndarray:
+    scale = mean_speed / gamma(1 + 1 / shape)
+    return scale * (-np.log1p(-(np.arange(hours) + 0.5) / hours)) ** (1 / shape)
+
+
+def test_weibull_year_keeps_the_quantiles():
+    series = WindSeries.from_weibull(9.0, 1.225)
+    np.testing.assert_allclose(series.sorted_speeds[0], weibull_quantiles(9.0, 2.0, 8760))
+
+
+def test_weibull_year_is_chronological_and_deterministic():
+    speeds = WindSeries.from_weibull(9.0, 1.225).speeds[0]
+    np.testing.assert_array_equal(speeds, WindSeries.from_weibull(9.0, 1.225).speeds[0])
+    # spells of calm and windy hours, not a sorted ramp
+    assert np.corrcoef(speeds[:-1], speeds[1:])[0, 1] > 0.9
+    assert not np.all(np.diff(speeds) >= 0)
+    np.testing.assert_array_equal(get_weather_sequence(100), get_weather_sequence(100))
+
+
+def test_annual_energy_matches_the_hourly_power():
+    series = WindSeries.from_weibull(9.0, 1.2)
+    rated_power, cut_in, rated_speed, cut_out = np.array([15.0, 8.0]), np.array([3.0, 4.0]), 12.0, 25.0
+    hourly = power_curve(series.speeds[0][None, :], rated_power[:, None], cut_in[:, None], rated_speed, cut_out)
+    np.testing.assert_allclose(series.annual_energy(rated_power, cut_in, rated_speed, cut_out)[:, 0], hourly.sum(1))
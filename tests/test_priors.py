@@ -0,0 +1,96 @@
+# Install packages
+import copy
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from search_package.priors import AGGREGATIONS, PriorScorer
+from src.utilities import to_float
+
+NAIVE_AGGREGATIONS = {
+    "sum": lambda values, weights: sum(v * w for v, w in zip(values, weights)),
+    "product": lambda values, weights: math.prod(v**w for v, w in zip(values, weights)),
+    "mean": lambda values, weights: sum(v * w for v, w in zip(values, weights)) / sum(weights),
+    "min": lambda values, weights: min(v * w for v, w in zip(values, weights)),
+    "max": lambda values, weights: max(v * w for v, w in zip(values, weights)),
+}
+
+
+def naive_option_score(option, prior) -> float:
+    values = []
+    for prior_property in prior.properties:
+        option_property = option.properties.get(prior_property.property.lower())
+        values.append(np.nan if option_property is None else to_float(option_property.value))
+    if any(np.isnan(value) for value in values):
+        return np.nan
+    return NAIVE_AGGREGATIONS[prior.aggregation](values, [x.weight for x in prior.properties])
+
+
+def with_aggregation(job_data, aggregation: str):
+    """The sample job with every capex prior aggregated with the given aggregation and uneven weights"""
+    job_data = copy.deepcopy(job_data)
+    for block in job_data.blocks.values():
+        prior = block.priors["capex"]
+        prior.aggregation = aggregation
+        for sequence, prior_property in enumerate(prior.properties):
+            prior_property.weight = 0.5 + sequence
+    return job_data
+
+
+def test_every_aggregation_has_a_reference():
+    assert set(AGGREGATIONS) == set(NAIVE_AGGREGATIONS)
+
+
+@pytest.mark.parametrize("aggregation", list(NAIVE_AGGREGATIONS))
+def test_option_scores_equal_a_per_option_loop(job_data, aggregation):
+    job_data = with_aggregation(job_data, aggregation)
+    scorer = PriorScorer(job_data)
+    for block in job_data.blocks.values():
+        for driver, prior in block.priors.items():
+            options = [option for choice in block.choices.values() for option in choice.options.values()]
+            expected = [naive_option_score(option, prior) for option in options]
+            np.testing.assert_allclose(scorer.score_options(block.uuid, driver), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("aggregation", list(NAIVE_AGGREGATIONS))
+def test_design_scores_sum_the_chosen_options(job_data, aggregation):
+    scorer = PriorScorer(with_aggregation(job_data, aggregation))
+    design_space = scorer.design_space
+    designs = np.array(list(itertools.product(*(range(size) for size in design_space.block_sizes.tolist()))))
+    option_scores = [scorer.score_options(uuid, "capex") for uuid in design_space.block_uuids]
+    expected = [sum(scores[row] for scores, row in zip(option_scores, design)) for design in designs.tolist()]
+    np.testing.assert_allclose(scorer.score_designs(designs, "capex"), expected, rtol=1e-12)
+    assert np.isnan(scorer.score_designs(np.full(len(design_space), -1), "capex")).all()
+    assert np.isnan(scorer.score_designs(designs[:3], "no_such_driver")).all()
+
+
+def test_unknown_aggregation_fails(job_data):
+    with pytest.raises(ValueError, match="Unknown prior aggregation"):
+        PriorScorer(with_aggregation(job_data, "median"))
+
+
+def test_ranking_follows_the_driver_direction(job_data):
+    scorer = PriorScorer(job_data)
+    for uuid in scorer.design_space.block_uuids:
+        for driver, direction in (("capex", -1), ("trl", 1)):
+            scores = scorer.score_options(uuid, driver)
+            ranked = scorer.rank_options(uuid, driver)
+            finite = ranked[np.isfinite(scores[ranked])]
+            # best first for the driver's direction, options without a score last
+            assert np.all(np.diff(direction * scores[finite]) <= 0)
+            assert np.isnan(scores[ranked[len(finite):]]).all()
+            np.testing.assert_array_equal(scorer.prune_options(uuid, driver, 2), np.sort(ranked[:2]))
+
+
+def test_option_weights_are_probabilities(job_data):
+    scorer = PriorScorer(job_data)
+    weights = scorer.option_weights(["capex", "trl"])
+    assert [len(w) for w in weights] == scorer.design_space.block_sizes.tolist()
+    for block_weights in weights:
+        assert np.all(block_weights > 0)
+        assert block_weights.sum() == pytest.approx(1.0)
+    uniform = scorer.option_weights(["capex"], temperature=1e9)
+    for block_weights in uniform:
+        np.testing.assert_allclose(block_weights, 1 / len(block_weights))
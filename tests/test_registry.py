@@ -0,0 +1,79 @@
+# Install packages
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import engineering_block
+from archetypes.registry import get_resources, get_spec
+from engine_interface import get_metrics, get_metrics_batch
+from src.utilities import Archetypes
+
+from conftest import ROOT
+
+
+def test_every_archetype_is_registered():
+    for archetype in Archetypes:
+        assert get_spec(archetype.value).archetype is archetype
+
+
+def test_archetypes_without_a_model_are_skipped(job_data, choices):
+    hybrid_job = job_data.model_copy(update={"archetypes": ["OWF", "blue_hydrogen", "carbon_liquefaction"]})
+    assert get_resources(hybrid_job.archetypes) == ("wind",)
+    expected = get_metrics(choices=choices, job_data=job_data)
+    metrics = get_metrics(choices=choices, job_data=hybrid_job)
+    for metric in ("capex", "opex", "production", "LCOX", "layout"):
+        assert metrics[metric] == pytest.approx(expected[metric])
+
+
+def test_serial_and_threaded_evaluation_agree(job_data, choices):
+    hybrid_job = job_data.model_copy(update={"archetypes": ["OWF", "green_hydrogen", "solar"]})
+    serial = get_metrics_batch([choices], hybrid_job)
+    engineering_block.set_max_workers(None)
+    try:
+        threaded = get_metrics_batch([choices], hybrid_job)
+    finally:
+        engineering_block.set_max_workers(1)
+    for metric in ("capex", "opex", "production", "LCOX"):
+        np.testing.assert_allclose(serial[metric], threaded[metric])
+
+
+STAGE_PATHS_SCRIPT = """
+import json, threading
+import engineering_block
+from engine_interface import get_metrics, load_demo_data
+from src.instrumentation import profile
+
+choices, job_data = load_demo_data()
+hybrid_job = job_data.model_copy(update={"archetypes": ["OWF", "solar"]})
+result = {}
+for mode, max_workers in (("serial", 1), ("threads", None)):
+    engineering_block.set_max_workers(max_workers)
+    threads = threading.active_count()
+    with profile() as recorder:
+        get_metrics(choices=choices, job_data=hybrid_job)
+    result[mode] = {"paths": list(recorder.report()), "new_threads": threading.active_count() - threads}
+print(json.dumps(result))
+"""
+
+
+def test_stage_paths_are_kept_on_the_thread_pool():
+    result = subprocess.run(
+        [sys.executable, "-c", STAGE_PATHS_SCRIPT],
+        cwd=ROOT,
+        env={**os.environ, "ENGINEERING_BLOCK_INSTRUMENTATION": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modes = json.loads(result.stdout)
+    # serial by default: no threads are started
+    assert modes["serial"]["new_threads"] == 0
+    assert modes["threads"]["new_threads"] > 0
+    for mode in modes.values():
+        assert "get_metrics/engineering_block/offshore_wind" in mode["paths"]
+        assert "get_metrics/engineering_block/solar" in mode["paths"]
+        assert all(path.startswith("get_metrics") for path in mode["paths"])
@@ -0,0 +1,104 @@
+# Install packages
+import os
+
+import pytest
+
+from metrics import get_data
+from src.data_io.resource_cache import ResourceCache, ResourceData, resource_cache
+
+
+class CountingLoader:
+    """Loader returning the file content, counting the reads per file"""
+
+    def __init__(self):
+        self.reads = {}
+
+    def __call__(self, path):
+        self.reads[path] = self.reads.get(path, 0) + 1
+        with open(path) as f:
+            return f.read()
+
+
+@pytest.fixture
+def loader():
+    return CountingLoader()
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"resource_{index}.txt"
+        path.write_text(f"resource {index}")
+        paths.append(path)
+    return paths
+
+
+def test_files_are_read_once(loader, files):
+    cache = ResourceCache(loader=loader)
+    assert cache.get("wind", files[0]) == "resource 0"
+    assert cache.get("wind", files[0]) == "resource 0"
+    assert cache.get("wind", str(files[0])) == "resource 0"
+    assert loader.reads == {os.path.abspath(files[0]): 1}
+    assert cache.cache_info()["currsize"] == 1
+
+
+def test_changed_modification_time_invalidates(loader, files):
+    cache = ResourceCache(loader=loader)
+    cache.get("wind", files[0])
+    stat = files[0].stat()
+    os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    cache.get("wind", files[0])
+    assert loader.reads[os.path.abspath(files[0])] == 2
+
+
+def test_changed_size_invalidates(loader, files):
+    cache = ResourceCache(loader=loader)
+    cache.get("wind", files[0])
+    stat = files[0].stat()
+    files[0].write_text("resource 0, updated")
+    # same modification time, so only the size tells the files apart
+    os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.get("wind", files[0]) == "resource 0, updated"
+    assert loader.reads[os.path.abspath(files[0])] == 2
+
+
+def test_least_recently_used_entries_are_evicted(loader, files):
+    cache = ResourceCache(maxsize=2, loader=loader)
+    cache.get("wind", files[0])
+    cache.get("wind", files[1])
+    cache.get("wind", files[0])
+    cache.get("wind", files[2])  # evicts files[1], the least recently used
+    cache.get("wind", files[0])
+    cache.get("wind", files[1])
+    reads = [loader.reads[os.path.abspath(path)] for path in files]
+    assert reads == [1, 2, 1]
+    assert cache.cache_info()["currsize"] == 2
+
+
+def test_resize_evicts_down_to_the_new_size(loader, files):
+    cache = ResourceCache(maxsize=3, loader=loader)
+    cache.preload(("wind", path) for path in files)
+    cache.resize(1)
+    assert cache.cache_info()["currsize"] == 1
+    cache.get("wind", files[2])  # the most recently used entry is kept
+    cache.get("wind", files[0])
+    assert [loader.reads[os.path.abspath(path)] for path in files] == [2, 1, 1]
+
+
+def test_entries_are_keyed_by_archetype(loader, files):
+    cache = ResourceCache(loader=loader)
+    cache.get("wind", files[0])
+    cache.get("solar", files[0])
+    assert loader.reads[os.path.abspath(files[0])] == 2
+
+
+def test_get_data_is_shared_and_indexed_by_country():
+    resource_cache.clear()
+    data = get_data("wind")
+    assert isinstance(data, ResourceData)
+    assert get_data("wind") is data
+    assert resource_cache.cache_info()["hits"] == 1
+    sheet_name, rows = next(iter(data.countries.items()))
+    country, row = next(iter(rows.items()))
+    assert data.get_country(sheet_name, country) is row
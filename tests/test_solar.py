@@ -0,0 +1,54 @@
+# Install packages
+import numpy as np
+import pytest
+
+from archetypes.solar.solar import solar, solar_batch
+from archetypes.solar.solar_metrics import INVERTER_BLOCK_UUID, PANEL_BLOCK_UUID
+from engine_interface import get_design_properties
+from metrics import get_archetype_user_input, get_data, get_general_user_inputs, get_wacc_real
+
+PANELS = [
+    {"PV1": {"efficiency": 21, "costfactor": 1.0}},
+    {"PV2": {"efficiency": 22.5, "costfactor": 1.3}},
+]
+INVERTERS = [
+    {"INV1": {"dcacratio": 1.1, "costfactor": 0.9}},
+    {"INV2": {}},
+]
+
+
+@pytest.fixture(scope="module")
+def solar_inputs(job_data):
+    general_user_inputs = get_general_user_inputs()
+    return {
+        "wacc_real": get_wacc_real(general_user_inputs["wacc_nominal"], general_user_inputs["inflation_rate"]),
+        "general_user_inputs": general_user_inputs,
+        "archetype_user_input": get_archetype_user_input("solar"),
+        "job_data": job_data.model_copy(update={"archetypes": ["solar"]}),
+        "solar_data": get_data("solar"),
+    }
+
+
+def test_default_options_keep_the_flat_costs(solar_inputs, choices):
+    # the sample job has no panel or inverter blocks
+    assert PANEL_BLOCK_UUID not in choices and INVERTER_BLOCK_UUID not in choices
+    outputs = solar(choices=choices, **solar_inputs)
+    capacity = solar_inputs["archetype_user_input"]["capacity"]
+    assert outputs["capex"] == pytest.approx(5 * capacity)
+    assert outputs["opex"] == pytest.approx(0.1 * capacity)
+
+
+def test_costs_follow_the_chosen_options(solar_inputs, choices):
+    choices_list = [
+        {**choices, PANEL_BLOCK_UUID: panel, INVERTER_BLOCK_UUID: inverter}
+        for panel in PANELS
+        for inverter in INVERTERS
+    ]
+    scalar = [solar(choices=design, **solar_inputs) for design in choices_list]
+    assert len({outputs["capex"] for outputs in scalar}) == len(choices_list)
+
+    batch = solar_batch(
+        design_properties=get_design_properties(choices_list, solar_inputs["job_data"]), **solar_inputs
+    )
+    for key in ("capex", "opex", "production", "layout"):
+        np.testing.assert_allclose(batch[key], [outputs[key] for outputs in scalar])
@@ -0,0 +1,52 @@
+# Install packages
+import copy
+import pickle
+
+import pytest
+
+from archetypes.offshore_wind.offshore_wind_metrics import REQUIRED_PROPERTIES
+from benchmarks.suite import compare
+from benchmarks.synthetic_job_data import make_synthetic_concept, make_synthetic_job
+from engine_interface import get_metrics
+from src.data_io.job_data import JobData
+from src.utilities import get_choices
+
+
+def test_synthetic_jobs_get_unique_ids():
+    jobs = [make_synthetic_job(seed=0), make_synthetic_job(seed=1), make_synthetic_job(blocks=8, seed=0)]
+    assert len({job["engine_job_id"] for job in jobs}) == len(jobs)
+    assert make_synthetic_job(seed=1)["engine_job_id"] == jobs[1]["engine_job_id"]
+    assert make_synthetic_job(seed=0, engine_job_id=7)["engine_job_id"] == 7
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_synthetic_concepts_can_be_evaluated(seed, tmp_path):
+    job_data = JobData(**make_synthetic_job(seed=seed))
+    concept = make_synthetic_concept(job_data, seed=seed)
+    for option in concept.values():
+        for name in REQUIRED_PROPERTIES.get(option.block_uuid, ()):
+            assert option.properties[name].value is not None
+
+    concept_file = tmp_path / "concept.pickle"
+    concept_file.write_bytes(pickle.dumps(concept))
+    metrics = get_metrics(choices=get_choices(concept_file), job_data=job_data)
+    assert metrics["capex"] > 0
+
+
+def test_concept_without_a_complete_option_fails(job_data):
+    broken = copy.deepcopy(job_data)
+    block = next(iter(broken.blocks.values()))
+    for choice in block.choices.values():
+        for option in choice.options.values():
+            option.properties["weightperkm"].value = None
+    with pytest.raises(ValueError, match="no option"):
+        make_synthetic_concept(broken)
+
+
+def test_missing_benchmark_cases_are_regressions():
+    timing = {"median_s": 1.0}
+    baseline = {"sizes": {"small": {"cases": {"get_metrics": timing, "get_metrics_batch": timing}}}}
+    report = {"sizes": {"small": {"cases": {"get_metrics_batch": {"median_s": 1.1}}}}}
+    assert compare(report, baseline, tolerance=0.25) == [{"size": "small", "case": "get_metrics", "missing": True}]
+    report["sizes"]["small"]["cases"]["get_metrics"] = {"median_s": 2.0}
+    assert [regression["case"] for regression in compare(report, baseline, tolerance=0.25)] == ["get_metrics"]